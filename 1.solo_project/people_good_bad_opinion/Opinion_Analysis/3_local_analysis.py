@@ -1,50 +1,31 @@
 import logging
+import argparse
 from database.supabase_client import SupabaseManager
-from analyzer.sentiment_analyzer import SentimentAnalyzer
-from tqdm import tqdm
-import time
+from pipeline.targets import TARGETS, get_target
+from pipeline.stages import build_dedup_index, run_local_analysis
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def run_local_analysis():
-    db = SupabaseManager()
-    sentiment = SentimentAnalyzer()
-    
-    logger.info("=== [Stage 3] 로컬 감성 분석(BERT) 시작 ===")
-    
-    while True:
-        try:
-            # 로컬 분석(sentiment_label)이 완료되지 않은 데이터 가져오기
-            response = db.client.table("im_sung_gen_youtube_comments")\
-                .select("comment_id, content, video_id")\
-                .is_("sentiment_label", "null")\
-                .limit(100)\
-                .execute()
-            
-            rows = response.data
-            if not rows:
-                logger.info("✅ 모든 데이터의 로컬 분석이 완료되었습니다.")
-                break
+def main(default_target="im_sung_gen"):
+    parser = argparse.ArgumentParser(description="로컬 감성 분석(BERT)")
+    parser.add_argument("--target", type=str, choices=list(TARGETS), default=default_target, help="분석 대상 (pipeline/targets.py)")
+    parser.add_argument("--dedup", action="store_true", help="유사 중복 댓글은 대표 한 건만 분석하고 결과 복사 (pipeline/dedup.py)")
+    parser.add_argument("--stats", action="store_true", help="라벨링한 댓글을 증분 통계 저장소에 반영 (analyzer/stat_store.py)")
+    args = parser.parse_args()
 
-            updated_data = []
-            for row in tqdm(rows, desc="BERT Analyzing"):
-                label, score = sentiment.analyze(row["content"])
-                updated_data.append({
-                    "comment_id": row["comment_id"],
-                    "video_id": row["video_id"],
-                    "content": row["content"], # 데이터 무결성을 위해 content 포함
-                    "sentiment_label": label,
-                    "sentiment_score": score
-                })
+    target = get_target(args.target)
+    db = SupabaseManager()
+    dedup = build_dedup_index(db) if args.dedup else None
 
-            if updated_data:
-                db.upsert_comments(updated_data)
-                logger.info(f"Successfully analyzed {len(updated_data)} comments.")
-                
-        except Exception as e:
-            logger.error(f"Error during local analysis: {e}")
-            time.sleep(5)
+    stats_store = None
+    if args.stats:
+        from analyzer.stat_store import IncrementalStatStore, default_store_path
+        stats_store = IncrementalStatStore.load(default_store_path(target["table"]))
+        if not stats_store.contributions:
+            # 처음 한 번은 이미 분석된 댓글로 저장소 구축
+            stats_store.sync(db, target["table"])
+    run_local_analysis(target, db, dedup=dedup, stats_store=stats_store)
 
 if __name__ == "__main__":
-    run_local_analysis()
+    main()
@@ -1,50 +1,7 @@
-import logging
-from database.supabase_client import SupabaseManager
-from analyzer.sentiment_analyzer import SentimentAnalyzer
-from tqdm import tqdm
-import time
+import importlib
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
-
-def run_local_analysis():
-    db = SupabaseManager()
-    sentiment = SentimentAnalyzer()
-    
-    logger.info("=== [백종원 Stage 3] 로컬 감성 분석(BERT) 시작 ===")
-    
-    while True:
-        try:
-            # 로컬 분석(sentiment_label)이 완료되지 않은 데이터 가져오기
-            response = db.client.table("baek_jongwon_youtube_comments")\
-                .select("comment_id, content, video_id")\
-                .is_("sentiment_label", "null")\
-                .limit(100)\
-                .execute()
-            
-            rows = response.data
-            if not rows:
-                logger.info("✅ 모든 백종원 데이터의 로컬 분석이 완료되었습니다.")
-                break
-
-            updated_data = []
-            for row in tqdm(rows, desc="BERT Analyzing"):
-                label, score = sentiment.analyze(row["content"])
-                updated_data.append({
-                    "comment_id": row["comment_id"],
-                    "video_id": row["video_id"],
-                    "content": row["content"], # 필수 컬럼 추가
-                    "sentiment_label": label,
-                    "sentiment_score": score
-                })
-
-            if updated_data:
-                db.upsert_baek_jongwon_comments(updated_data)
-                logger.info(f"Successfully analyzed {len(updated_data)} comments.")
-                
-        except Exception as e:
-            logger.error(f"Error during local analysis: {e}")
-            time.sleep(5)
+# 백종원 로컬 감성 분석(BERT) (3_local_analysis.py 의 baek_jongwon 대상 실행과 동일)
+stage = importlib.import_module("3_local_analysis")
 
 if __name__ == "__main__":
-    run_local_analysis()
+    stage.main(default_target="baek_jongwon")
@@ -8,9 +8,15 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 class DeepSeekAnalyzer:
-    def __init__(self):
+    def __init__(self, client=None):
+        """
+        Args:
+            client: 이미 만들어 둔 OpenAI 클라이언트 (여러 분석기가 연결 풀을 공유할 때 전달)
+        """
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        if not self.api_key or self.api_key == "your_api_key_here":
+        if client is not None:
+            self.client = client
+        elif not self.api_key or self.api_key == "your_api_key_here":
             logger.error("DeepSeek API Key is missing. Please set it in .env file.")
             self.client = None
         else:
@@ -10,9 +10,15 @@ logger = logging.getLogger(__name__)
 class DeepSeekBaekJongwonAnalyzer:
     """백종원 댓글 전용 DeepSeek 감성 분석기 - 임성근 분석과 동일한 6가지 카테고리 사용"""
     
-    def __init__(self):
+    def __init__(self, client=None):
+        """
+        Args:
+            client: 이미 만들어 둔 OpenAI 클라이언트 (여러 분석기가 연결 풀을 공유할 때 전달)
+        """
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        if not self.api_key or self.api_key == "your_api_key_here":
+        if client is not None:
+            self.client = client
+        elif not self.api_key or self.api_key == "your_api_key_here":
             logger.error("DeepSeek API Key is missing. Please set it in .env file.")
             self.client = None
         else:
@@ -0,0 +1,203 @@
+"""
+로컬 추론 워커 (inference_worker.py)
+====================================
+Kiwi / BERT(감성) / T5(오타 교정) 모델을 한 번 로드해 두고 localhost HTTP 로 요청을 받는
+상주 프로세스입니다. 단계 스크립트(2_normalize_text.py, 3_local_analysis.py 등)는
+INFERENCE_WORKER_URL 이 설정되어 있으면 모델을 직접 로드하지 않고 이 워커에 요청합니다.
+(analyzer/model_registry.py 참고)
+
+실행:
+    python -m analyzer.inference_worker --port 8765 [--use-corrector]
+    export INFERENCE_WORKER_URL=http://127.0.0.1:8765
+    python 3_local_analysis.py --target baek_jongwon   # 모델 로드 없이 바로 시작
+
+엔드포인트 (모두 JSON):
+    GET  /health      -> {"status": "ok", "models": [...]}
+    POST /preprocess  {"texts": [...], "use_corrector": false} -> {"results": [...]}
+    POST /keywords    {"texts": [...], "min_length": 2}        -> {"results": [[...], ...]}
+    POST /sentiment   {"texts": [...], "batch_size": 32}       -> {"results": [[label, score], ...]}
+
+원격 클라이언트(RemoteNLPEngine, RemoteSentimentAnalyzer)는 NLPEngine / SentimentAnalyzer 와
+같은 메서드를 제공하므로 기존 단계 코드는 수정 없이 그대로 사용합니다.
+"""
+
+import argparse
+import json
+import logging
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+# ──────────────────────────────────────────────
+# 클라이언트
+# ──────────────────────────────────────────────
+
+def _post(url, path, payload, timeout):
+    request = urllib.request.Request(
+        url.rstrip("/") + path,
+        data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))["results"]
+
+
+def is_worker_alive(url, timeout=1.0):
+    """워커 /health 응답 여부"""
+    try:
+        with urllib.request.urlopen(url.rstrip("/") + "/health", timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+class RemoteNLPEngine:
+    """NLPEngine 과 같은 인터페이스로 워커에 정규화/키워드 추출을 요청"""
+
+    def __init__(self, url, use_corrector=False, timeout=300):
+        self.url = url
+        self.use_corrector = use_corrector
+        self.timeout = timeout
+
+    def preprocess(self, text):
+        return self.preprocess_batch([text])[0] if text else ""
+
+    def preprocess_batch(self, texts):
+        if not texts:
+            return []
+        return _post(self.url, "/preprocess", {"texts": texts, "use_corrector": self.use_corrector}, self.timeout)
+
+    def extract_keywords(self, text, min_length=2):
+        return self.extract_keywords_batch([text], min_length)[0] if text else []
+
+    def extract_keywords_batch(self, texts, min_length=2):
+        if not texts:
+            return []
+        return _post(self.url, "/keywords", {"texts": texts, "min_length": min_length}, self.timeout)
+
+
+class RemoteSentimentAnalyzer:
+    """SentimentAnalyzer 와 같은 인터페이스로 워커에 감성 분석을 요청"""
+
+    def __init__(self, url, timeout=300):
+        self.url = url
+        self.timeout = timeout
+        self.backend = "remote"
+
+    def analyze(self, text):
+        return self.analyze_batch([text])[0]
+
+    def analyze_batch(self, texts, batch_size=32):
+        if not texts:
+            return []
+        try:
+            results = _post(self.url, "/sentiment", {"texts": texts, "batch_size": batch_size}, self.timeout)
+            return [tuple(result) for result in results]
+        except Exception as e:
+            # SentimentAnalyzer 와 동일하게 실패 시 중립 처리
+            logger.error(f"Error calling inference worker: {e}")
+            return [(2, 0.0)] * len(texts)
+
+
+# ──────────────────────────────────────────────
+# 서버
+# ──────────────────────────────────────────────
+
+class _Handler(BaseHTTPRequestHandler):
+    # 모델은 스레드 간 동시 호출을 보장하지 않으므로 모델별로 잠금
+    locks = {"nlp": threading.Lock(), "sentiment": threading.Lock()}
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            from analyzer import model_registry
+            self._send(200, {"status": "ok", "models": [str(key) for key in model_registry._models]})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        from analyzer.model_registry import get_nlp_engine, get_sentiment_analyzer
+
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            texts = payload.get("texts", [])
+            if self.path == "/preprocess":
+                nlp = get_nlp_engine(payload.get("use_corrector", False), local=True)
+                with self.locks["nlp"]:
+                    results = nlp.preprocess_batch(texts)
+            elif self.path == "/keywords":
+                nlp = get_nlp_engine(local=True)
+                min_length = payload.get("min_length", 2)
+                with self.locks["nlp"]:
+                    results = [nlp.extract_keywords(text, min_length) for text in texts]
+            elif self.path == "/sentiment":
+                sentiment = get_sentiment_analyzer(local=True)
+                with self.locks["sentiment"]:
+                    results = sentiment.analyze_batch(texts, batch_size=payload.get("batch_size", 32))
+            else:
+                self._send(404, {"error": "not found"})
+                return
+            self._send(200, {"results": results})
+        except Exception as e:
+            logger.error(f"Error handling {self.path}: {e}")
+            self._send(500, {"error": str(e)})
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, use_corrector=False, warm=True):
+    """
+    워커 실행 (종료할 때까지 블록)
+
+    Args:
+        use_corrector (bool): 오타 교정기(T5)도 미리 로드
+        warm (bool): 시작할 때 모델을 미리 로드 (첫 요청 지연 제거)
+    """
+    from analyzer.model_registry import get_nlp_engine, get_sentiment_analyzer
+
+    if warm:
+        logger.info("Warming up models...")
+        get_nlp_engine(local=True).extract_keywords("모델 준비")
+        if use_corrector:
+            get_nlp_engine(True, local=True).preprocess("모델 준비")
+        get_sentiment_analyzer(local=True).analyze("모델 준비")
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    logger.info(f"🚀 Inference worker listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Inference worker stopped.")
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델을 상주시켜 두는 로컬 추론 워커")
+    parser.add_argument("--host", type=str, default=DEFAULT_HOST, help="바인드 주소 (기본: localhost 전용)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="포트")
+    parser.add_argument("--use-corrector", action="store_true", help="오타 교정기(T5)도 미리 로드")
+    parser.add_argument("--no-warm", action="store_true", help="모델을 첫 요청 때 로드")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    serve(args.host, args.port, use_corrector=args.use_corrector, warm=not args.no_warm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+프로세스 단위 모델 레지스트리 (model_registry.py)
+================================================
+NLPEngine / SentimentAnalyzer 를 설정별로 한 번만 만들어 모든 단계가 같은 인스턴스를 쓰도록 합니다.
+(run_targets.py 처럼 여러 단계/대상을 한 프로세스에서 돌릴 때 모델을 다시 로드하지 않음)
+
+환경변수 INFERENCE_WORKER_URL (예: http://127.0.0.1:8765) 이 설정되어 있고 워커가 살아 있으면
+로컬 모델 대신 analyzer/inference_worker.py 워커에 요청하는 클라이언트를 돌려줍니다.
+이 경우 단계 스크립트는 모델을 전혀 로드하지 않으므로 짧은 증분 실행이 1초 안에 시작됩니다.
+
+사용 예시:
+    >>> nlp = get_nlp_engine()
+    >>> sentiment = get_sentiment_analyzer()
+    >>> sentiment.analyze_batch(["맛있어요", "실망입니다"])
+"""
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+_models = {}
+_lock = threading.Lock()
+
+
+def _worker_url(local):
+    """사용할 추론 워커 주소 (local=True 이거나 설정이 없으면 None)"""
+    if local:
+        return None
+    return os.getenv("INFERENCE_WORKER_URL") or None
+
+
+def _get_or_create(key, factory):
+    with _lock:
+        if key not in _models:
+            _models[key] = factory()
+        return _models[key]
+
+
+def _remote_or_none(url, client_cls, **kwargs):
+    """워커가 응답하면 원격 클라이언트, 아니면 None (로컬 로드로 대체)"""
+    from analyzer.inference_worker import is_worker_alive
+
+    if is_worker_alive(url):
+        logger.info(f"Using inference worker at {url} for {client_cls.__name__}")
+        return client_cls(url, **kwargs)
+    logger.warning(f"Inference worker at {url} is not reachable, loading models locally.")
+    return None
+
+
+def get_nlp_engine(use_corrector=False, local=False):
+    """
+    공유 NLPEngine 반환 (설정별 1개)
+
+    Args:
+        use_corrector (bool): T5 오타 교정기 사용 여부
+        local (bool): True 면 INFERENCE_WORKER_URL 을 무시하고 로컬 모델 사용 (워커 자신이 사용)
+    """
+    url = _worker_url(local)
+    if url:
+        from analyzer.inference_worker import RemoteNLPEngine
+        remote = _get_or_create(("remote_nlp", url, use_corrector),
+                                lambda: _remote_or_none(url, RemoteNLPEngine, use_corrector=use_corrector))
+        if remote is not None:
+            return remote
+
+    from analyzer.nlp_engine import NLPEngine
+    return _get_or_create(("nlp", use_corrector), lambda: NLPEngine(use_corrector=use_corrector))
+
+
+def get_sentiment_analyzer(model_name=None, backend=None, local=False):
+    """
+    공유 SentimentAnalyzer 반환 (모델/백엔드 조합별 1개)
+
+    Args:
+        model_name (str): 감성 모델 이름 (None 이면 SentimentAnalyzer 기본값)
+        backend (str): "torch" / "onnx" (None 이면 환경변수 SENTIMENT_BACKEND)
+        local (bool): True 면 INFERENCE_WORKER_URL 을 무시하고 로컬 모델 사용
+    """
+    url = _worker_url(local)
+    if url:
+        from analyzer.inference_worker import RemoteSentimentAnalyzer
+        remote = _get_or_create(("remote_sentiment", url),
+                                lambda: _remote_or_none(url, RemoteSentimentAnalyzer))
+        if remote is not None:
+            return remote
+
+    from analyzer.sentiment_analyzer import SentimentAnalyzer
+    backend = (backend or os.getenv("SENTIMENT_BACKEND", "torch")).lower()
+    kwargs = {"backend": backend}
+    if model_name:
+        kwargs["model_name"] = model_name
+    return _get_or_create(("sentiment", model_name, backend), lambda: SentimentAnalyzer(**kwargs))
+
+
+def clear():
+    """레지스트리 비우기 (테스트 / 메모리 해제용)"""
+    with _lock:
+        _models.clear()
@@ -17,12 +17,16 @@ NLP 엔진 모듈 (nlp_engine.py)
 의존성:
     - kiwipiepy : 한국어 형태소 분석기 (세종 태그셋 기반)
     - corrector : T5 기반 오타 교정 모듈 (analyzer/corrector.py)
+
+모델 로딩:
+    Kiwi 와 오타 교정기(T5)는 생성 시점이 아니라 처음 사용할 때 로드합니다.
+    (교정기는 transformers import 부터 수십 초가 걸리므로 쓰지 않는 실행에서는 비용 없음)
+    프로세스 안에서 하나만 공유하려면 analyzer/model_registry.py 의 get_nlp_engine() 사용.
 """
 
 from kiwipiepy import Kiwi
 import re
 import logging
-from .corrector import TyposCorrector
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +43,8 @@ class NLPEngine:
     Attributes:
         KEYWORD_POS_TAGS (set): 키워드로 추출할 품사 태그 집합
         USER_DICT (list): Kiwi 사용자 사전에 등록할 (단어, 품사태그) 튜플 리스트
-        tokenizer (Kiwi): Kiwi 형태소 분석기 인스턴스
-        corrector (TyposCorrector | None): T5 기반 오타 교정기 (비활성화 가능)
+        tokenizer (Kiwi): Kiwi 형태소 분석기 인스턴스 (첫 사용 시 로드)
+        corrector (TyposCorrector | None): T5 기반 오타 교정기 (비활성화 가능, 첫 사용 시 로드)
         stopwords (set): 키워드 추출 시 제외할 불용어 집합
     """
 
@@ -79,19 +83,11 @@ class NLPEngine:
                                   False이면 교정 없이 특수문자 제거만 수행.
                                   (교정기 비활성화 시 3~5배 속도 향상)
         """
-        # ① Kiwi 형태소 분석기 초기화
-        self.tokenizer = Kiwi()
-
-        # ② 사용자 사전 등록 — 복합어/고유명사가 분리되지 않도록 예외 처리
-        #    add_user_word(word, tag)는 Kiwi 내부 사전에 단어를 추가하여
-        #    형태소 분석 시 해당 단어를 하나의 토큰으로 인식하게 함
-        for word, tag in self.USER_DICT:
-            self.tokenizer.add_user_word(word, tag)
-        logger.info(f"Kiwi 사용자 사전 등록 완료: {[w for w, _ in self.USER_DICT]}")
-
-        # ③ 오타 교정기 초기화 (선택적)
-        self.corrector = TyposCorrector() if use_corrector else None
-        logger.info(f"NLPEngine initialized with Kiwi (use_corrector={use_corrector}).")
+        # ①~③ Kiwi 형태소 분석기 / 오타 교정기는 처음 사용할 때 로드 (tokenizer, corrector 속성)
+        self.use_corrector = use_corrector
+        self._tokenizer = None
+        self._corrector = None
+        logger.info(f"NLPEngine initialized (use_corrector={use_corrector}, models load on first use).")
 
         # ④ 불용어 사전 정의
         # - 조사/어미/부사 등 기능어는 Kiwi POS 필터링(KEYWORD_POS_TAGS)으로 자동 제거됨
@@ -124,6 +120,33 @@ class NLPEngine:
             '사람', '말', '생각', '정도', '부분', '경우', '느낌',
         ])
 
+    # ──────────────────────────────────────────────
+    # 모델 지연 로딩
+    # ──────────────────────────────────────────────
+
+    @property
+    def tokenizer(self):
+        """Kiwi 형태소 분석기 (첫 접근 시 생성 + 사용자 사전 등록)"""
+        if self._tokenizer is None:
+            tokenizer = Kiwi()
+
+            # 사용자 사전 등록 — 복합어/고유명사가 분리되지 않도록 예외 처리
+            #    add_user_word(word, tag)는 Kiwi 내부 사전에 단어를 추가하여
+            #    형태소 분석 시 해당 단어를 하나의 토큰으로 인식하게 함
+            for word, tag in self.USER_DICT:
+                tokenizer.add_user_word(word, tag)
+            logger.info(f"Kiwi 사용자 사전 등록 완료: {[w for w, _ in self.USER_DICT]}")
+            self._tokenizer = tokenizer
+        return self._tokenizer
+
+    @property
+    def corrector(self):
+        """T5 오타 교정기 (use_corrector=False 이면 None, 첫 접근 시 로드)"""
+        if self.use_corrector and self._corrector is None:
+            from .corrector import TyposCorrector
+            self._corrector = TyposCorrector()
+        return self._corrector
+
     # ──────────────────────────────────────────────
     # 텍스트 전처리
     # ──────────────────────────────────────────────
@@ -229,6 +252,19 @@ class NLPEngine:
             return []
 
 
+    def extract_keywords_batch(self, texts, min_length=2):
+        """
+        여러 텍스트의 키워드를 한 번에 추출 (extract_keywords() 를 텍스트마다 적용).
+
+        원격 추론 워커(analyzer/inference_worker.py)를 쓸 때 요청 한 번으로
+        배치 전체를 처리하기 위해 같은 이름의 메서드를 제공함.
+
+        Returns:
+            list[list[str]]: 입력 순서대로의 키워드 리스트
+        """
+        return [self.extract_keywords(text, min_length) for text in texts]
+
+
 # ──────────────────────────────────────────────────
 # 테스트 실행 (직접 실행 시)
 # ──────────────────────────────────────────────────
@@ -0,0 +1,103 @@
+"""
+ONNX Runtime 감성 분석 백엔드 (onnx_backend.py)
+===============================================
+KoELECTRA 감성 모델을 ONNX 로 내보내고 동적 int8 양자화를 적용해 CPU 추론 속도와
+메모리 사용량을 줄입니다. SentimentAnalyzer(backend="onnx") 또는 환경변수
+SENTIMENT_BACKEND=onnx 로 선택합니다.
+
+- 첫 실행 때 한 번만 변환하고 결과는 cache_dir 에 저장 (이후에는 바로 로드)
+- transformers pipeline 과 같은 인터페이스를 반환하므로 SentimentAnalyzer 코드는 그대로 사용
+
+의존성 (선택 설치):
+    pip install "optimum[onnxruntime]"
+"""
+
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# 변환된 모델 저장 위치 (환경변수 SENTIMENT_ONNX_DIR 로 변경 가능)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "models", "onnx")
+
+
+def model_dir(model_name, cache_dir=None, quantize=True):
+    """모델 이름 -> 변환 결과 저장 폴더 (예: models/onnx/Jinuuuu__KoELECTRA_fine_tunning_emotion-int8)"""
+    cache_dir = cache_dir or os.getenv("SENTIMENT_ONNX_DIR", DEFAULT_CACHE_DIR)
+    safe_name = re.sub(r"[^0-9A-Za-z_.-]", "__", model_name)
+    return os.path.join(cache_dir, f"{safe_name}-{'int8' if quantize else 'fp32'}")
+
+
+def _quantization_config():
+    """CPU 명령어 지원 여부에 맞는 동적 int8 양자화 설정"""
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    flags = ""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            flags = f.read()
+    except OSError:
+        pass
+    if "avx512_vnni" in flags:
+        return AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    if "avx512" in flags:
+        return AutoQuantizationConfig.avx512(is_static=False, per_channel=False)
+    if "avx2" in flags or not flags:
+        return AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+    # ARM (Apple Silicon / Graviton)
+    return AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+
+
+def export_model(model_name, cache_dir=None, quantize=True):
+    """
+    PyTorch 모델을 ONNX 로 변환 (quantize=True 면 동적 int8 양자화까지)
+
+    Returns:
+        str: 변환된 모델 폴더
+    """
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from transformers import AutoTokenizer
+
+    output_dir = model_dir(model_name, cache_dir, quantize)
+    if os.path.exists(os.path.join(output_dir, "config.json")):
+        return output_dir
+
+    logger.info(f"Exporting {model_name} to ONNX (quantize={quantize}) -> {output_dir}")
+    fp32_dir = model_dir(model_name, cache_dir, quantize=False)
+    if not os.path.exists(os.path.join(fp32_dir, "config.json")):
+        model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        model.save_pretrained(fp32_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(fp32_dir)
+
+    if quantize:
+        quantizer = ORTQuantizer.from_pretrained(fp32_dir)
+        quantizer.quantize(save_dir=output_dir, quantization_config=_quantization_config())
+        AutoTokenizer.from_pretrained(fp32_dir).save_pretrained(output_dir)
+
+    logger.info("ONNX export completed.")
+    return output_dir
+
+
+def load_onnx_pipeline(model_name, cache_dir=None, quantize=True, num_threads=None):
+    """
+    ONNX Runtime 기반 text-classification pipeline 생성 (필요하면 먼저 변환)
+
+    Args:
+        num_threads (int): ONNX Runtime intra-op 스레드 수 (None 이면 기본값)
+    """
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    from transformers import AutoTokenizer, pipeline
+
+    path = export_model(model_name, cache_dir, quantize)
+    session_options = onnxruntime.SessionOptions()
+    if num_threads:
+        session_options.intra_op_num_threads = num_threads
+
+    file_name = "model_quantized.onnx" if quantize else "model.onnx"
+    model = ORTModelForSequenceClassification.from_pretrained(
+        path, file_name=file_name, session_options=session_options, provider="CPUExecutionProvider"
+    )
+    tokenizer = AutoTokenizer.from_pretrained(path)
+    return pipeline("text-classification", model=model, tokenizer=tokenizer)
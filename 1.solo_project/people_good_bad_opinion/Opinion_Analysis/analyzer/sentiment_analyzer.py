@@ -1,32 +1,61 @@
 import logging
-from transformers import pipeline
+import os
 
 logger = logging.getLogger(__name__)
 
 class SentimentAnalyzer:
-    def __init__(self, model_name="Jinuuuu/KoELECTRA_fine_tunning_emotion"):
+    def __init__(self, model_name="Jinuuuu/KoELECTRA_fine_tunning_emotion", backend=None):
         """
         감성 분석 모델 초기화
         기본 모델: Jinuuuu/KoELECTRA_fine_tunning_emotion (6~7개 감정 분류 가능)
+        모델은 처음 분석할 때 로드합니다 (classifier 속성).
+
+        Args:
+            backend (str): "torch" (기본, PyTorch fp32) 또는 "onnx" (ONNX Runtime int8 양자화)
+                None 이면 환경변수 SENTIMENT_BACKEND 사용
         """
-        try:
-            logger.info(f"Loading emotion model: {model_name}")
-            self.classifier = pipeline("sentiment-analysis", model=model_name)
-            logger.info("Emotion model loaded successfully.")
-            
-            # 모델의 라벨을 표준 라벨로 맵핑하는 사전 (정수형)
-            self.label_map = {
-                'happy': 0,        # support
-                'surprise': 0,     # support
-                'angry': 1,        # anger
-                'anxious': 2,      # neutral
-                'embarrassed': 2,  # neutral
-                'sad': 3,          # disappointment
-                'heartache': 3     # disappointment
-            }
-        except Exception as e:
-            logger.error(f"Error loading emotion model: {e}")
-            self.classifier = None
+        self.model_name = model_name
+        self.backend = (backend or os.getenv("SENTIMENT_BACKEND", "torch")).lower()
+        self._classifier = None
+        self._load_attempted = False
+
+        # 모델의 라벨을 표준 라벨로 맵핑하는 사전 (정수형)
+        self.label_map = {
+            'happy': 0,        # support
+            'surprise': 0,     # support
+            'angry': 1,        # anger
+            'anxious': 2,      # neutral
+            'embarrassed': 2,  # neutral
+            'sad': 3,          # disappointment
+            'heartache': 3     # disappointment
+        }
+
+    @property
+    def classifier(self):
+        """분류 pipeline (첫 접근 시 로드, 로드 실패 시 None 으로 두고 다시 시도하지 않음)"""
+        if not self._load_attempted:
+            self._load_attempted = True
+            try:
+                logger.info(f"Loading emotion model: {self.model_name} (backend={self.backend})")
+                self._classifier = self._load_classifier(self.model_name)
+                logger.info("Emotion model loaded successfully.")
+            except Exception as e:
+                logger.error(f"Error loading emotion model: {e}")
+        return self._classifier
+
+    def _load_classifier(self, model_name):
+        """설정된 백엔드로 분류 pipeline 생성 (ONNX 실패 시 PyTorch 로 대체)"""
+        if self.backend == "onnx":
+            try:
+                from analyzer.onnx_backend import load_onnx_pipeline
+                return load_onnx_pipeline(model_name)
+            except Exception as e:
+                # optimum / onnxruntime 미설치 또는 변환 실패
+                logger.warning(f"ONNX backend unavailable, falling back to torch: {e}")
+                self.backend = "torch"
+        # transformers import 자체가 수 초 걸리므로 실제로 모델이 필요할 때만 import
+        from transformers import pipeline
+        return pipeline("sentiment-analysis", model=model_name)
 
     def analyze(self, text):
         """
@@ -49,6 +78,31 @@ class SentimentAnalyzer:
             logger.error(f"Error during emotion analysis: {e}")
             return 2, 0.0 # 에러 시 중립 처리
 
+    def analyze_batch(self, texts, batch_size=32):
+        """
+        여러 텍스트를 한 번에 감성 분석 (모델에 batch_size 개씩 묶어서 전달)
+        :return: [(label_int, score), ...] (입력 순서 유지)
+        """
+        results = [(2, 0.0)] * len(texts)
+        if not self.classifier:
+            return results
+
+        # 빈 텍스트는 모델에 넣지 않고 중립 처리
+        indices = [i for i, text in enumerate(texts) if text]
+        if not indices:
+            return results
+
+        try:
+            outputs = self.classifier([texts[i][:500] for i in indices], batch_size=batch_size)
+            for i, result in zip(indices, outputs):
+                results[i] = (self.label_map.get(result['label'], 2), result['score'])
+        except Exception as e:
+            # 배치 처리 실패 시 한 건씩 다시 시도
+            logger.error(f"Error during batch emotion analysis: {e}")
+            for i in indices:
+                results[i] = self.analyze(texts[i])
+        return results
+
 if __name__ == "__main__":
     # 간단 테스트
     logging.basicConfig(level=logging.INFO)
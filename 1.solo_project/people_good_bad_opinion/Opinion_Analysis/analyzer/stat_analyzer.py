@@ -5,7 +5,24 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 6종 감정 라벨(정수)을 통계 수치로 변환
+# 0:support(+1), 1:anger(-1), 2:neutral(0), 3:disappointment(-0.5), 4:sarcasm(-0.8), 5:inquiry(0)
+SENTIMENT_MAP = {
+    0: 1.0,   # support
+    1: -1.0,  # anger
+    2: 0.0,   # neutral
+    3: -0.5,  # disappointment
+    4: -0.8,  # sarcasm
+    5: 0.0    # inquiry
+}
+
 class StatAnalyzer:
+    """
+    전체 댓글 DataFrame 으로 통계를 계산합니다.
+    댓글이 계속 쌓이는 경우에는 같은 질의를 증분으로 처리하는 analyzer/stat_store.py 의
+    IncrementalStatStore 를 사용하세요.
+    """
+
     def __init__(self, df):
         """
         :param df: 분석할 데이터프레임 (Supabase에서 읽어온 데이터)
@@ -13,18 +30,7 @@ class StatAnalyzer:
         self.df = df
         if not self.df.empty:
             self.df['published_at'] = pd.to_datetime(self.df['published_at'])
-            
-            # 6종 감정 라벨(정수)을 통계 수치로 변환
-            # 0:support(+1), 1:anger(-1), 2:neutral(0), 3:disappointment(-0.5), 4:sarcasm(-0.8), 5:inquiry(0)
-            sentiment_map = {
-                0: 1.0,   # support
-                1: -1.0,  # anger
-                2: 0.0,   # neutral
-                3: -0.5,  # disappointment
-                4: -0.8,  # sarcasm
-                5: 0.0    # inquiry
-            }
-            self.df['sentiment_val'] = self.df['sentiment_label'].map(sentiment_map).fillna(0)
+            self.df['sentiment_val'] = self.df['sentiment_label'].map(SENTIMENT_MAP).fillna(0)
 
     def get_correlation(self):
         """좋아요 수와 감성 점수의 상관관계 분석"""
@@ -0,0 +1,283 @@
+"""
+증분 통계 저장소 (stat_store.py)
+================================
+StatAnalyzer 는 매번 전체 댓글 DataFrame 을 받아 pearsonr / 일별 resample / 표준편차를 다시 계산합니다.
+이 모듈은 (작성일, 영상) 단위로 충분통계량만 유지하면서 새로 라벨링된 댓글이 들어올 때마다 갱신하고,
+StatAnalyzer 와 같은 질의(상관관계, 일별 감성, 극단화 지수)를 댓글을 다시 읽지 않고 O(일 수) 로 답합니다.
+
+버킷별 통계량 (x = likes, y = sentiment_score, v = 감성 수치):
+    n, mean_x, mean_y, M2_x, M2_y, C_xy (공분산 누적), sum_v
+    - 평균 / 제곱편차 / 공동모멘트는 Welford 방식으로 갱신하고 Chan 공식으로 합쳐서
+      좋아요 수가 커도 sum(x^2) 방식보다 수치적으로 안정적
+    - 같은 댓글이 다시 분석되면(upsert) 이전 값을 빼고 새 값을 더함 (댓글별 기여값 보관)
+
+상태는 JSON 파일로 저장해 다음 실행에서 이어서 사용합니다.
+
+사용 예시:
+    >>> store = IncrementalStatStore.load("stats/baek_jongwon_youtube_comments.json")
+    >>> store.update(labelled_rows)
+    >>> store.get_correlation()
+    >>> store.time_series_resilience()
+    >>> store.save()
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+
+import pandas as pd
+from scipy import stats
+
+from analyzer.stat_analyzer import SENTIMENT_MAP
+
+logger = logging.getLogger(__name__)
+
+# 통계 저장 폴더 (환경변수 STATS_STORE_DIR 로 변경 가능)
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "stats")
+
+# 버킷 통계량 인덱스
+N, MX, MY, M2X, M2Y, CXY, SV = range(7)
+
+
+def default_store_path(table_name):
+    return os.path.join(os.getenv("STATS_STORE_DIR", DEFAULT_STORE_DIR), f"{table_name}.json")
+
+
+def _empty():
+    return [0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+
+def _add(bucket, x, y, v):
+    n = bucket[N] + 1
+    dx = x - bucket[MX]
+    dy = y - bucket[MY]
+    bucket[MX] += dx / n
+    bucket[MY] += dy / n
+    bucket[M2X] += dx * (x - bucket[MX])
+    bucket[M2Y] += dy * (y - bucket[MY])
+    bucket[CXY] += dx * (y - bucket[MY])
+    bucket[SV] += v
+    bucket[N] = n
+
+
+def _remove(bucket, x, y, v):
+    n = bucket[N] - 1
+    if n <= 0:
+        bucket[:] = _empty()
+        return
+    mx_old = (bucket[N] * bucket[MX] - x) / n
+    my_old = (bucket[N] * bucket[MY] - y) / n
+    bucket[M2X] -= (x - mx_old) * (x - bucket[MX])
+    bucket[M2Y] -= (y - my_old) * (y - bucket[MY])
+    bucket[CXY] -= (x - mx_old) * (y - bucket[MY])
+    bucket[MX] = mx_old
+    bucket[MY] = my_old
+    bucket[SV] -= v
+    bucket[N] = n
+
+
+def _merge(a, b):
+    """두 버킷 통계량 합치기 (Chan et al. 병렬 분산 공식)"""
+    if not a[N]:
+        return list(b)
+    if not b[N]:
+        return list(a)
+    n = a[N] + b[N]
+    dx = b[MX] - a[MX]
+    dy = b[MY] - a[MY]
+    factor = a[N] * b[N] / n
+    return [
+        n,
+        a[MX] + dx * b[N] / n,
+        a[MY] + dy * b[N] / n,
+        a[M2X] + b[M2X] + dx * dx * factor,
+        a[M2Y] + b[M2Y] + dy * dy * factor,
+        a[CXY] + b[CXY] + dx * dy * factor,
+        a[SV] + b[SV],
+    ]
+
+
+class IncrementalStatStore:
+    """
+    (작성일, 영상) 단위 충분통계량 저장소. StatAnalyzer 와 같은 이름의 질의 메서드를 제공합니다.
+
+    Attributes:
+        path (str): 상태 JSON 파일 경로 (None 이면 저장하지 않음)
+        buckets (dict): "YYYY-MM-DD|video_id" -> 통계량 리스트
+        contributions (dict): comment_id -> [버킷 키, likes, score, 감성 수치]
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.buckets = {}
+        self.contributions = {}
+
+    # ──────────────────────────────────────────────
+    # 저장 / 불러오기
+    # ──────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, path):
+        """저장된 상태 불러오기 (파일이 없으면 빈 저장소)"""
+        store = cls(path)
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            store.buckets = state.get("buckets", {})
+            store.contributions = state.get("contributions", {})
+            logger.info(f"Loaded stat store {path}: {len(store.contributions)} comments, {len(store.buckets)} buckets")
+        return store
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"buckets": self.buckets, "contributions": self.contributions}, f)
+        os.replace(tmp_path, self.path)
+
+    # ──────────────────────────────────────────────
+    # 갱신
+    # ──────────────────────────────────────────────
+
+    def update(self, rows):
+        """
+        라벨링된 댓글 반영 (이미 반영된 댓글이면 이전 값을 빼고 새 값으로 교체)
+
+        Args:
+            rows (list[dict]): comment_id, video_id, published_at, likes, sentiment_label, sentiment_score 를 가진 행
+
+        Returns:
+            int: 반영한 행 수
+        """
+        applied = 0
+        for row in rows:
+            if row.get("sentiment_label") is None or row.get("sentiment_score") is None or not row.get("published_at"):
+                continue
+            key = f"{str(row['published_at'])[:10]}|{row.get('video_id')}"
+            x = float(row.get("likes") or 0)
+            y = float(row["sentiment_score"])
+            v = SENTIMENT_MAP.get(row["sentiment_label"], 0.0)
+
+            previous = self.contributions.get(row["comment_id"])
+            if previous is not None:
+                old_key, old_x, old_y, old_v = previous
+                if old_key in self.buckets:
+                    _remove(self.buckets[old_key], old_x, old_y, old_v)
+                    if not self.buckets[old_key][N]:
+                        del self.buckets[old_key]
+
+            _add(self.buckets.setdefault(key, _empty()), x, y, v)
+            self.contributions[row["comment_id"]] = [key, x, y, v]
+            applied += 1
+        return applied
+
+    def sync(self, db, table_name, page_size=1000):
+        """
+        테이블에서 BERT 분석이 끝난 댓글 전체를 한 번 읽어 저장소를 다시 만듦 (최초 구축 / 복구용)
+        이후에는 3단계가 라벨링한 행만 update() 로 반영
+        """
+        self.buckets = {}
+        self.contributions = {}
+        offset = 0
+        while True:
+            response = db.client.table(table_name)\
+                .select("comment_id, video_id, published_at, likes, sentiment_label, sentiment_score")\
+                .not_.is_("sentiment_label", "null")\
+                .order("comment_id")\
+                .range(offset, offset + page_size - 1)\
+                .execute()
+            self.update(response.data)
+            if len(response.data) < page_size:
+                break
+            offset += page_size
+        logger.info(f"Stat store rebuilt from {table_name}: {len(self.contributions)} comments")
+        return self
+
+    # ──────────────────────────────────────────────
+    # 질의
+    # ──────────────────────────────────────────────
+
+    def _select(self, video_id=None, start=None, end=None):
+        """조건에 맞는 (작성일, 통계량) 목록"""
+        for key, bucket in self.buckets.items():
+            day, vid = key.split("|", 1)
+            if video_id is not None and vid != video_id:
+                continue
+            if (start and day < start) or (end and day > end):
+                continue
+            yield day, bucket
+
+    def _total(self, video_id=None, start=None, end=None):
+        total = _empty()
+        for _, bucket in self._select(video_id, start, end):
+            total = _merge(total, bucket)
+        return total
+
+    def get_correlation(self, video_id=None, start=None, end=None):
+        """좋아요 수와 감성 점수의 상관관계 (StatAnalyzer.get_correlation 과 같은 형식)"""
+        total = self._total(video_id, start, end)
+        n = total[N]
+        if n < 2:
+            return None
+
+        denominator = math.sqrt(total[M2X] * total[M2Y])
+        corr = total[CXY] / denominator if denominator > 0 else float("nan")
+        if n > 2 and not math.isnan(corr) and abs(corr) < 1:
+            t = corr * math.sqrt((n - 2) / (1 - corr * corr))
+            p_value = 2 * stats.t.sf(abs(t), n - 2)
+        else:
+            p_value = 0.0 if not math.isnan(corr) else float("nan")
+        return {
+            "correlation": corr,
+            "p_value": p_value,
+            "interpretation": "Significant" if p_value < 0.05 else "Not Significant"
+        }
+
+    def time_series_resilience(self, video_id=None, start=None, end=None):
+        """일별 감성 수치 평균 (StatAnalyzer.time_series_resilience 와 같이 빈 날짜는 NaN)"""
+        daily = {}
+        for day, bucket in self._select(video_id, start, end):
+            n, sv = daily.get(day, (0, 0.0))
+            daily[day] = (n + bucket[N], sv + bucket[SV])
+        if not daily:
+            return None
+
+        series = pd.Series({pd.Timestamp(day): sv / n for day, (n, sv) in daily.items()}).sort_index()
+        return series.asfreq("D").rename("sentiment_val")
+
+    def polarization_index(self, video_id=None, start=None, end=None):
+        """여론 극단화 지수 (감성 점수의 표본 표준편차)"""
+        total = self._total(video_id, start, end)
+        if total[N] < 2:
+            return 0
+        return math.sqrt(max(total[M2Y], 0.0) / (total[N] - 1))
+
+
+def main():
+    from database.supabase_client import SupabaseManager
+    from pipeline.targets import TARGETS, get_target
+
+    parser = argparse.ArgumentParser(description="증분 통계 저장소 조회 / 재구축")
+    parser.add_argument("--target", type=str, choices=list(TARGETS), default="im_sung_gen", help="분석 대상")
+    parser.add_argument("--rebuild", action="store_true", help="테이블 전체를 읽어 저장소 재구축")
+    parser.add_argument("--video-id", type=str, help="특정 영상만 조회")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    table = get_target(args.target)["table"]
+    store = IncrementalStatStore.load(default_store_path(table))
+    if args.rebuild or not store.contributions:
+        store.sync(SupabaseManager(), table)
+        store.save()
+
+    print(f"Correlation Analysis: {store.get_correlation(args.video_id)}")
+    print(f"Polarization Index: {store.polarization_index(args.video_id)}")
+    print(store.time_series_resilience(args.video_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+합성 한국어 댓글 코퍼스 (corpus.py)
+===================================
+벤치마크용으로 실제 수집 데이터와 같은 컬럼을 가진 댓글을 시드 고정으로 생성합니다.
+10만 ~ 100만 건도 메모리에 한꺼번에 올리지 않도록 제너레이터로 만듭니다.
+
+- 문장은 대상 이름 + 감정별 어구 + 꾸밈말(ㅋㅋ, 이모티콘 등) 조합
+- duplicate_ratio 비율만큼은 이전 댓글을 글자 몇 개만 바꿔 다시 내보냄 (도배/밈 댓글 흉내, dedup 측정용)
+- published_at 은 논란 기준일 전후 days 일 범위에 고르게 분포
+
+사용 예시:
+    >>> rows = list(generate_comments(get_target("im_sung_gen"), 10000))
+    >>> for batch in batched(generate_comments(target, 1_000_000), 1000): db.upsert_target_comments(...)
+"""
+
+import random
+from datetime import datetime, timedelta
+
+SUBJECTS = ["{name}", "{name}님", "{name} 셰프", "이 사람", "형님", "사장님"]
+PHRASES = {
+    "support": ["진짜 최고예요", "항상 응원합니다", "음식 너무 맛있어 보여요", "덕분에 힘이 납니다",
+                "오늘도 잘 보고 갑니다", "보고 싶어요 언제 와요", "레시피 따라 해봤는데 대박"],
+    "anger": ["정말 실망스럽고 화가 납니다", "다시는 방송에 나오지 마세요", "이건 선을 넘었죠",
+              "사과문이 말이 됩니까", "구독 취소합니다 어이없네"],
+    "neutral": ["영상 잘 봤습니다", "첫 댓글", "오늘 업로드 시간이 늦네요", "배경음악 제목 알려주세요",
+                "알고리즘이 데려왔어요"],
+    "disappointment": ["믿었는데 아쉽네요", "팬이었는데 마음이 떠났어요", "이런 분인 줄 몰랐습니다",
+                       "그동안 좋아했던 게 허무하네요"],
+    "sarcasm": ["역시 대단하십니다^^", "와 정말 존경스럽네요 ㅋㅋ", "이번에도 레전드 찍으셨네",
+                "참 잘하셨어요 박수 짝짝"],
+    "inquiry": ["이거 무슨 일이에요?", "기사 링크 있나요", "윗댓 무슨 소리임", "정치 얘기는 그만하세요"],
+}
+DECORATIONS = ["", "", " ㅋㅋ", " ㅋㅋㅋㅋ", " ㅠㅠ", "!!", "...", " 👍", " 😂", " ^^"]
+FILLERS = ["", "", "근데 ", "솔직히 ", "아니 ", "와 ", "진심 "]
+
+
+def _sentence(rng, name):
+    mood = rng.choice(list(PHRASES))
+    parts = [rng.choice(FILLERS) + rng.choice(SUBJECTS).format(name=name), rng.choice(PHRASES[mood])]
+    if rng.random() < 0.4:
+        parts.append(rng.choice(PHRASES[rng.choice(list(PHRASES))]))
+    return " ".join(parts) + rng.choice(DECORATIONS)
+
+
+def _mutate(rng, text):
+    """글자 한두 개만 바꾼 유사 중복"""
+    if rng.random() < 0.5:
+        return text + rng.choice(["ㅋ", "!", "ㅎㅎ", "."])
+    chars = list(text)
+    i = rng.randrange(len(chars))
+    chars[i] = rng.choice(["ㅋ", " ", "~", chars[i]])
+    return "".join(chars)
+
+
+def generate_comments(target, count, seed=42, duplicate_ratio=0.1, num_videos=50, days=60):
+    """
+    대상 설정(pipeline/targets.py)에 맞는 합성 댓글 생성
+
+    Args:
+        target (dict): 대상 설정 (name, controversy_date, extra_fields 사용)
+        count (int): 생성할 댓글 수
+        duplicate_ratio (float): 유사 중복 댓글 비율 (0~1)
+        num_videos (int): 댓글을 나눠 담을 영상 수
+        days (int): 기준일 전후로 분포시킬 일 수
+
+    Yields:
+        dict: comment_id, video_id, author, content, likes, published_at (+ extra_fields)
+    """
+    rng = random.Random(seed)
+    center = datetime.strptime(target.get("controversy_date") or "2025-03-01", "%Y-%m-%d")
+    recent = []
+
+    for i in range(count):
+        if recent and rng.random() < duplicate_ratio:
+            content = _mutate(rng, rng.choice(recent))
+        else:
+            content = _sentence(rng, target["name"])
+            if len(recent) < 1000:
+                recent.append(content)
+            else:
+                recent[rng.randrange(1000)] = content
+
+        published = center + timedelta(seconds=rng.randint(-days * 86400, days * 86400))
+        row = {
+            "comment_id": f"bench_{seed}_{i:07d}",
+            "video_id": f"bench_video_{rng.randrange(num_videos):03d}",
+            "author": f"@user{rng.randrange(count * 2):07d}",
+            "content": content,
+            # 좋아요 수는 소수 댓글에 몰리는 긴 꼬리 분포
+            "likes": int(rng.paretovariate(1.2)) - 1,
+            "published_at": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        row.update(target.get("extra_fields", {}))
+        yield row
+
+
+def batched(iterable, size):
+    """size 개씩 리스트로 묶어서 내보냄"""
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
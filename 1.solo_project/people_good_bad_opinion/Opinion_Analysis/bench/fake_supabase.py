@@ -0,0 +1,340 @@
+"""
+SQLite 기반 Supabase 대체 클라이언트 (fake_supabase.py)
+=======================================================
+파이프라인 코드가 사용하는 supabase-py 쿼리 빌더 기능만 SQLite 로 구현해서
+실제 Supabase 없이 단계 스크립트 / 대시보드 로더를 실행하고 측정할 수 있게 합니다.
+
+지원 범위:
+    table(name).select(cols).eq/neq/gt/gte/lt/lte/is_/in_/or_(...).not_.is_(...)
+              .order(col, desc=).limit(n).range(a, b).execute()
+    table(name).upsert(rows, on_conflict="a,b").execute()
+    table(name).delete().in_(...).execute()
+    rpc("refresh_keyword_index", {...}).execute()  (database/keyword_index_schema.sql 과 같은 집계)
+
+- 컬럼은 처음 쓰일 때 자동으로 추가 (스키마 파일 없이 사용)
+- list / dict 값(keywords 등)은 JSON 문자열로 저장하고 조회 시 되돌림
+- 여러 스레드(스트리밍 파이프라인)에서 호출해도 되도록 연결 하나를 잠금으로 보호
+- .is_(col, "null") 로 조회한 컬럼에는 인덱스를 만들어 미처리 행 조회가 전체 스캔이 되지 않게 함
+
+사용 예시:
+    >>> db = LocalSupabaseManager("bench.db")
+    >>> db.upsert_target_comments("im_sung_gen_youtube_comments", rows)
+    >>> db.client.table("im_sung_gen_youtube_comments").select("*").is_("keywords", "null").limit(50).execute().data
+"""
+
+import json
+import sqlite3
+import threading
+from collections import Counter
+
+from database.supabase_client import SupabaseManager
+
+
+class _Response:
+    def __init__(self, data):
+        self.data = data
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class _Query:
+    """supabase-py 쿼리 빌더와 같은 체이닝 인터페이스"""
+
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.columns = "*"
+        self.where = []
+        self.params = []
+        self.orders = []
+        self.limit_n = None
+        self.offset_n = None
+        self.mode = "select"
+        self.payload = None
+        self.on_conflict = None
+        self._negate = False
+
+    # ── 동작 ──
+    def select(self, columns="*"):
+        self.columns = columns
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self.mode = "upsert"
+        self.payload = rows if isinstance(rows, list) else [rows]
+        self.on_conflict = on_conflict
+        return self
+
+    def delete(self):
+        self.mode = "delete"
+        return self
+
+    # ── 필터 ──
+    @property
+    def not_(self):
+        self._negate = True
+        return self
+
+    def _add(self, column, clause, *params):
+        self.client.ensure_columns(self.table, [column])
+        if self._negate:
+            clause = f"NOT ({clause})"
+            self._negate = False
+        self.where.append(clause)
+        self.params.extend(params)
+        return self
+
+    def eq(self, column, value):
+        return self._add(column, f"{_quote(column)} = ?", value)
+
+    def neq(self, column, value):
+        return self._add(column, f"{_quote(column)} != ?", value)
+
+    def gt(self, column, value):
+        return self._add(column, f"{_quote(column)} > ?", value)
+
+    def gte(self, column, value):
+        return self._add(column, f"{_quote(column)} >= ?", value)
+
+    def lt(self, column, value):
+        return self._add(column, f"{_quote(column)} < ?", value)
+
+    def lte(self, column, value):
+        return self._add(column, f"{_quote(column)} <= ?", value)
+
+    def is_(self, column, value):
+        if value in (None, "null"):
+            # 미처리 행 조회(.is_(col, "null"))가 매 배치 전체 스캔이 되지 않도록 인덱스 생성
+            self.client.ensure_index(self.table, column)
+            return self._add(column, f"{_quote(column)} IS NULL")
+        return self._add(column, f"{_quote(column)} IS ?", value)
+
+    def in_(self, column, values):
+        values = list(values)
+        if not values:
+            return self._add(column, "0")
+        return self._add(column, f"{_quote(column)} IN ({', '.join('?' * len(values))})", *values)
+
+    def or_(self, expression):
+        """PostgREST or 필터 ("col.op.value,col.op.value") 중 is / eq / neq / gt / gte / lt / lte 지원"""
+        ops = {"eq": "=", "neq": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+        clauses, params = [], []
+        for part in expression.split(","):
+            column, op, value = part.strip().split(".", 2)
+            self.client.ensure_columns(self.table, [column])
+            if op == "is":
+                clauses.append(f"{_quote(column)} IS NULL" if value == "null" else f"{_quote(column)} IS ?")
+                if value != "null":
+                    params.append(value)
+            else:
+                clauses.append(f"{_quote(column)} {ops[op]} ?")
+                params.append(value)
+        self.where.append("(" + " OR ".join(clauses) + ")")
+        self.params.extend(params)
+        return self
+
+    # ── 정렬 / 페이지 ──
+    def order(self, column, desc=False):
+        self.client.ensure_columns(self.table, [column])
+        self.orders.append(f"{_quote(column)} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, n):
+        self.limit_n = n
+        return self
+
+    def range(self, start, end):
+        self.offset_n = start
+        self.limit_n = end - start + 1
+        return self
+
+    def execute(self):
+        if self.mode == "upsert":
+            return _Response(self.client.upsert(self.table, self.payload, self.on_conflict))
+        if self.mode == "delete":
+            return _Response(self.client.delete(self.table, self.where, self.params))
+        return _Response(self.client.select(self))
+
+
+class SQLiteSupabaseClient:
+    """SQLite 에 저장하는 Supabase 클라이언트 대체품"""
+
+    def __init__(self, path=":memory:"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self._columns = {}      # 테이블 -> 컬럼 집합
+        self._json_columns = {}  # 테이블 -> JSON 으로 저장한 컬럼 집합
+        self._unique = set()    # 만들어 둔 (테이블, 충돌 컬럼) 유니크 인덱스
+        self._indexed = set()   # 만들어 둔 (테이블, 컬럼) 일반 인덱스
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def rpc(self, name, params):
+        if name != "refresh_keyword_index":
+            raise ValueError(f"지원하지 않는 RPC 입니다: {name}")
+        return _RpcCall(lambda: self.refresh_keyword_index(params["p_table"], params.get("p_since")))
+
+    # ── 스키마 ──
+    def ensure_columns(self, table, columns):
+        with self.lock:
+            existing = self._columns.get(table)
+            if existing is None:
+                rows = self.conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+                existing = {row[1] for row in rows}
+                if not existing:
+                    self.conn.execute(f"CREATE TABLE {_quote(table)} (_rowid INTEGER PRIMARY KEY AUTOINCREMENT)")
+                    existing = {"_rowid"}
+                self._columns[table] = existing
+            for column in columns:
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)}")
+                    existing.add(column)
+
+    def ensure_index(self, table, column):
+        if (table, column) in self._indexed:
+            return
+        with self.lock:
+            self.ensure_columns(table, [column])
+            self.conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(f'ix_{table}_{column}')} "
+                              f"ON {_quote(table)} ({_quote(column)})")
+            self._indexed.add((table, column))
+
+    def _encode(self, table, column, value):
+        if isinstance(value, (list, dict)):
+            self._json_columns.setdefault(table, set()).add(column)
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, bool):
+            return int(value)
+        return value
+
+    def _decode_row(self, table, names, values):
+        json_columns = self._json_columns.get(table, ())
+        row = {}
+        for name, value in zip(names, values):
+            if name == "_rowid":
+                continue
+            if name in json_columns and isinstance(value, str):
+                value = json.loads(value)
+            row[name] = value
+        return row
+
+    # ── 실행 ──
+    def select(self, query):
+        table = query.table
+        self.ensure_columns(table, [])
+        if query.columns.strip() == "*":
+            columns = None
+        else:
+            columns = [c.strip() for c in query.columns.split(",") if c.strip()]
+            self.ensure_columns(table, columns)
+
+        sql = f"SELECT {'*' if columns is None else ', '.join(_quote(c) for c in columns)} FROM {_quote(table)}"
+        if query.where:
+            sql += " WHERE " + " AND ".join(query.where)
+        sql += " ORDER BY " + ", ".join(query.orders + ["_rowid"]) if query.orders else ""
+        if query.limit_n is not None:
+            sql += f" LIMIT {int(query.limit_n)}"
+            if query.offset_n:
+                sql += f" OFFSET {int(query.offset_n)}"
+
+        with self.lock:
+            cursor = self.conn.execute(sql, [self._encode(table, "", p) for p in query.params])
+            names = [d[0] for d in cursor.description]
+            return [self._decode_row(table, names, values) for values in cursor.fetchall()]
+
+    def upsert(self, table, rows, on_conflict=None):
+        if not rows:
+            return []
+        conflict = [c.strip() for c in (on_conflict or "").split(",") if c.strip()]
+        with self.lock:
+            self.ensure_columns(table, sorted({key for row in rows for key in row} | set(conflict)))
+            if conflict and (table, tuple(conflict)) not in self._unique:
+                index_name = _quote(f"uq_{table}_{'_'.join(conflict)}")
+                self.conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {_quote(table)} "
+                                  f"({', '.join(_quote(c) for c in conflict)})")
+                self._unique.add((table, tuple(conflict)))
+
+            # 같은 컬럼 조합끼리 묶어서 executemany (PostgREST 처럼 전달된 컬럼만 갱신)
+            groups = {}
+            for row in rows:
+                groups.setdefault(tuple(row), []).append(row)
+            for keys, group in groups.items():
+                cols = ", ".join(_quote(k) for k in keys)
+                sql = f"INSERT INTO {_quote(table)} ({cols}) VALUES ({', '.join('?' * len(keys))})"
+                updates = [k for k in keys if k not in conflict]
+                if conflict:
+                    sql += f" ON CONFLICT ({', '.join(_quote(c) for c in conflict)}) DO "
+                    sql += ("UPDATE SET " + ", ".join(f"{_quote(k)} = excluded.{_quote(k)}" for k in updates)) if updates else "NOTHING"
+                self.conn.executemany(sql, [[self._encode(table, k, row[k]) for k in keys] for row in group])
+            self.conn.commit()
+        return rows
+
+    def delete(self, table, where, params):
+        self.ensure_columns(table, [])
+        sql = f"DELETE FROM {_quote(table)}" + (" WHERE " + " AND ".join(where) if where else "")
+        with self.lock:
+            cursor = self.conn.execute(sql, params)
+            self.conn.commit()
+            return [{"deleted": cursor.rowcount}]
+
+    def refresh_keyword_index(self, table, since=None):
+        """database/keyword_index_schema.sql 의 refresh_keyword_index 와 같은 집계"""
+        def group(label):
+            if label in (0, 2):
+                return "긍정"
+            if label in (1, 3, 4):
+                return "부정"
+            if label == 5:
+                return "그외"
+            return "미분류"
+
+        query = self.table(table).select("comment_id, keywords, llm_sentiment, published_at").not_.is_("keywords", "null")
+        # comment_id 기준 중복 제거 (SQL 의 DISTINCT ON 처럼 published_at 이 가장 늦은 행만 사용)
+        latest = {}
+        for row in query.execute().data:
+            kept = latest.get(row["comment_id"])
+            if kept is None or str(row.get("published_at") or "") > str(kept.get("published_at") or ""):
+                latest[row["comment_id"]] = row
+
+        counts = Counter()
+        for row in latest.values():
+            if not row.get("published_at"):
+                continue
+            day = str(row["published_at"])[:10]
+            if since and day < since:
+                continue
+            for keyword in row["keywords"] or []:
+                if len(keyword) > 1:
+                    counts[(group(row.get("llm_sentiment")), day, keyword)] += 1
+
+        index_delete = self.table("keyword_frequency_index").delete().eq("table_name", table)
+        if since:
+            index_delete = index_delete.gte("day", since)
+        index_delete.execute()
+        self.upsert("keyword_frequency_index", [
+            {"table_name": table, "sentiment_group": g, "day": d, "keyword": k, "count": c}
+            for (g, d, k), c in counts.items()
+        ], "table_name,sentiment_group,day,keyword")
+        return len(counts)
+
+
+class _RpcCall:
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self):
+        return _Response(self.func())
+
+
+class LocalSupabaseManager(SupabaseManager):
+    """SupabaseManager 와 같은 메서드를 SQLite 클라이언트로 실행 (.env 불필요)"""
+
+    def __init__(self, path=":memory:"):
+        self.url = None
+        self.key = None
+        self.client = SQLiteSupabaseClient(path)
@@ -0,0 +1,154 @@
+"""
+LLM 목(mock) 서버 (mock_llm.py)
+================================
+DeepSeek(OpenAI 호환) /v1/chat/completions 를 흉내 내는 로컬 HTTP 서버입니다.
+API 키 / 비용 없이 4단계(LLM 배치 분석)의 배치 구성, 동시성, 재시도 경로를 측정할 수 있습니다.
+
+- 응답 지연: latency 초 + 0 ~ jitter 초 (실제 API 의 왕복 시간 흉내)
+- error_rate 비율만큼 500 에러 응답 (분석기 예외 처리 경로 측정)
+- 요청 댓글 수는 시스템 프롬프트의 "입력받은 N개" 에서 읽고, 없으면 사용자 프롬프트의 번호 줄 수를 셈
+- 라벨(0~5)은 댓글 텍스트 해시로 정해서 같은 입력이면 항상 같은 결과
+
+사용 예시:
+    $ python -m bench.mock_llm --port 8090 --latency 0.8 --jitter 0.4
+    >>> client = OpenAI(api_key="bench", base_url="http://127.0.0.1:8090/v1")
+    >>> labeler = LLMLabeler(client=client)
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COUNT_PATTERN = re.compile(r"입력받은 (\d+)개")
+LINE_PATTERN = re.compile(r"^\s*(\d+)\.\s*(.*)$", re.MULTILINE)
+
+
+def _label(text):
+    return int.from_bytes(hashlib.md5(text.encode("utf-8")).digest()[:2], "little") % 6
+
+
+def build_results(messages):
+    """프롬프트의 댓글 줄마다 결정적인 0~5 라벨 생성"""
+    system = next((m["content"] for m in messages if m.get("role") == "system"), "")
+    user = next((m["content"] for m in messages if m.get("role") == "user"), "")
+    lines = [text for _, text in LINE_PATTERN.findall(user)]
+    match = COUNT_PATTERN.search(system)
+    count = int(match.group(1)) if match else len(lines)
+    return [_label(lines[i] if i < len(lines) else str(i)) for i in range(count)]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr 출력하지 않음
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+
+        time.sleep(server.latency + random.random() * server.jitter)
+        with server.stats_lock:
+            server.stats["requests"] += 1
+        if random.random() < server.error_rate:
+            with server.stats_lock:
+                server.stats["errors"] += 1
+            self._send(500, {"error": {"message": "mock failure", "type": "server_error"}})
+            return
+
+        results = build_results(request.get("messages", []))
+        with server.stats_lock:
+            server.stats["comments"] += len(results)
+        self._send(200, {
+            "id": f"mock-{server.stats['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "deepseek-chat"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps({"results": results})},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(results), "total_tokens": len(results)},
+        })
+
+
+class MockLLMServer:
+    """
+    백그라운드 스레드에서 도는 목 서버
+
+    Attributes:
+        url (str): OpenAI 클라이언트의 base_url 로 넘길 주소 (http://host:port/v1)
+        stats (dict): 요청 수 / 에러 수 / 라벨링한 댓글 수
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.5, jitter=0.0, error_rate=0.0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.stats = {"requests": 0, "errors": 0, "comments": 0}
+        self.httpd.stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def stats(self):
+        return dict(self.httpd.stats)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 LLM 목 서버")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.5, help="응답 기본 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 에러 응답 비율 (0~1)")
+    args = parser.parse_args()
+
+    server = MockLLMServer(args.host, args.port, args.latency, args.jitter, args.error_rate)
+    print(f"[+] Mock LLM server listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print(f"[+] Stopped. stats={server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+파이프라인 헤드리스 벤치마크 (run.py)
+=====================================
+실제 Supabase / DeepSeek 키 없이 파이프라인 단계를 그대로 실행하고 단계별 성능을 측정합니다.
+
+- DB: bench/fake_supabase.py 의 SQLite 기반 SupabaseManager (upsert / 필터 / RPC 동일 인터페이스)
+- LLM: bench/mock_llm.py 의 OpenAI 호환 목 서버 (지연 / 에러율 조절)
+- 데이터: bench/corpus.py 의 합성 한국어 댓글 (시드 고정, 1만 ~ 100만 건)
+
+측정 단계 (--stages 로 선택, 순서대로 실행):
+    upsert     합성 댓글을 1000건씩 upsert_target_comments 로 적재
+    normalize  pipeline.stages.run_normalization (NLPEngine 키워드 추출)
+    sentiment  pipeline.stages.run_local_analysis (BERT 감성 분석)
+    llm        pipeline.stages.run_llm_analysis (LLMLabeler -> 목 서버)
+    dashboard  refresh_keyword_index + utils/keyword_index.py 로더 (대시보드 워드클라우드 경로)
+
+단계별 결과:
+    rows_per_sec        처리 행 수 / 소요 시간
+    latency_ms          배치 한 번(조회 -> 분석 -> upsert)의 p50 / p95 / p99
+    rss_mb, peak_rss_mb 단계 종료 시점 RSS / 프로세스 최대 RSS
+
+--baseline 으로 이전 결과 JSON 을 주면 처리량이 --max-regression 비율 이상 떨어진 단계가 있을 때
+종료 코드 1 을 반환합니다 (배포 전 성능 회귀 확인용).
+
+사용 예:
+    python -m bench.run --rows 10000 --stages upsert,dashboard
+    python -m bench.run --rows 100000 --llm-latency 0.8 --llm-jitter 0.4 --output bench_result.json
+    python -m bench.run --rows 100000 --baseline bench_result.json --max-regression 0.2
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+
+from bench.corpus import batched, generate_comments
+from bench.fake_supabase import LocalSupabaseManager
+from bench.mock_llm import MockLLMServer
+from utils.memory import current_rss_mb, peak_rss_mb
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("upsert", "normalize", "sentiment", "llm", "dashboard")
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return round(sorted_values[index], 2)
+
+
+class StageTimer:
+    """
+    db.upsert_target_comments 를 감싸서 배치 완료 시각을 기록
+    (단계 함수들은 배치마다 한 번씩 upsert 하므로 완료 간격 = 배치 하나의 조회 + 분석 + 저장 시간)
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._upsert = db.upsert_target_comments
+        self.marks = []
+        self.rows = 0
+        db.upsert_target_comments = self._timed_upsert
+
+    def _timed_upsert(self, table_name, data_list):
+        ok = self._upsert(table_name, data_list)
+        self.marks.append(time.perf_counter())
+        self.rows += len(data_list)
+        return ok
+
+    def measure(self, name, func):
+        """func 실행 시간과 배치 지연 분포 측정"""
+        self.marks = []
+        self.rows = 0
+        start = time.perf_counter()
+        rows = func()
+        elapsed = time.perf_counter() - start
+
+        rows = self.rows if rows is None else rows
+        latencies = sorted((b - a) * 1000 for a, b in zip([start] + self.marks, self.marks))
+        report = {
+            "rows": rows,
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+            "batches": len(self.marks),
+            "latency_ms": {"p50": percentile(latencies, 0.5), "p95": percentile(latencies, 0.95),
+                           "p99": percentile(latencies, 0.99)},
+            "rss_mb": current_rss_mb(),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        logger.info(f"⏱️ {name}: {report}")
+        return report
+
+
+def stage_upsert(db, target, rows, seed, duplicate_ratio):
+    for batch in batched(generate_comments(target, rows, seed=seed, duplicate_ratio=duplicate_ratio), 1000):
+        db.upsert_target_comments(target["table"], batch)
+
+
+def stage_dashboard(db, target, timer):
+    """대시보드 워드클라우드 경로: 인덱스 재집계 -> 그룹별 빈도 조회 -> 인덱스 없을 때의 폴백 계산"""
+    from utils.keyword_index import fetch_keyword_frequencies, frequencies_from_keywords
+
+    calls = [lambda: db.refresh_keyword_index(target["table"])]
+    for group in ("전체", "긍정", "부정", "그외"):
+        calls.append(lambda group=group: fetch_keyword_frequencies(db.client, target["table"], group))
+
+    def fallback():
+        keyword_lists, offset = [], 0
+        while True:
+            page = db.client.table(target["table"]).select("keywords, llm_sentiment").range(offset, offset + 999).execute().data
+            # '전체' 와 같은 기준: 미분류(llm_sentiment 없음) 댓글 제외
+            keyword_lists.extend(row["keywords"] for row in page if row["llm_sentiment"] is not None)
+            if len(page) < 1000:
+                break
+            offset += 1000
+        return frequencies_from_keywords(keyword_lists)
+    calls.append(fallback)
+
+    for call in calls:
+        call()
+        timer.marks.append(time.perf_counter())
+    return len(calls)
+
+
+def compare_baseline(report, baseline, max_regression):
+    """기준 결과 대비 처리량이 max_regression 이상 떨어진 단계 목록"""
+    regressions = []
+    for name, stage in report["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if not base or not base.get("rows_per_sec") or not stage.get("rows_per_sec"):
+            continue
+        drop = 1 - stage["rows_per_sec"] / base["rows_per_sec"]
+        if drop > max_regression:
+            regressions.append((name, base["rows_per_sec"], stage["rows_per_sec"], drop))
+    return regressions
+
+
+def main():
+    from pipeline.targets import TARGETS, get_target
+
+    parser = argparse.ArgumentParser(description="Supabase / LLM 없이 파이프라인 단계별 성능 측정")
+    parser.add_argument("--target", type=str, choices=list(TARGETS), default="im_sung_gen", help="대상 설정 (테이블/프롬프트)")
+    parser.add_argument("--rows", type=int, default=10000, help="합성 댓글 수")
+    parser.add_argument("--stages", type=str, default=",".join(STAGES), help=f"실행할 단계 (쉼표 구분: {','.join(STAGES)})")
+    parser.add_argument("--seed", type=int, default=42, help="코퍼스 시드")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.1, help="유사 중복 댓글 비율")
+    parser.add_argument("--dedup", action="store_true", help="2~4단계에 유사 중복 인덱스 사용 (pipeline/dedup.py)")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="목 LLM 서버 응답 지연 (초)")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="목 LLM 서버 추가 무작위 지연 최대값 (초)")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="목 LLM 서버 500 에러 비율")
+    parser.add_argument("--db", type=str, default=":memory:", help="SQLite 파일 경로 (기본: 메모리)")
+    parser.add_argument("--output", type=str, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", type=str, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 처리량 하락 비율 (넘으면 종료 코드 1)")
+    parser.add_argument("--verbose", action="store_true", help="단계 함수의 배치별 로그 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(asctime)s - %(levelname)s - %(message)s', force=True)
+    logger.setLevel(logging.INFO)
+
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"알 수 없는 단계: {', '.join(unknown)}")
+
+    target = get_target(args.target)
+    db = LocalSupabaseManager(args.db)
+    timer = StageTimer(db)
+    dedup = None
+    if args.dedup:
+        from pipeline.dedup import DedupIndex
+        dedup = DedupIndex()
+
+    report = {"target": args.target, "rows": args.rows, "seed": args.seed, "stages": {}}
+    for name in stages:
+        logger.info(f"▶ {name} 단계 측정 중...")
+        if name == "upsert":
+            report["stages"][name] = timer.measure(
+                name, lambda: stage_upsert(db, target, args.rows, args.seed, args.duplicate_ratio))
+        elif name == "normalize":
+            from pipeline.stages import run_normalization
+            report["stages"][name] = timer.measure(name, lambda: run_normalization(target, db, dedup=dedup))
+        elif name == "sentiment":
+            from analyzer.model_registry import get_sentiment_analyzer
+            from pipeline.stages import run_local_analysis
+            sentiment = get_sentiment_analyzer(local=True)
+            sentiment.classifier  # 모델 로드 시간은 처리량에서 제외
+            report["stages"][name] = timer.measure(
+                name, lambda: run_local_analysis(target, db, sentiment=sentiment, dedup=dedup))
+        elif name == "llm":
+            from openai import OpenAI
+            from pipeline.stages import run_llm_analysis
+            from pipeline.targets import LLMLabeler
+            with MockLLMServer(latency=args.llm_latency, jitter=args.llm_jitter,
+                               error_rate=args.llm_error_rate) as server:
+                labeler = LLMLabeler(client=OpenAI(api_key="bench", base_url=server.url, max_retries=0))
+                report["stages"][name] = timer.measure(
+                    name, lambda: run_llm_analysis(target, db, labeler=labeler, dedup=dedup))
+                report["stages"][name]["llm_server"] = server.stats
+        elif name == "dashboard":
+            report["stages"][name] = timer.measure(name, lambda: stage_dashboard(db, target, timer))
+            report["stages"][name]["unit"] = "calls"
+
+    if dedup:
+        report["dedup"] = dict(dedup.stats)
+
+    print(f"\n{'stage':<10} {'rows':>9} {'sec':>9} {'rows/s':>10} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'RSS(MB)':>8} {'peak':>8}")
+    for name, r in report["stages"].items():
+        lat = r["latency_ms"]
+        print(f"{name:<10} {r['rows']:>9} {r['seconds']:>9} {r['rows_per_sec'] or '-':>10} {lat['p50'] or '-':>9} "
+              f"{lat['p95'] or '-':>9} {lat['p99'] or '-':>9} {r['rss_mb'] or '-':>8} {r['peak_rss_mb'] or '-':>8}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_baseline(report, json.load(f), args.max_regression)
+        for name, before, after, drop in regressions:
+            logger.error(f"❌ {name} 처리량 하락 {before} -> {after} 건/초 ({drop:.1%} > {args.max_regression:.0%})")
+        if regressions:
+            return 1
+        logger.info("✅ 기준 대비 성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+감성 분석 백엔드 벤치마크 (benchmark_sentiment.py)
+==================================================
+PyTorch fp32 pipeline 과 ONNX Runtime int8 양자화 모델(analyzer/onnx_backend.py)을
+같은 라벨링 샘플로 비교합니다.
+
+- 정확도 동등성: 두 백엔드의 라벨 일치율, 정답 라벨 대비 정확도, 최대 점수 차이
+- 속도: 한 건씩 호출했을 때 지연시간(p50/p95), 배치 처리량(건/초)
+- 메모리: 백엔드마다 별도 프로세스에서 실행해 최대 RSS 측정
+
+정답 샘플:
+    --csv 로 content,label 컬럼이 있는 CSV 를 주거나,
+    없으면 대상 테이블에서 LLM 분석(llm_sentiment 0~3)이 끝난 댓글을 가져와 사용
+    (BERT 는 0~3 만 예측하므로 4: sarcasm, 5 는 제외)
+
+사용 예:
+    python benchmark_sentiment.py --target baek_jongwon --sample 500
+    python benchmark_sentiment.py --csv heldout.csv --backends torch onnx
+"""
+
+import argparse
+import csv
+import json
+import logging
+import multiprocessing as mp
+import statistics
+import sys
+import time
+from queue import Empty
+
+from utils.memory import peak_rss_mb
+
+# 측정 프로세스 하나를 기다리는 최대 시간 (초, 모델 다운로드 / 변환 포함)
+MEASURE_TIMEOUT = 1800
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def load_sample_from_csv(path, limit):
+    """CSV(content,label) 에서 정답 샘플 로드"""
+    samples = []
+    with open(path, "r", encoding="utf-8-sig") as f:
+        for row in csv.DictReader(f):
+            if row.get("content"):
+                label = row.get("label")
+                samples.append((row["content"], int(label) if label not in (None, "") else None))
+            if len(samples) >= limit:
+                break
+    return samples
+
+
+def load_sample_from_db(target, limit):
+    """LLM 분석이 끝난 댓글을 정답 샘플로 사용 (llm_sentiment 0~3)"""
+    from database.supabase_client import SupabaseManager
+
+    db = SupabaseManager()
+    response = db.client.table(target["table"])\
+        .select("content, llm_sentiment")\
+        .in_("llm_sentiment", [0, 1, 2, 3])\
+        .order("comment_id")\
+        .limit(limit)\
+        .execute()
+    return [(row["content"], row["llm_sentiment"]) for row in response.data if row["content"]]
+
+
+def run_backend(backend, texts, latency_runs, batch_size, queue):
+    """
+    별도 프로세스에서 한 백엔드를 로드해 측정 (RSS 가 서로 섞이지 않도록)
+
+    Args:
+        queue (mp.Queue): 결과 dict 를 돌려줄 큐
+    """
+    from analyzer.sentiment_analyzer import SentimentAnalyzer
+
+    load_start = time.perf_counter()
+    analyzer = SentimentAnalyzer(backend=backend)
+    analyzer.classifier  # 모델은 첫 사용 시 로드되므로 여기서 강제로 로드
+    load_time = time.perf_counter() - load_start
+
+    # 워밍업 (첫 호출의 그래프 초기화 비용 제외)
+    analyzer.analyze_batch(texts[:batch_size], batch_size=batch_size)
+
+    latencies = []
+    for text in texts[:latency_runs]:
+        start = time.perf_counter()
+        analyzer.analyze(text)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    results = analyzer.analyze_batch(texts, batch_size=batch_size)
+    batch_time = time.perf_counter() - start
+
+    latencies.sort()
+    queue.put({
+        "backend": analyzer.backend,  # ONNX 로드 실패 시 torch 로 바뀜
+        "load_sec": round(load_time, 2),
+        "p50_ms": round(statistics.median(latencies), 2) if latencies else None,
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 2) if latencies else None,
+        "throughput": round(len(texts) / batch_time, 1) if batch_time else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "results": results,
+    })
+
+
+def measure(backend, texts, latency_runs, batch_size, timeout=MEASURE_TIMEOUT):
+    """
+    백엔드 하나를 새 프로세스(spawn)에서 실행하고 결과 반환
+
+    측정 프로세스가 결과 없이 죽거나 timeout 초 안에 끝나지 않으면 RuntimeError
+    (큐를 무한정 기다리며 벤치마크가 멈추지 않도록)
+    """
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=run_backend, args=(backend, texts, latency_runs, batch_size, queue))
+    proc.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                return queue.get(timeout=5)
+            except Empty:
+                if not proc.is_alive():
+                    # 종료 직전에 넣은 결과가 아직 큐에 도착하지 않았을 수 있어 한 번 더 확인
+                    try:
+                        return queue.get(timeout=1)
+                    except Empty:
+                        raise RuntimeError(f"{backend} 측정 프로세스가 결과 없이 종료되었습니다 "
+                                           f"(exit code {proc.exitcode})") from None
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"{backend} 측정이 {timeout}초 안에 끝나지 않았습니다.")
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+
+
+def compare(reports, labels):
+    """첫 번째(기준) 백엔드 대비 라벨 일치율 / 정확도 / 점수 차이 계산"""
+    base = reports[0]["results"]
+    labelled = [i for i, label in enumerate(labels) if label is not None]
+    for report in reports:
+        results = report["results"]
+        report["agreement"] = round(sum(a[0] == b[0] for a, b in zip(base, results)) / len(base), 4)
+        report["max_score_diff"] = round(max(abs(a[1] - b[1]) for a, b in zip(base, results)), 4)
+        if labelled:
+            report["accuracy"] = round(sum(results[i][0] == labels[i] for i in labelled) / len(labelled), 4)
+
+
+def main():
+    from pipeline.targets import TARGETS, get_target
+
+    parser = argparse.ArgumentParser(description="감성 분석 백엔드(PyTorch / ONNX int8) 정확도·속도·메모리 비교")
+    parser.add_argument("--target", type=str, choices=list(TARGETS), default="im_sung_gen", help="정답 샘플을 가져올 대상")
+    parser.add_argument("--csv", type=str, help="정답 샘플 CSV (content,label)")
+    parser.add_argument("--sample", type=int, default=500, help="샘플 크기")
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx"], help="비교할 백엔드 (첫 번째가 기준)")
+    parser.add_argument("--latency-runs", type=int, default=100, help="단건 지연시간 측정 횟수")
+    parser.add_argument("--batch-size", type=int, default=32, help="배치 크기")
+    parser.add_argument("--max-drop", type=float, default=0.01, help="허용 정확도 하락폭 (넘으면 종료 코드 1)")
+    parser.add_argument("--output", type=str, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--timeout", type=float, default=MEASURE_TIMEOUT, help="백엔드 하나의 측정 제한 시간 (초)")
+    args = parser.parse_args()
+
+    if args.csv:
+        samples = load_sample_from_csv(args.csv, args.sample)
+    else:
+        samples = load_sample_from_db(get_target(args.target), args.sample)
+    if not samples:
+        logger.error("벤치마크할 샘플이 없습니다.")
+        return 1
+
+    texts = [text for text, _ in samples]
+    labels = [label for _, label in samples]
+    logger.info(f"샘플 {len(texts)}건 (정답 라벨 {sum(l is not None for l in labels)}건)")
+
+    reports = []
+    for backend in args.backends:
+        logger.info(f"▶ {backend} 측정 중...")
+        try:
+            reports.append(measure(backend, texts, args.latency_runs, args.batch_size, args.timeout))
+        except RuntimeError as e:
+            logger.error(f"❌ {e}")
+            return 1
+    compare(reports, labels)
+
+    print(f"\n{'backend':<8} {'load(s)':>8} {'p50(ms)':>8} {'p95(ms)':>8} {'건/초':>8} {'RSS(MB)':>8} {'일치율':>7} {'정확도':>7} {'점수차':>7}")
+    for r in reports:
+        print(f"{r['backend']:<8} {r['load_sec']:>8} {r['p50_ms']:>8} {r['p95_ms']:>8} {r['throughput']:>8} "
+              f"{r['peak_rss_mb'] or '-':>8} {r['agreement']:>7} {r.get('accuracy', '-'):>7} {r['max_score_diff']:>7}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump([{k: v for k, v in r.items() if k != "results"} for r in reports], f, ensure_ascii=False, indent=2)
+        logger.info(f"결과 저장: {args.output}")
+
+    # 기준 대비 정확도가 허용폭 이상 떨어지면 실패 처리 (CI/배포 전 확인용)
+    base_acc = reports[0].get("accuracy")
+    for r in reports[1:]:
+        if base_acc is not None and r.get("accuracy") is not None and base_acc - r["accuracy"] > args.max_drop:
+            logger.error(f"❌ {r['backend']} 정확도 하락 {base_acc - r['accuracy']:.4f} > {args.max_drop}")
+            return 1
+    logger.info("✅ 정확도 동등성 확인 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+-- 워드클라우드용 키워드 빈도 인덱스
+-- 대시보드가 매번 전체 댓글의 keywords 배열을 내려받아 Counter 로 세던 부분을
+-- (댓글 테이블, 감정 그룹, 작성일, 키워드) 단위 집계 테이블로 미리 계산해 둡니다.
+-- 시기(논란 전/후)는 페이지마다 기준일이 달라서 작성일(day) 범위로 필터링합니다.
+-- 같은 comment_id 가 여러 번 적재된 경우 대시보드처럼 가장 최근 작성일 행 하나만 집계합니다.
+-- 대시보드의 "전체" 는 LLM 분석이 끝난 그룹(긍정 / 부정 / 그외)의 합이며 미분류는 포함하지 않습니다.
+
+CREATE TABLE IF NOT EXISTS keyword_frequency_index (
+    table_name TEXT NOT NULL,           -- 원본 댓글 테이블 (im_sung_gen_youtube_comments / baek_jongwon_youtube_comments)
+    sentiment_group TEXT NOT NULL,      -- 긍정(0,2) / 부정(1,3,4) / 그외(5) / 미분류(LLM 분석 전)
+    day DATE NOT NULL,                  -- 댓글 작성일 (DB 시간대 기준, Supabase 기본값 UTC)
+    keyword TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (table_name, sentiment_group, day, keyword)
+);
+
+CREATE INDEX IF NOT EXISTS idx_kfi_group_day ON keyword_frequency_index(table_name, sentiment_group, day);
+
+-- 인덱스 갱신 함수 (정규화 / LLM 분석 단계가 끝날 때 호출)
+-- p_since 를 주면 그 날짜 이후 작성된 댓글만 다시 집계합니다.
+CREATE OR REPLACE FUNCTION refresh_keyword_index(p_table TEXT, p_since DATE DEFAULT NULL)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    inserted INTEGER;
+BEGIN
+    IF p_table NOT IN ('im_sung_gen_youtube_comments', 'baek_jongwon_youtube_comments') THEN
+        RAISE EXCEPTION '지원하지 않는 테이블입니다: %', p_table;
+    END IF;
+
+    DELETE FROM keyword_frequency_index
+    WHERE table_name = p_table
+      AND (p_since IS NULL OR day >= p_since);
+
+    EXECUTE format($f$
+        INSERT INTO keyword_frequency_index (table_name, sentiment_group, day, keyword, count)
+        SELECT %L,
+               CASE WHEN c.llm_sentiment IN (0, 2) THEN '긍정'
+                    WHEN c.llm_sentiment IN (1, 3, 4) THEN '부정'
+                    WHEN c.llm_sentiment = 5 THEN '그외'
+                    ELSE '미분류' END,
+               c.published_at::date,
+               kw,
+               COUNT(*)
+        FROM (
+            -- comment_id 기준 중복 제거 (재수집으로 같은 댓글이 여러 행이면 한 번만 집계)
+            SELECT DISTINCT ON (comment_id) comment_id, keywords, llm_sentiment, published_at
+            FROM %I
+            ORDER BY comment_id, published_at DESC NULLS LAST
+        ) c
+        CROSS JOIN LATERAL unnest(c.keywords) AS kw
+        WHERE c.keywords IS NOT NULL
+          AND c.published_at IS NOT NULL
+          AND char_length(kw) > 1
+          AND ($1 IS NULL OR c.published_at::date >= $1)
+        GROUP BY 2, 3, 4
+    $f$, p_table, p_table)
+    USING p_since;
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    RETURN inserted;
+END;
+$$;
@@ -0,0 +1,12 @@
+-- 확신도 기반 LLM 라우팅 (pipeline/routing.py) 용 컬럼
+-- llm_sentiment 를 누가 채웠는지 기록합니다.
+--   'llm'   : DeepSeek 분석 결과
+--   'local' : BERT 확신도가 높아 로컬 라벨을 그대로 채택
+--   NULL    : 라우팅 도입 전 분석 (모두 LLM 결과)
+-- 보정(calibrate)과 일치율 리포트는 'local' 행을 제외하고 계산합니다.
+
+ALTER TABLE im_sung_gen_youtube_comments ADD COLUMN IF NOT EXISTS llm_source TEXT;
+ALTER TABLE baek_jongwon_youtube_comments ADD COLUMN IF NOT EXISTS llm_source TEXT;
+
+COMMENT ON COLUMN im_sung_gen_youtube_comments.llm_source IS 'llm_sentiment 출처: llm(DeepSeek) / local(BERT 고확신 채택) / NULL(라우팅 도입 전)';
+COMMENT ON COLUMN baek_jongwon_youtube_comments.llm_source IS 'llm_sentiment 출처: llm(DeepSeek) / local(BERT 고확신 채택) / NULL(라우팅 도입 전)';
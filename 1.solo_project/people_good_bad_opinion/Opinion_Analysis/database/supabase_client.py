@@ -21,8 +21,8 @@ class SupabaseManager:
             self.client: Client = create_client(self.url, self.key)
             logger.info("Supabase client initialized.")
 
-    def upsert_comments(self, data_list):
-        """임성근 유튜브 댓글 리스트를 Supabase 테이블에 Upsert합니다."""
+    def upsert_target_comments(self, table_name, data_list):
+        """분석 대상(pipeline/targets.py)의 댓글 리스트를 해당 테이블에 Upsert합니다."""
         if not self.client:
             logger.error("Supabase client not initialized.")
             return False
@@ -33,18 +33,26 @@ class SupabaseManager:
 
         try:
             # comment_id를 기준으로 중복 방지 (ON CONFLICT)
-            response = self.client.table("im_sung_gen_youtube_comments").upsert(
+            response = self.client.table(table_name).upsert(
                 data_list, 
                 on_conflict="comment_id"
             ).execute()
-            logger.info(f"Successfully upserted {len(data_list)} comments.")
+            logger.info(f"Successfully upserted {len(data_list)} comments into {table_name}.")
             return True
         except Exception as e:
-            logger.error(f"Error upserting data to Supabase: {e}")
+            logger.error(f"Error upserting data to {table_name}: {e}")
             return False
 
+    def upsert_comments(self, data_list):
+        """임성근 유튜브 댓글 리스트를 Supabase 테이블에 Upsert합니다."""
+        return self.upsert_target_comments("im_sung_gen_youtube_comments", data_list)
+
     def upsert_baek_jongwon_comments(self, data_list):
         """백종원 유튜브 댓글 리스트를 Supabase 테이블에 Upsert합니다."""
+        return self.upsert_target_comments("baek_jongwon_youtube_comments", data_list)
+
+    def upsert_video_stats(self, data_list):
+        """영상 통계 리스트를 Supabase 테이블에 Upsert합니다."""
         if not self.client:
             logger.error("Supabase client not initialized.")
             return False
@@ -54,37 +62,39 @@ class SupabaseManager:
             return True
 
         try:
-            # comment_id를 기준으로 중복 방지 (ON CONFLICT)
-            response = self.client.table("baek_jongwon_youtube_comments").upsert(
+            # video_id를 기준으로 중복 방지 (ON CONFLICT)
+            response = self.client.table("video_stats").upsert(
                 data_list, 
-                on_conflict="comment_id"
+                on_conflict="video_id"
             ).execute()
-            logger.info(f"Successfully upserted {len(data_list)} Baek Jongwon comments.")
+            logger.info(f"Successfully upserted {len(data_list)} video stats.")
             return True
         except Exception as e:
-            logger.error(f"Error upserting Baek Jongwon data to Supabase: {e}")
+            logger.error(f"Error upserting video stats to Supabase: {e}")
             return False
 
-    def upsert_video_stats(self, data_list):
-        """영상 통계 리스트를 Supabase 테이블에 Upsert합니다."""
+    def refresh_keyword_index(self, table_name, since=None):
+        """
+        워드클라우드용 키워드 빈도 인덱스(keyword_frequency_index)를 다시 집계합니다.
+        (database/keyword_index_schema.sql 의 refresh_keyword_index 함수 호출)
+
+        Args:
+            table_name: 원본 댓글 테이블 이름
+            since: 이 날짜(YYYY-MM-DD) 이후 작성된 댓글만 다시 집계 (None이면 전체)
+        """
         if not self.client:
             logger.error("Supabase client not initialized.")
             return False
 
-        if not data_list:
-            logger.warning("No data to upsert.")
-            return True
-
         try:
-            # video_id를 기준으로 중복 방지 (ON CONFLICT)
-            response = self.client.table("video_stats").upsert(
-                data_list, 
-                on_conflict="video_id"
+            response = self.client.rpc(
+                "refresh_keyword_index",
+                {"p_table": table_name, "p_since": since}
             ).execute()
-            logger.info(f"Successfully upserted {len(data_list)} video stats.")
+            logger.info(f"Keyword index refreshed for {table_name}: {response.data} rows.")
             return True
         except Exception as e:
-            logger.error(f"Error upserting video stats to Supabase: {e}")
+            logger.error(f"Error refreshing keyword index for {table_name}: {e}")
             return False
 
 if __name__ == "__main__":
@@ -5,9 +5,15 @@ import plotly.graph_objects as go
 from supabase import create_client
 import os
 from dotenv import load_dotenv
-from wordcloud import WordCloud
 import matplotlib.pyplot as plt
-from collections import Counter
+import sys
+from pathlib import Path
+
+# 상위 폴더(Opinion_Analysis)의 utils 모듈 사용
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.keyword_index import (
+    fetch_keyword_frequencies, frequencies_from_keywords, top_keywords, render_wordcloud
+)
 
 # 페이지 설정
 st.set_page_config(page_title="임성근 전체 요약", page_icon="1️⃣", layout="wide")
@@ -73,6 +79,16 @@ def load_im_data():
         
     return df
 
+@st.cache_data(ttl=300)
+def load_keyword_frequencies(sentiment_group):
+    """키워드 빈도 인덱스에서 그룹별 빈도 dict 조회 (댓글 전체를 다시 세지 않음)"""
+    return fetch_keyword_frequencies(get_supabase_client(), "im_sung_gen_youtube_comments", sentiment_group)
+
+@st.cache_data(ttl=600)
+def get_wordcloud_image(sentiment_group, frequencies, colormap):
+    """필터 조합별로 렌더링한 워드클라우드 이미지 캐시"""
+    return render_wordcloud(frequencies, colormap)
+
 # 데이터 로드
 df = load_im_data()
 
@@ -193,39 +209,20 @@ st.markdown("---")
 st.subheader("☁️ 감정 그룹별 핵심 키워드")
 wc_target = st.selectbox("워드클라우드 대상 그룹 선택", ["전체", "긍정", "부정", "그외"])
 
-if wc_target == "전체":
-    wc_df = df
-else:
-    wc_df = df[df['sentiment_group'] == wc_target]
-
-all_kws = []
-for k in wc_df['keywords'].dropna():
-    all_kws.extend(k)
-
-filtered_kws = [word for word in all_kws if len(word) > 1]
+# 미리 집계된 키워드 빈도 인덱스 사용 (인덱스가 비어 있으면 댓글 keywords 로 직접 계산)
+frequencies = load_keyword_frequencies(wc_target)
+if not frequencies:
+    # "전체" 는 인덱스와 같이 LLM 분석 전(미분류) 댓글 제외
+    wc_df = df[df['sentiment_group'] != "미분류"] if wc_target == "전체" else df[df['sentiment_group'] == wc_target]
+    frequencies = frequencies_from_keywords(wc_df['keywords'].dropna())
 
-if filtered_kws:
-    font_paths = [
-        '/System/Library/Fonts/Supplemental/AppleGothic.ttf',
-        '/Library/Fonts/NanumGothic.ttf',
-        'C:/Windows/Fonts/malgun.ttf'
-    ]
-    selected_font = next((fp for fp in font_paths if os.path.exists(fp)), None)
-    
+if frequencies:
     wc_color = "Greens" if wc_target == "긍정" else "Reds" if wc_target == "부정" else "Purples"
-    wc = WordCloud(
-        font_path=selected_font,
-        width=1200,
-        height=400,
-        background_color='white',
-        colormap=wc_color
-    ).generate(" ".join(filtered_kws))
-    
-    st.image(wc.to_image(), width="stretch")
+    st.image(get_wordcloud_image(wc_target, frequencies, wc_color), width="stretch")
     
     # 키워드 Top 10
     st.caption(f"📌 {wc_target} 댓글의 주요 키워드 TOP 10")
-    top_10 = Counter(filtered_kws).most_common(10)
+    top_10 = top_keywords(frequencies, 10)
     t10_df = pd.DataFrame(top_10, columns=['단어', '빈도'])
     fig_t10 = px.bar(
         t10_df,
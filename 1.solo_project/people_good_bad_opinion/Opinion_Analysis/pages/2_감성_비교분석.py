@@ -5,7 +5,14 @@ import plotly.graph_objects as go
 from supabase import create_client
 import os
 from dotenv import load_dotenv
-from collections import Counter
+import sys
+from pathlib import Path
+
+# 상위 폴더(Opinion_Analysis)의 utils 모듈 사용
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.keyword_index import (
+    fetch_keyword_frequencies, frequencies_from_keywords, top_keywords
+)
 
 # 페이지 설정
 st.set_page_config(page_title="감성 비교분석", page_icon="2️⃣", layout="wide")
@@ -270,18 +277,26 @@ with col_h2:
 st.markdown("---")
 st.subheader("🔑 주요 키워드 Top 10 비교")
 
-def get_top_keywords(df):
-    all_kws = []
-    for k in df['keywords'].dropna():
-        all_kws.extend(k)
-    return [w for w, c in Counter([w for w in all_kws if len(w)>1]).most_common(10)]
+@st.cache_data(ttl=300)
+def load_top_keywords(table_name, start_day=None):
+    """키워드 빈도 인덱스에서 상위 10개 키워드 조회"""
+    frequencies = fetch_keyword_frequencies(get_supabase_client(), table_name, start_day=start_day)
+    return [w for w, c in top_keywords(frequencies, 10)]
+
+def get_top_keywords(df, table_name, start_day=None):
+    # 인덱스가 아직 없으면 댓글 keywords 로 직접 계산 (인덱스와 같이 LLM 분석 전 댓글 제외)
+    top = load_top_keywords(table_name, start_day)
+    if not top:
+        analyzed = df[df['llm_sentiment'].notna()]
+        top = [w for w, c in top_keywords(frequencies_from_keywords(analyzed['keywords'].dropna()), 10)]
+    return top
 
 col_k1, col_k2 = st.columns(2)
 
 with col_k1:
     st.markdown("**임성근 주요 키워드**")
-    st.write(", ".join(get_top_keywords(df_im)))
+    st.write(", ".join(get_top_keywords(df_im, "im_sung_gen_youtube_comments", start_day="2026-01-19")))
 
 with col_k2:
     st.markdown("**백종원 주요 키워드**")
-    st.write(", ".join(get_top_keywords(df_baek)))
+    st.write(", ".join(get_top_keywords(df_baek, "baek_jongwon_youtube_comments")))
@@ -18,26 +18,71 @@ def get_supabase_client():
     key = os.getenv("SUPABASE_KEY")
     return create_client(url, key)
 
-@st.cache_data(ttl=300)
-def load_video_trend_data():
-    """영상 트렌드 데이터 로드"""
+def fetch_all(table, columns="*", page_size=1000):
+    """테이블 전체를 페이지 단위로 조회 (Supabase 기본 1000행 제한 대응)"""
     client = get_supabase_client()
-    
-    # daily_video_trends 테이블 조회
-    response = client.table("daily_video_trends")\
-        .select("*")\
-        .order("collected_date", desc=False)\
+    rows = []
+    offset = 0
+    while True:
+        response = client.table(table)\
+            .select(columns)\
+            .order("collected_date", desc=False)\
+            .range(offset, offset + page_size - 1)\
+            .execute()
+        rows.extend(response.data or [])
+        if not response.data or len(response.data) < page_size:
+            break
+        offset += page_size
+    return rows
+
+TREND_COLUMNS = "keyword, collected_date, video_count, total_views, total_likes, total_comments"
+# 롤업에 저장된 직전 수집 대비 증가량
+GROWTH_COLUMNS = {
+    'video_growth': 'video_diff',
+    'views_growth': 'views_diff',
+    'likes_growth': 'likes_diff',
+    'comments_growth': 'comments_diff',
+}
+
+def fetch_date_bound(table, last=False):
+    """테이블의 첫(last=False) / 마지막 수집일 (행이 없으면 None)"""
+    response = get_supabase_client().table(table)\
+        .select("collected_date")\
+        .order("collected_date", desc=last)\
+        .limit(1)\
         .execute()
+    return response.data[0]["collected_date"] if response.data else None
+
+@st.cache_data(ttl=300)
+def load_video_trend_data():
+    """
+    영상 트렌드 데이터 로드
+    (키워드, 수집일) 롤업 테이블(daily_video_trend_rollup)을 읽으므로 업로드 날짜 수와 무관하게
+    수집일당 키워드 수만큼의 행만 가져오고, 증감은 롤업에 저장된 값을 그대로 사용.
+    롤업이 비어 있거나 원본의 첫 / 마지막 수집일이 롤업에 없으면(백필 전 / 갱신 실패) daily_video_trends 원본 사용.
+
+    Returns:
+        tuple: (DataFrame, 롤업 사용 여부, 롤업이 일부만 채워져 있는지)
+    """
+    rows = fetch_all("daily_video_trend_rollup", TREND_COLUMNS + ", " + ", ".join(GROWTH_COLUMNS))
+    partial = False
+    if rows:
+        rollup_dates = {row['collected_date'] for row in rows}
+        raw_bounds = (fetch_date_bound("daily_video_trends"), fetch_date_bound("daily_video_trends", last=True))
+        partial = any(bound is not None and bound not in rollup_dates for bound in raw_bounds)
+    use_rollup = bool(rows) and not partial
+    if not use_rollup:
+        rows = fetch_all("daily_video_trends", TREND_COLUMNS)
         
-    if not response.data:
-        return pd.DataFrame()
+    if not rows:
+        return pd.DataFrame(), use_rollup, partial
         
-    df = pd.DataFrame(response.data)
+    df = pd.DataFrame(rows)
     df['collected_date'] = pd.to_datetime(df['collected_date']).dt.date
     
-    return df
+    return df, use_rollup, partial
 
-df = load_video_trend_data()
+df, use_rollup, rollup_partial = load_video_trend_data()
 
 if df.empty:
     st.info("아직 수집된 영상 트렌드 데이터가 없습니다.")
@@ -48,23 +93,31 @@ st.title("5️⃣ 관심지수 분석 (영상 트렌드)")
 st.markdown("### 객관적 지표(조회수, 좋아요)를 통한 여론 관심도 분석")
 st.markdown("---")
 
-# 집계
-daily_summary = df.groupby('collected_date').agg(
-    video_count=('video_count', 'sum'),
-    total_views=('total_views', 'sum'),
-    total_likes=('total_likes', 'sum'),
-    total_comments=('total_comments', 'sum')
-).reset_index().sort_values('collected_date')
-
-# 전일 대비 증감 계산
-daily_summary['views_diff'] = daily_summary['total_views'].diff().fillna(0)
-daily_summary['likes_diff'] = daily_summary['total_likes'].diff().fillna(0)
-daily_summary['comments_diff'] = daily_summary['total_comments'].diff().fillna(0)
-daily_summary['video_diff'] = daily_summary['video_count'].diff().fillna(0)
-
-# 증감율 계산 (%)
-daily_summary['views_rate'] = daily_summary['total_views'].pct_change().fillna(0) * 100
-daily_summary['likes_rate'] = daily_summary['total_likes'].pct_change().fillna(0) * 100
+if rollup_partial:
+    st.warning("롤업 테이블(daily_video_trend_rollup)에 빠진 수집일이 있어 원본 테이블로 집계했습니다. "
+               "youtube_trend_tracker 의 `scripts/check_timeline.py --rebuild` 로 롤업을 다시 채워 주세요.")
+
+# 집계 (롤업 기준이면 키워드 수만큼만 합산)
+metrics = ['video_count', 'total_views', 'total_likes', 'total_comments']
+if use_rollup:
+    metrics += list(GROWTH_COLUMNS)
+daily_summary = df.groupby('collected_date')[metrics].sum().reset_index().sort_values('collected_date')
+
+if use_rollup:
+    # 롤업에 저장된 키워드별 직전 수집 대비 증가량의 합
+    daily_summary = daily_summary.rename(columns=GROWTH_COLUMNS)
+else:
+    # 전일 대비 증감 계산
+    daily_summary['views_diff'] = daily_summary['total_views'].diff().fillna(0)
+    daily_summary['likes_diff'] = daily_summary['total_likes'].diff().fillna(0)
+    daily_summary['comments_diff'] = daily_summary['total_comments'].diff().fillna(0)
+    daily_summary['video_diff'] = daily_summary['video_count'].diff().fillna(0)
+
+# 증감율 계산 (%) - 직전 값(현재 - 증가량) 대비
+for total_col, diff_col, rate_col in (('total_views', 'views_diff', 'views_rate'),
+                                      ('total_likes', 'likes_diff', 'likes_rate')):
+    previous = daily_summary[total_col] - daily_summary[diff_col]
+    daily_summary[rate_col] = (daily_summary[diff_col] / previous.where(previous != 0) * 100).fillna(0)
 
 # 날짜 문자열 변환 (Gapless 그래프용)
 daily_summary['date_str'] = daily_summary['collected_date'].astype(str)
@@ -0,0 +1,212 @@
+"""
+유사 중복 댓글 클러스터링 (dedup.py)
+====================================
+database/aggressive_cleanup.py 는 특수문자/공백만 다른 완전 중복을 지우지만,
+도배/밈 댓글처럼 글자 몇 개만 다른 유사 중복은 그대로 남아 NLP / BERT / LLM 단계가
+같은 내용을 여러 번 분석합니다.
+
+이 모듈은 MinHash + LSH 로 유사한 댓글을 하나의 클러스터로 묶고,
+각 단계는 클러스터 대표 댓글만 분석한 뒤 결과를 나머지 멤버에게 그대로 복사합니다.
+(분석 비용이 전체 댓글 수가 아니라 고유한 내용 수에 비례)
+
+- 정규화: 특수문자/공백 제거 (aggressive_cleanup.py 와 동일) + 같은 글자 3회 이상 반복은 2회로 축약 (ㅋㅋㅋㅋ -> ㅋㅋ)
+- 짧은 댓글(정규화 후 SHINGLE_SIZE * 2 글자 미만)은 정규화 결과가 완전히 같을 때만 같은 클러스터
+- 이미 분석된 두 테이블의 댓글로 미리 채워 두면(warm) 테이블/실행이 달라도 결과를 재사용
+
+결과 재사용 범위 (context):
+    키워드 / BERT 라벨은 문맥과 무관하므로 두 테이블 전체에서 공유하고,
+    LLM 라벨은 대상/논란 전후에 따라 프롬프트가 달라지므로 llm_context() 가 같은 댓글끼리만 공유합니다.
+
+사용 예시:
+    >>> index = DedupIndex()
+    >>> index.warm(db, [get_target("im_sung_gen"), get_target("baek_jongwon")])
+    >>> results = index.analyze_unique(rows, ("sentiment_label", "sentiment_score"), analyze_fn)
+"""
+
+import hashlib
+import logging
+import re
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16  # 밴드당 4개 해시 -> 대략 자카드 0.5 이상이면 후보로 잡힘
+_PRIME = (1 << 31) - 1
+
+# 분석 단계별 결과 컬럼
+FIELDS = {
+    "keywords": ("keywords",),
+    "sentiment": ("sentiment_label", "sentiment_score"),
+    "llm": ("llm_sentiment",),
+}
+
+
+def normalize_text(text):
+    """비교용 정규화 (특수문자/공백 제거, 소문자, 반복 글자 축약)"""
+    text = re.sub(r'\W+', '', str(text or '')).lower()
+    return re.sub(r'(.)\1{2,}', r'\1\1', text)
+
+
+def llm_context(target, row):
+    """LLM 라벨을 공유할 수 있는 범위 (대상 테이블 + 논란 전/후)"""
+    if target.get("controversy_date"):
+        side = "before" if str(row.get("published_at", ""))[:10] < target["controversy_date"] else "after"
+        return f"{target['table']}:{side}"
+    return target["table"]
+
+
+class DedupIndex:
+    """
+    MinHash LSH 기반 유사 중복 클러스터 인덱스.
+
+    Attributes:
+        threshold (float): 같은 클러스터로 볼 최소 추정 자카드 유사도
+        clusters (list[dict]): 클러스터별 대표 시그니처와 단계별 분석 결과
+        stats (dict): 캐시 적중 / 대표 분석 건수
+    """
+
+    def __init__(self, threshold=0.8, num_perm=NUM_PERM, bands=BANDS, seed=42):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+        self.clusters = []
+        self._exact = {}     # 정규화 텍스트 -> 클러스터 번호
+        self._buckets = {}   # (밴드 번호, 밴드 해시) -> [클러스터 번호]
+        self._lock = threading.Lock()
+        self.stats = {"reused": 0, "analyzed": 0}
+
+    # ──────────────────────────────────────────────
+    # MinHash / LSH
+    # ──────────────────────────────────────────────
+
+    def _signature(self, normalized):
+        shingles = {normalized[i:i + SHINGLE_SIZE] for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+        hashes = np.array(
+            [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little") % _PRIME
+             for s in shingles],
+            dtype=np.uint64,
+        )
+        # (a * h + b) mod p 를 모든 해시 함수에 대해 한 번에 계산 (a, h < 2^31 이라 overflow 없음)
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature):
+        r = self.rows_per_band
+        return [(band, signature[band * r:(band + 1) * r].tobytes()) for band in range(self.bands)]
+
+    def cluster_of(self, text):
+        """텍스트가 속한 클러스터 번호 (없으면 새 클러스터 생성)"""
+        normalized = normalize_text(text)
+        with self._lock:
+            if normalized in self._exact:
+                return self._exact[normalized]
+
+            signature = None
+            cluster_id = None
+            if len(normalized) >= SHINGLE_SIZE * 2:
+                signature = self._signature(normalized)
+                band_keys = self._band_keys(signature)
+                candidates = {cid for key in band_keys for cid in self._buckets.get(key, ())}
+                best = 0.0
+                for cid in candidates:
+                    similarity = float(np.mean(self.clusters[cid]["signature"] == signature))
+                    if similarity >= self.threshold and similarity > best:
+                        best, cluster_id = similarity, cid
+
+            if cluster_id is None:
+                cluster_id = len(self.clusters)
+                self.clusters.append({"signature": signature, "results": {}})
+                if signature is not None:
+                    for key in band_keys:
+                        self._buckets.setdefault(key, []).append(cluster_id)
+
+            self._exact[normalized] = cluster_id
+            return cluster_id
+
+    # ──────────────────────────────────────────────
+    # 결과 캐시
+    # ──────────────────────────────────────────────
+
+    def get(self, cluster_id, fields, context=None):
+        return self.clusters[cluster_id]["results"].get((fields, context))
+
+    def put(self, cluster_id, fields, result, context=None):
+        if result and all(result.get(field) is not None for field in fields):
+            with self._lock:
+                self.clusters[cluster_id]["results"][(fields, context)] = result
+
+    def warm(self, db, targets, page_size=1000):
+        """
+        이미 분석된 댓글로 인덱스를 미리 채움 (두 테이블 모두 넘기면 테이블 간 결과 공유)
+
+        LLM 라벨은 실제 LLM 이 붙인 행(llm_source 가 'local' 이 아닌 행, NULL 은 라우팅 도입 전)에서만 채움.
+        로컬 BERT 고확신 채택 라벨(llm_source = 'local')을 LLM 결과로 복사하지 않기 위함 (pipeline/routing.py 와 같은 기준)
+
+        Args:
+            targets (list[dict]): pipeline/targets.py 의 대상 설정 리스트
+        """
+        for target in targets:
+            offset = 0
+            loaded = 0
+            while True:
+                response = db.client.table(target["table"])\
+                    .select("content, published_at, keywords, sentiment_label, sentiment_score, llm_sentiment, llm_source")\
+                    .not_.is_("keywords", "null")\
+                    .order("comment_id")\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                for row in response.data:
+                    cluster_id = self.cluster_of(row["content"])
+                    self.put(cluster_id, FIELDS["keywords"], {"keywords": row["keywords"]})
+                    self.put(cluster_id, FIELDS["sentiment"], {"sentiment_label": row["sentiment_label"],
+                                                               "sentiment_score": row["sentiment_score"]})
+                    if row.get("llm_source") != "local":
+                        self.put(cluster_id, FIELDS["llm"], {"llm_sentiment": row["llm_sentiment"]},
+                                 llm_context(target, row))
+                loaded += len(response.data)
+                if len(response.data) < page_size:
+                    break
+                offset += page_size
+            logger.info(f"[{target['name']}] 중복 인덱스 적재: {loaded}건")
+        logger.info(f"중복 인덱스: 댓글 {len(self._exact)}종 -> 클러스터 {len(self.clusters)}개")
+
+    def analyze_unique(self, rows, fields, analyze, context=None):
+        """
+        rows 를 클러스터로 묶어 결과가 없는 클러스터의 대표만 analyze 하고 결과를 모든 멤버에 복사
+
+        Args:
+            rows (list[dict]): content 를 가진 행
+            fields (tuple): 결과 컬럼 이름 (FIELDS 값)
+            analyze (callable): 대표 행 리스트 -> 같은 순서의 결과 dict 리스트 (실패한 항목은 None)
+            context (callable): 행 -> 결과 공유 범위 키 (None 이면 전체 공유)
+
+        Returns:
+            list: rows 와 같은 순서의 결과 dict (실패한 항목은 None)
+        """
+        keys = [(self.cluster_of(row["content"]), context(row) if context else None) for row in rows]
+
+        # 캐시에 없는 클러스터의 첫 번째 행만 대표로 분석
+        representatives = {}
+        for row, key in zip(rows, keys):
+            if self.get(key[0], fields, key[1]) is None and key not in representatives:
+                representatives[key] = row
+
+        if representatives:
+            outputs = analyze(list(representatives.values()))
+            for key, output in zip(representatives, outputs):
+                self.put(key[0], fields, output, key[1])
+
+        results = [self.get(cid, fields, ctx) for cid, ctx in keys]
+        with self._lock:
+            self.stats["analyzed"] += len(representatives)
+            self.stats["reused"] += len(rows) - len(representatives)
+        return results
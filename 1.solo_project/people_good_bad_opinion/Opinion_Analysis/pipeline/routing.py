@@ -0,0 +1,195 @@
+"""
+확신도 기반 LLM 라우팅 (routing.py)
+===================================
+3단계 BERT 결과(sentiment_label, sentiment_score)의 확신도가 충분히 높은 댓글은
+LLM 을 거치지 않고 로컬 라벨을 그대로 llm_sentiment 로 채택하고,
+애매한 댓글만 DeepSeek 으로 보냅니다. (LLM 비용/시간이 전체 건수가 아니라 애매한 비율에 비례)
+
+보정(calibrate):
+    이미 LLM 이 분석한 댓글(llm_source 가 'local' 이 아닌 행)에서
+    BERT 라벨별로 가장 많이 대응되는 LLM 라벨(0~5)을 찾고,
+    그 대응의 일치율이 target_precision 이상이 되는 최소 점수를 라벨별 기준값으로 정합니다.
+    일치율을 맞출 수 없는 BERT 라벨은 항상 LLM 으로 보냅니다.
+    (BERT 는 4: sarcasm, 5: inquiry 를 예측하지 못하므로 보정 없이 쓰면 이 둘이 과소 집계됨)
+
+저장:
+    로컬에서 채택한 행은 llm_source = 'local', LLM 결과는 llm_source = 'llm' 으로 저장합니다.
+    (database/llm_routing_schema.sql 의 컬럼 추가가 먼저 필요)
+"""
+
+import logging
+import math
+import threading
+
+logger = logging.getLogger(__name__)
+
+# 보정 데이터가 없을 때의 기본 대응 (BERT 0~3 과 LLM 0~3 은 같은 의미)
+DEFAULT_LABEL_MAP = {0: 0, 1: 1, 2: 2, 3: 3}
+
+
+class ConfidenceRouter:
+    """
+    BERT 확신도로 LLM 분석 대상을 고르는 라우터.
+
+    Attributes:
+        threshold (float): 보정 전 기본 기준 점수 (이 이상이면 로컬 라벨 채택)
+        target_precision (float): 보정 시 목표로 하는 LLM 과의 일치율
+        min_support (int): 보정 시 라벨별로 필요한 최소 표본 수
+        label_map (dict): BERT 라벨 -> LLM 6종 라벨 대응
+        thresholds (dict): BERT 라벨별 기준 점수 (없는 라벨은 항상 LLM)
+    """
+
+    def __init__(self, threshold=0.95, target_precision=0.9, min_support=30):
+        self.threshold = threshold
+        self.target_precision = target_precision
+        self.min_support = min_support
+        self.label_map = dict(DEFAULT_LABEL_MAP)
+        self.thresholds = {label: threshold for label in DEFAULT_LABEL_MAP}
+        self.calibrated = False
+        self.stats = {"local": 0, "llm": 0}
+        self._lock = threading.Lock()  # 스트리밍 파이프라인의 여러 LLM 워커가 함께 사용
+
+    # ──────────────────────────────────────────────
+    # 보정
+    # ──────────────────────────────────────────────
+
+    @staticmethod
+    def fetch_labelled(target, db, limit=5000, page_size=1000):
+        """BERT 와 LLM 결과가 모두 있는 행 (로컬 채택 행 제외)"""
+        rows = []
+        offset = 0
+        while len(rows) < limit:
+            response = db.client.table(target["table"])\
+                .select("sentiment_label, sentiment_score, llm_sentiment")\
+                .not_.is_("sentiment_label", "null")\
+                .not_.is_("llm_sentiment", "null")\
+                .or_("llm_source.is.null,llm_source.neq.local")\
+                .order("comment_id")\
+                .range(offset, offset + page_size - 1)\
+                .execute()
+            rows.extend(response.data)
+            if len(response.data) < page_size:
+                break
+            offset += page_size
+        return rows[:limit]
+
+    def calibrate(self, labelled):
+        """
+        LLM 결과가 있는 행으로 라벨 대응과 라벨별 기준 점수를 정함
+
+        Args:
+            labelled (list[dict]): sentiment_label, sentiment_score, llm_sentiment 를 가진 행
+        """
+        by_label = {}
+        for row in labelled:
+            by_label.setdefault(row["sentiment_label"], []).append((row["sentiment_score"] or 0.0, row["llm_sentiment"]))
+
+        self.label_map = {}
+        self.thresholds = {}
+        for label, pairs in by_label.items():
+            if len(pairs) < self.min_support:
+                continue
+            # 이 BERT 라벨에 가장 많이 대응되는 LLM 라벨
+            counts = {}
+            for _, llm in pairs:
+                counts[llm] = counts.get(llm, 0) + 1
+            mapped = max(counts, key=counts.get)
+
+            # 점수 내림차순으로 누적 일치율이 목표 이상인 가장 낮은 점수를 기준으로
+            pairs.sort(key=lambda p: -p[0])
+            agree = 0
+            cutoff = None
+            for n, (score, llm) in enumerate(pairs, 1):
+                agree += llm == mapped
+                if n >= self.min_support and agree / n >= self.target_precision:
+                    cutoff = score
+            if cutoff is not None:
+                self.label_map[label] = mapped
+                self.thresholds[label] = max(cutoff, 0.5)
+
+        self.calibrated = True
+        logger.info(f"Routing calibrated on {len(labelled)} rows: "
+                    f"map={self.label_map}, thresholds={ {k: round(v, 3) for k, v in self.thresholds.items()} }")
+        return self
+
+    # ──────────────────────────────────────────────
+    # 라우팅
+    # ──────────────────────────────────────────────
+
+    def accept(self, label, score):
+        """로컬 라벨을 채택할 수 있으면 대응되는 LLM 라벨, 아니면 None"""
+        if label is None or score is None or label not in self.thresholds:
+            return None
+        if score >= self.thresholds[label]:
+            return self.label_map[label]
+        return None
+
+    def route(self, rows):
+        """
+        행을 로컬 채택 / LLM 분석 대상으로 나눔
+
+        Returns:
+            tuple: (로컬에서 채택한 행 업데이트 리스트, LLM 으로 보낼 행 리스트)
+        """
+        accepted, to_llm = [], []
+        for row in rows:
+            mapped = self.accept(row.get("sentiment_label"), row.get("sentiment_score"))
+            if mapped is None:
+                to_llm.append(row)
+            else:
+                accepted.append({
+                    "comment_id": row["comment_id"],
+                    "video_id": row["video_id"],
+                    "content": row["content"],
+                    "llm_sentiment": mapped,
+                    "llm_source": "local",
+                })
+        with self._lock:
+            self.stats["local"] += len(accepted)
+        return accepted, to_llm
+
+    def record_llm(self, count):
+        """실제로 LLM 에 보낸 댓글 수 기록 (같은 행이 다시 조회돼도 한 번만 세도록 호출하는 쪽에서 기록)"""
+        with self._lock:
+            self.stats["llm"] += count
+
+    def summary(self, llm_batch_size=20):
+        """이번 실행에서 절약한 LLM 호출 수 요약"""
+        total = self.stats["local"] + self.stats["llm"]
+        calls_without = math.ceil(total / llm_batch_size)
+        calls_with = math.ceil(self.stats["llm"] / llm_batch_size)
+        return {
+            "total": total,
+            "local": self.stats["local"],
+            "llm": self.stats["llm"],
+            "local_ratio": round(self.stats["local"] / total, 4) if total else 0.0,
+            "api_calls": calls_with,
+            "api_calls_saved": calls_without - calls_with,
+        }
+
+
+def routing_report(labelled, thresholds=(0.8, 0.85, 0.9, 0.95, 0.98), llm_batch_size=20, label_map=None):
+    """
+    기준 점수별로 로컬 채택 비율, LLM 과의 일치율, 절약되는 API 호출 수를 계산
+
+    Args:
+        labelled (list[dict]): BERT / LLM 결과가 모두 있는 행 (ConfidenceRouter.fetch_labelled)
+        label_map (dict): BERT -> LLM 라벨 대응 (기본: 0~3 동일)
+
+    Returns:
+        list[dict]: 기준 점수별 통계
+    """
+    label_map = label_map or DEFAULT_LABEL_MAP
+    total = len(labelled)
+    report = []
+    for threshold in thresholds:
+        accepted = [row for row in labelled
+                    if row["sentiment_label"] in label_map and (row["sentiment_score"] or 0.0) >= threshold]
+        agree = sum(label_map[row["sentiment_label"]] == row["llm_sentiment"] for row in accepted)
+        report.append({
+            "threshold": threshold,
+            "local_ratio": round(len(accepted) / total, 4) if total else 0.0,
+            "agreement": round(agree / len(accepted), 4) if accepted else None,
+            "api_calls_saved": math.ceil(total / llm_batch_size) - math.ceil((total - len(accepted)) / llm_batch_size),
+        })
+    return report
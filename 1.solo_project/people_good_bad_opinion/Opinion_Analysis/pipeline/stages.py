@@ -0,0 +1,351 @@
+"""
+단계별 실행 로직 (stages.py)
+============================
+1_collect / 2_normalize / 3_local_analysis / 4_llm_analysis 스크립트의 본문을 대상(target) 설정을
+받는 함수로 옮겼습니다. 숫자로 시작하는 스크립트들은 이 함수들을 호출하는 얇은 실행 파일이며,
+run_targets.py 는 같은 함수를 여러 대상에 대해 한 프로세스에서 (모델을 한 번만 로드해) 실행합니다.
+
+각 함수는 모델/클라이언트를 인자로 받을 수 있어서, 넘기면 이미 로드된 것을 재사용하고
+넘기지 않으면 analyzer/model_registry.py 의 공유 인스턴스(또는 추론 워커 클라이언트)를 사용합니다.
+"""
+
+import logging
+import time
+
+from tqdm import tqdm
+
+from analyzer.model_registry import get_nlp_engine, get_sentiment_analyzer
+from pipeline.dedup import FIELDS, llm_context
+from collector.youtube_collector import YouTubeCollector
+from collector.community_collector import YouTubeCommunityCollector
+
+logger = logging.getLogger(__name__)
+
+
+def collect_url(target, url, limit, db, extra_fields=None):
+    """
+    URL 하나의 댓글을 수집해 대상 테이블에 저장 (1단계)
+
+    Args:
+        target (dict): pipeline/targets.py 의 대상 설정
+        url (str): 유튜브 영상 / 커뮤니티 게시물 URL
+        limit (int): 수집할 댓글 최대 개수
+        db (SupabaseManager): DB 매니저
+        extra_fields (dict): 댓글에 추가로 저장할 컬럼 (없으면 대상 기본값)
+    """
+    if "/post/" in url or "community" in url:
+        logger.info(f"커뮤니티 포스트 URL 감지: {url}")
+        collector = YouTubeCommunityCollector(headless=True)
+        is_community = True
+    else:
+        logger.info(f"일반 영상 URL 감지: {url}")
+        collector = YouTubeCollector()
+        is_community = False
+
+    fields = target["extra_fields"] if extra_fields is None else extra_fields
+    try:
+        logger.info(f"[{target['name']}] 수집 시작: {url}")
+        # 수집 시도 (내부에서 에러가 나거나 중단되어도 예외처리로 저장 시도)
+        comments = collector.fetch_comments(url, limit=limit)
+
+        if comments:
+            for comment in comments:
+                comment.update(fields)
+            logger.info(f"데이터베이스 저장 중 ({len(comments)}건)...")
+            db.upsert_target_comments(target["table"], comments)
+            return True
+    except Exception as e:
+        logger.error(f"수집 중 오류 발생: {e}")
+    finally:
+        if is_community:
+            collector.close()
+    return False
+
+
+def run_collection(target, urls, limit, db, extra_fields=None):
+    """URL 목록 전체 수집 (1단계). 성공한 URL 수 반환"""
+    success_count = 0
+    for i, url in enumerate(urls):
+        logger.info(f"[{i+1}/{len(urls)}] 처리 중: {url}")
+        if collect_url(target, url, limit, db, extra_fields):
+            success_count += 1
+    logger.info(f"[{target['name']}] 수집 완료: {success_count}/{len(urls)} 성공")
+    return success_count
+
+
+def build_dedup_index(db, threshold=0.8):
+    """두 댓글 테이블의 기존 분석 결과로 채운 유사 중복 인덱스 생성 (pipeline/dedup.py)"""
+    from pipeline.dedup import DedupIndex
+    from pipeline.targets import TARGETS
+
+    index = DedupIndex(threshold=threshold)
+    try:
+        index.warm(db, list(TARGETS.values()))
+    except Exception as e:
+        logger.warning(f"중복 인덱스 적재 실패 (이번 실행 결과만 재사용): {e}")
+    return index
+
+
+def _analyze(rows, fields, analyze, dedup=None, context=None):
+    """dedup 인덱스가 있으면 클러스터 대표만 분석해서 펼치고, 없으면 전체 분석"""
+    if dedup is None:
+        return analyze(rows)
+    return dedup.analyze_unique(rows, fields, analyze, context)
+
+
+def run_normalization(target, db, nlp=None, batch_size=50, dedup=None):
+    """
+    keywords 가 비어 있는 댓글을 정규화하고 키워드 추출 (2단계)
+
+    Args:
+        nlp (NLPEngine): 이미 로드된 NLP 엔진 (없으면 레지스트리의 공유 엔진, 맞춤법 교정 없음)
+        dedup (DedupIndex): 주어지면 유사 중복 댓글은 대표 한 건만 분석해서 결과 복사
+    """
+    if nlp is None:
+        # 맞춤법 교정 비활성화 (속도 최적화: 3-5배 향상)
+        nlp = get_nlp_engine(use_corrector=False)
+
+    logger.info(f"=== [{target['name']} Stage 2] 텍스트 정규화 및 키워드 추출 시작 ===")
+
+    total_processed = 0
+    total_time = 0
+
+    while True:
+        try:
+            # 텍스트 정제(keywords)가 완료되지 않은 데이터 가져오기 (video_id 포함)
+            response = db.client.table(target["table"])\
+                .select("comment_id, content, video_id")\
+                .is_("keywords", "null")\
+                .limit(batch_size)\
+                .execute()
+
+            rows = response.data
+            if not rows:
+                logger.info(f"✅ 모든 {target['name']} 데이터의 정규화가 완료되었습니다.")
+                if dedup:
+                    logger.info(f"♻️ 중복 클러스터 재사용: {dedup.stats}")
+                if total_processed > 0:
+                    avg_time = total_time / total_processed
+                    logger.info(f"📊 총 처리: {total_processed}개, 평균 처리 시간: {avg_time:.2f}초/배치")
+                # 대시보드 워드클라우드용 키워드 빈도 인덱스 갱신
+                db.refresh_keyword_index(target["table"])
+                break
+
+            batch_start = time.time()
+
+            def extract(batch):
+                # 배치 단위로 맞춤법 교정 및 특수문자 제거 (성능 최적화)
+                clean_texts = nlp.preprocess_batch([row["content"] for row in batch])
+                # 키워드 추출 (추론 워커 사용 시 요청 한 번으로 배치 처리)
+                return [{"keywords": keywords} for keywords in nlp.extract_keywords_batch(clean_texts)]
+
+            results = _analyze(rows, FIELDS["keywords"], extract, dedup)
+            updated_data = []
+            for row, result in tqdm(zip(rows, results), total=len(rows), desc="Extracting keywords"):
+                updated_data.append({
+                    "comment_id": row["comment_id"],
+                    "video_id": row["video_id"],
+                    "content": row["content"],  # 데이터 무결성을 위해 content 포함 (NOT NULL 제약 조건 대응)
+                    "keywords": result["keywords"] if result else []
+                })
+
+            if updated_data:
+                db.upsert_target_comments(target["table"], updated_data)
+
+                batch_time = time.time() - batch_start
+                total_time += batch_time
+                total_processed += 1
+
+                logger.info(f"✅ {len(updated_data)}개 댓글 정규화 완료 (소요 시간: {batch_time:.2f}초)")
+
+        except Exception as e:
+            logger.error(f"Error during normalization: {e}")
+            time.sleep(5)  # 에러 시 잠시 대기
+
+
+def run_local_analysis(target, db, sentiment=None, batch_size=100, dedup=None, stats_store=None):
+    """
+    sentiment_label 이 비어 있는 댓글을 BERT 로 감성 분석 (3단계)
+
+    Args:
+        sentiment (SentimentAnalyzer): 이미 로드된 감성 분석 모델 (없으면 레지스트리의 공유 모델)
+        dedup (DedupIndex): 주어지면 유사 중복 댓글은 대표 한 건만 분석해서 결과 복사
+        stats_store (IncrementalStatStore): 주어지면 라벨링한 댓글을 증분 통계에 바로 반영
+    """
+    if sentiment is None:
+        sentiment = get_sentiment_analyzer()
+
+    logger.info(f"=== [{target['name']} Stage 3] 로컬 감성 분석(BERT) 시작 ===")
+
+    while True:
+        try:
+            # 로컬 분석(sentiment_label)이 완료되지 않은 데이터 가져오기 (통계 반영용 likes / published_at 포함)
+            response = db.client.table(target["table"])\
+                .select("comment_id, content, video_id, likes, published_at")\
+                .is_("sentiment_label", "null")\
+                .limit(batch_size)\
+                .execute()
+
+            rows = response.data
+            if not rows:
+                logger.info(f"✅ 모든 {target['name']} 데이터의 로컬 분석이 완료되었습니다.")
+                if stats_store is not None:
+                    stats_store.save()
+                if dedup:
+                    logger.info(f"♻️ 중복 클러스터 재사용: {dedup.stats}")
+                break
+
+            def classify(batch):
+                # 배치 단위로 모델 호출 (한 건씩 호출하는 것보다 빠름)
+                return [{"sentiment_label": label, "sentiment_score": score}
+                        for label, score in sentiment.analyze_batch([row["content"] for row in batch])]
+
+            results = _analyze(rows, FIELDS["sentiment"], classify, dedup)
+            updated_data = []
+            for row, result in tqdm(zip(rows, results), total=len(rows), desc="BERT Analyzing"):
+                result = result or {"sentiment_label": 2, "sentiment_score": 0.0}  # 분석 실패 시 중립
+                updated_data.append({
+                    "comment_id": row["comment_id"],
+                    "video_id": row["video_id"],
+                    "content": row["content"],  # 데이터 무결성을 위해 content 포함
+                    "sentiment_label": result["sentiment_label"],
+                    "sentiment_score": result["sentiment_score"]
+                })
+
+            if updated_data:
+                if db.upsert_target_comments(target["table"], updated_data) and stats_store is not None:
+                    stats_store.update([dict(row, **item) for row, item in zip(rows, updated_data)])
+                logger.info(f"Successfully analyzed {len(updated_data)} comments.")
+
+        except Exception as e:
+            logger.error(f"Error during local analysis: {e}")
+            time.sleep(5)
+
+
+def parse_llm_results(rows, llm_results, source=None):
+    """
+    LLM 결과를 0~5 정수로 검증해서 업데이트할 행만 반환
+
+    Args:
+        source (str): 주어지면 llm_source 컬럼도 함께 저장 (라우팅 사용 시 "llm")
+    """
+    updated_data = []
+    for row, result in zip(rows, llm_results):
+        try:
+            val = int(result)
+        except (TypeError, ValueError):
+            continue
+        # 결과가 유효할 때만 업데이트 리스트에 추가 (0-5 범위)
+        if 0 <= val <= 5:
+            updated_data.append({
+                "comment_id": row["comment_id"],
+                "video_id": row["video_id"],
+                "content": row["content"],
+                "llm_sentiment": val
+            })
+            if source:
+                updated_data[-1]["llm_source"] = source
+    return updated_data
+
+
+def build_router(target, db, threshold=0.95, target_precision=0.9):
+    """
+    LLM 결과가 쌓여 있으면 그걸로 보정한 라우터, 부족하면 기본 기준 점수 라우터 생성
+    """
+    from pipeline.routing import ConfidenceRouter
+
+    router = ConfidenceRouter(threshold=threshold, target_precision=target_precision)
+    try:
+        labelled = ConfidenceRouter.fetch_labelled(target, db)
+    except Exception as e:
+        logger.warning(f"라우팅 보정용 데이터 조회 실패 (기본 기준 사용): {e}")
+        labelled = []
+    if len(labelled) >= router.min_support:
+        router.calibrate(labelled)
+    else:
+        logger.warning(f"보정용 LLM 결과가 {len(labelled)}건뿐이라 기본 기준({threshold})으로 라우팅합니다.")
+    return router
+
+
+def run_llm_analysis(target, db, labeler=None, batch_size=20, router=None, dedup=None):
+    """
+    llm_sentiment 가 비어 있는 댓글을 대상별 프롬프트로 DeepSeek 분석 (4단계)
+
+    Args:
+        labeler (LLMLabeler): 이미 만들어 둔 LLM 분석기 묶음 (없으면 생성)
+        router (ConfidenceRouter): 주어지면 BERT 확신도가 높은 댓글은 LLM 없이 로컬 라벨 채택
+            (pipeline/routing.py, database/llm_routing_schema.sql 적용 필요)
+        dedup (DedupIndex): 주어지면 같은 대상/시기의 유사 중복 댓글은 대표 한 건만 LLM 분석
+    """
+    if labeler is None:
+        from pipeline.targets import LLMLabeler
+        labeler = LLMLabeler()
+
+    logger.info(f"=== [{target['name']} Stage 4] LLM 정밀 분석(DeepSeek) 시작 (배치: {batch_size}) ===")
+    if target["controversy_date"]:
+        logger.info(f"논란 기준일: {target['controversy_date']}")
+
+    columns = "comment_id, content, published_at, video_id"
+    if router:
+        columns += ", sentiment_label, sentiment_score"
+        # 로컬 채택 후보를 한 번에 많이 걸러낼 수 있도록 조회 크기를 늘림
+        fetch_size = batch_size * 5
+    else:
+        fetch_size = batch_size
+
+    while True:
+        try:
+            # LLM 분석(llm_sentiment)이 완료되지 않은 데이터 가져오기
+            response = db.client.table(target["table"])\
+                .select(columns)\
+                .is_("llm_sentiment", "null")\
+                .order("published_at")\
+                .limit(fetch_size)\
+                .execute()
+
+            rows = response.data
+            if not rows:
+                logger.info(f"✅ 모든 {target['name']} 데이터의 LLM 정밀 분석이 완료되었습니다.")
+                if dedup:
+                    logger.info(f"♻️ 중복 클러스터 재사용: {dedup.stats}")
+                if router:
+                    logger.info(f"📊 라우팅 결과: {router.summary(batch_size)}")
+                # 감정 그룹이 바뀌었으므로 워드클라우드용 키워드 빈도 인덱스 갱신
+                db.refresh_keyword_index(target["table"])
+                break
+
+            if router:
+                accepted, rows = router.route(rows)
+                if accepted:
+                    db.upsert_target_comments(target["table"], accepted)
+                    logger.info(f"BERT 확신도가 높은 {len(accepted)}개 댓글은 로컬 라벨을 채택했습니다.")
+                # LLM 으로 보낼 행은 원래 배치 크기만큼만 처리하고 나머지는 다음 조회에서
+                rows = rows[:batch_size]
+                if not rows:
+                    continue
+                router.record_llm(len(rows))
+
+            def label(batch):
+                texts = [r["content"] for r in batch]
+                dates = [str(r["published_at"])[:10] for r in batch]
+                # DeepSeek 호출 (날짜 맥락 포함, 대상별 프롬프트)
+                valid = {item["comment_id"]: item["llm_sentiment"]
+                         for item in parse_llm_results(batch, labeler.label(target, texts, dates))}
+                return [{"llm_sentiment": valid[r["comment_id"]]} if r["comment_id"] in valid else None
+                        for r in batch]
+
+            results = _analyze(rows, FIELDS["llm"], label, dedup, lambda row: llm_context(target, row))
+            llm_results = [result["llm_sentiment"] if result else None for result in results]
+            logger.info(f"LLM Results: {llm_results}")
+
+            updated_data = parse_llm_results(rows, llm_results, source="llm" if router else None)
+            if updated_data:
+                db.upsert_target_comments(target["table"], updated_data)
+                logger.info(f"Successfully updated {len(updated_data)} comments with LLM results.")
+            else:
+                logger.warning("No valid LLM results returned in this batch.")
+                time.sleep(2)
+
+        except Exception as e:
+            logger.error(f"Error during LLM analysis: {e}")
+            time.sleep(5)
@@ -0,0 +1,327 @@
+"""
+스트리밍 분석 파이프라인 (streaming.py)
+=======================================
+수집 → 정규화(Kiwi) → 로컬 감성 분석(BERT) → LLM 분석(DeepSeek) 을 한 프로세스 안에서
+크기가 제한된 큐로 연결해 동시에 실행합니다.
+
+기존 방식(1~4번 스크립트)은 단계마다 DB를 폴링해서 같은 행을 읽고 다시 쓰기 때문에
+댓글 하나당 DB 왕복이 4번 이상 필요했습니다. 이 파이프라인은 댓글이 모든 단계를 거친 뒤
+마지막에 한 번만 저장합니다.
+
+    [collector] → q → [normalizer x N] → q → [bert x N] → q → [llm x N] → q → [writer]
+
+- 큐 크기(queue_size)가 제한되어 있어 앞 단계가 너무 앞서가면 자동으로 대기 (메모리 일정)
+- 단계별 워커 수를 따로 지정 (Kiwi: CPU, BERT: 모델 1개 권장, LLM: 네트워크 대기라 여러 개)
+- LLM 분석이 실패한 댓글은 llm_sentiment 가 비어 있는 채로 저장되므로
+  기존 4_llm_analysis.py 를 단독으로 실행하면 나머지를 이어서 처리할 수 있음
+- 모델(Kiwi, BERT, DeepSeek 클라이언트)은 첫 실행 때 한 번만 로드하므로
+  같은 인스턴스로 여러 대상(pipeline/targets.py)을 이어서 처리하면 재로딩 없이 실행됨
+
+사용 예시:
+    >>> pipeline = StreamingPipeline(db)
+    >>> stats = pipeline.run(["https://www.youtube.com/watch?v=..."], limit=500)
+    >>> stats = pipeline.run(baek_urls, limit=500, target=get_target("baek_jongwon"))
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from analyzer.nlp_engine import NLPEngine
+from analyzer.sentiment_analyzer import SentimentAnalyzer
+from collector.youtube_collector import YouTubeCollector
+from collector.community_collector import YouTubeCommunityCollector
+from pipeline.stages import parse_llm_results
+from pipeline.targets import LLMLabeler, get_target
+
+logger = logging.getLogger(__name__)
+
+# 최종 저장 시 모든 행이 같은 컬럼을 갖도록 채워 넣을 분석 컬럼
+RESULT_COLUMNS = ("keywords", "sentiment_label", "sentiment_score", "llm_sentiment")
+
+# 스트림 종료 신호
+_DONE = object()
+
+
+class StreamingPipeline:
+    """
+    댓글 수집부터 LLM 라벨링까지 한 번에 처리하는 스트리밍 파이프라인.
+
+    Attributes:
+        db (SupabaseManager): 최종 저장에 사용할 DB 매니저
+        queue_size (int): 단계 사이 큐의 최대 크기
+        normalize_workers / bert_workers / llm_workers (int): 단계별 워커 수
+        bert_batch_size / llm_batch_size / write_batch_size (int): 단계별 배치 크기
+        flush_interval (float): 배치가 다 차지 않아도 처리하기까지 기다리는 최대 시간 (초)
+        skip_existing (bool): 이미 LLM 분석까지 끝난 댓글은 수집 단계에서 제외
+        router (ConfidenceRouter): 주어지면 BERT 확신도가 높은 댓글은 LLM 없이 로컬 라벨 채택
+    """
+
+    def __init__(self, db, queue_size=500,
+                 normalize_workers=2, bert_workers=1, llm_workers=4,
+                 bert_batch_size=32, llm_batch_size=20, write_batch_size=200,
+                 flush_interval=2.0, skip_existing=True, use_corrector=False, router=None):
+        self.db = db
+        self.queue_size = queue_size
+        self.normalize_workers = normalize_workers
+        self.bert_workers = bert_workers
+        self.llm_workers = llm_workers
+        self.bert_batch_size = bert_batch_size
+        self.llm_batch_size = llm_batch_size
+        self.write_batch_size = write_batch_size
+        self.flush_interval = flush_interval
+        self.skip_existing = skip_existing
+        self.use_corrector = use_corrector
+        self.router = router
+
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+
+        # 모델은 첫 run() 때 로드해서 이후 실행에서 재사용
+        self._nlp_engines = None
+        self._bert_models = None
+        self._labeler = None
+
+    def load_models(self):
+        """단계별 모델 로드 (이미 로드되어 있으면 그대로 사용)"""
+        if self._nlp_engines is None:
+            # 모델은 워커마다 하나씩 (Kiwi / transformers pipeline 은 스레드 간 공유를 보장하지 않음)
+            self._nlp_engines = [NLPEngine(use_corrector=self.use_corrector) for _ in range(self.normalize_workers)]
+            self._bert_models = [SentimentAnalyzer() for _ in range(self.bert_workers)]
+            self._labeler = LLMLabeler()  # HTTP 클라이언트는 스레드 간 공유 가능
+
+    # ──────────────────────────────────────────────
+    # 실행
+    # ──────────────────────────────────────────────
+
+    def run(self, urls, limit=100, target=None, extra_fields=None):
+        """
+        URL 목록의 댓글을 수집해 모든 분석 단계를 거친 뒤 DB에 저장.
+
+        Args:
+            urls (list[str]): 유튜브 영상 / 커뮤니티 게시물 URL 리스트
+            limit (int): URL 당 수집할 최대 댓글 수
+            target (dict): 분석 대상 설정 (기본: 임성근)
+            extra_fields (dict): 댓글에 추가로 저장할 컬럼 (없으면 대상 기본값)
+
+        Returns:
+            dict: 단계별 처리 건수
+        """
+        target = target or get_target("im_sung_gen")
+        fields = target["extra_fields"] if extra_fields is None else extra_fields
+        self.stats = {"collected": 0, "skipped": 0, "normalized": 0,
+                      "bert": 0, "routed_local": 0, "llm": 0, "llm_failed": 0, "written": 0}
+        self.load_models()
+        logger.info(f"=== [{target['name']}] 스트리밍 파이프라인 시작 ({len(urls)}개 URL) ===")
+
+        start = time.time()
+        collected_q = queue.Queue(maxsize=self.queue_size)
+        normalized_q = queue.Queue(maxsize=self.queue_size)
+        labeled_q = queue.Queue(maxsize=self.queue_size)
+        analyzed_q = queue.Queue(maxsize=self.queue_size)
+
+        stages = [
+            self._start_stage("collector", [lambda: self._collect(target, urls, limit, fields, collected_q)], None, collected_q),
+            self._start_stage("normalizer",
+                              [self._batch_worker(collected_q, normalized_q, self.bert_batch_size,
+                                                  lambda rows, nlp=nlp: self._normalize(nlp, rows))
+                               for nlp in self._nlp_engines],
+                              collected_q, normalized_q),
+            self._start_stage("bert",
+                              [self._batch_worker(normalized_q, labeled_q, self.bert_batch_size,
+                                                  lambda rows, model=model: self._classify(model, rows))
+                               for model in self._bert_models],
+                              normalized_q, labeled_q),
+            self._start_stage("llm",
+                              [self._batch_worker(labeled_q, analyzed_q, self.llm_batch_size,
+                                                  lambda rows: self._label_with_llm(target, rows))
+                               for _ in range(self.llm_workers)],
+                              labeled_q, analyzed_q),
+            self._start_stage("writer",
+                              [self._batch_worker(analyzed_q, None, self.write_batch_size,
+                                                  lambda rows: self._write(target, rows))],
+                              analyzed_q, None),
+        ]
+        for stage in stages:
+            stage.join()
+
+        # 감정 그룹이 채워졌으므로 워드클라우드용 키워드 빈도 인덱스 갱신
+        if self.stats["written"]:
+            self.db.refresh_keyword_index(target["table"])
+
+        logger.info(f"=== [{target['name']}] 스트리밍 파이프라인 완료 ({time.time() - start:.1f}초) ===")
+        logger.info(f"📊 {self.stats}")
+        return dict(self.stats)
+
+    def _start_stage(self, name, targets, input_q, output_q):
+        """
+        단계 실행: 워커들을 띄우고, 모두 끝나면 다음 단계에 종료 신호 전달
+        """
+        def supervise():
+            workers = [threading.Thread(target=target, name=f"{name}-{i}", daemon=True)
+                       for i, target in enumerate(targets)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            if output_q is not None:
+                output_q.put(_DONE)
+            logger.info(f"[{name}] 단계 종료")
+
+        thread = threading.Thread(target=supervise, name=f"{name}-supervisor", daemon=True)
+        thread.start()
+        return thread
+
+    def _batch_worker(self, input_q, output_q, batch_size, process):
+        """
+        입력 큐에서 batch_size 개(또는 flush_interval 동안 모인 만큼)씩 꺼내 처리하는 워커
+        """
+        def work():
+            done = False
+            while not done:
+                item = input_q.get()
+                if item is _DONE:
+                    input_q.put(_DONE)  # 같은 단계의 다른 워커도 종료하도록 되돌려 놓음
+                    return
+
+                batch = [item]
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = input_q.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        input_q.put(_DONE)
+                        done = True
+                        break
+                    batch.append(item)
+
+                try:
+                    results = process(batch)
+                except Exception as e:
+                    # 한 배치가 실패해도 파이프라인은 계속 (분석 값 없이 다음 단계로 전달)
+                    logger.error(f"[{threading.current_thread().name}] 배치 처리 중 오류: {e}")
+                    results = batch
+
+                if output_q is not None:
+                    for row in results:
+                        output_q.put(row)
+        return work
+
+    def _count(self, key, value=1):
+        with self._stats_lock:
+            self.stats[key] += value
+
+    # ──────────────────────────────────────────────
+    # 단계별 처리
+    # ──────────────────────────────────────────────
+
+    def _collect(self, target, urls, limit, fields, output_q):
+        """수집 단계: URL 별로 댓글을 가져와 한 건씩 큐에 넣음"""
+        for i, url in enumerate(urls):
+            logger.info(f"[{i+1}/{len(urls)}] 수집 중: {url}")
+            is_community = "/post/" in url or "community" in url
+            collector = YouTubeCommunityCollector(headless=True) if is_community else YouTubeCollector()
+            try:
+                comments = collector.fetch_comments(url, limit=limit)
+            except Exception as e:
+                logger.error(f"수집 중 오류 발생: {e}")
+                comments = []
+            finally:
+                if is_community:
+                    collector.close()
+
+            if not comments:
+                continue
+            done_ids = self._analyzed_comment_ids(target, comments[0]["video_id"]) if self.skip_existing else set()
+            for comment in comments:
+                if comment["comment_id"] in done_ids:
+                    self._count("skipped")
+                    continue
+                comment.update(fields)
+                output_q.put(comment)
+                self._count("collected")
+
+    def _analyzed_comment_ids(self, target, video_id):
+        """이미 LLM 분석까지 끝난 댓글 ID (다시 분석하지 않도록 제외)"""
+        done_ids = set()
+        offset = 0
+        page_size = 1000
+        try:
+            while True:
+                response = self.db.client.table(target["table"])\
+                    .select("comment_id")\
+                    .eq("video_id", video_id)\
+                    .not_.is_("llm_sentiment", "null")\
+                    .range(offset, offset + page_size - 1)\
+                    .execute()
+                done_ids.update(row["comment_id"] for row in response.data)
+                if len(response.data) < page_size:
+                    break
+                offset += page_size
+        except Exception as e:
+            logger.warning(f"기존 분석 결과 조회 실패 (전체 재분석): {e}")
+        return done_ids
+
+    def _normalize(self, nlp, rows):
+        """정규화 단계: 특수문자 제거 + Kiwi 키워드 추출"""
+        clean_texts = nlp.preprocess_batch([row["content"] for row in rows])
+        for row, clean_text in zip(rows, clean_texts):
+            row["keywords"] = nlp.extract_keywords(clean_text)
+        self._count("normalized", len(rows))
+        return rows
+
+    def _classify(self, model, rows):
+        """로컬 분석 단계: BERT 감성 분류 (배치)"""
+        results = model.analyze_batch([row["content"] for row in rows], batch_size=self.bert_batch_size)
+        for row, (label, score) in zip(rows, results):
+            row["sentiment_label"] = label
+            row["sentiment_score"] = score
+        self._count("bert", len(rows))
+        return rows
+
+    def _label_with_llm(self, target, rows):
+        """LLM 단계: 대상별 프롬프트로 DeepSeek 배치 분석 (논란 전/후 구분은 LLMLabeler 가 처리)"""
+        to_llm = rows
+        if self.router:
+            # BERT 확신도가 높은 댓글은 로컬 라벨 채택 (pipeline/routing.py)
+            accepted, to_llm = self.router.route(rows)
+            local = {item["comment_id"]: item["llm_sentiment"] for item in accepted}
+            for row in rows:
+                if row["comment_id"] in local:
+                    row["llm_sentiment"] = local[row["comment_id"]]
+                    row["llm_source"] = "local"
+            self.router.record_llm(len(to_llm))
+            self._count("routed_local", len(accepted))
+            if not to_llm:
+                return rows
+
+        texts = [row["content"] for row in to_llm]
+        dates = [str(row.get("published_at", ""))[:10] for row in to_llm]
+        llm_results = self._labeler.label(target, texts, dates)
+
+        # 유효하지 않은 결과는 비워 두고 4_llm_analysis.py 에서 다시 처리
+        valid = {item["comment_id"]: item["llm_sentiment"] for item in parse_llm_results(to_llm, llm_results)}
+        for row in to_llm:
+            if row["comment_id"] in valid:
+                row["llm_sentiment"] = valid[row["comment_id"]]
+                if self.router:
+                    row["llm_source"] = "llm"
+        self._count("llm", len(valid))
+        self._count("llm_failed", len(to_llm) - len(valid))
+        return rows
+
+    def _write(self, target, rows):
+        """저장 단계: 모든 분석 결과를 댓글당 한 번만 upsert"""
+        columns = RESULT_COLUMNS + ("llm_source",) if self.router else RESULT_COLUMNS
+        for row in rows:
+            for column in columns:
+                row.setdefault(column, None)
+        if self.db.upsert_target_comments(target["table"], rows):
+            self._count("written", len(rows))
+        return rows
@@ -0,0 +1,117 @@
+"""
+분석 대상(공인) 레지스트리 (targets.py)
+======================================
+임성근 / 백종원 스크립트가 테이블 이름, 논란 기준일, 프롬프트, 링크 파일만 다르고
+나머지는 통째로 복사돼 있던 부분을 대상별 설정 한 곳으로 모았습니다.
+새 대상을 추가할 때는 TARGETS 에 항목 하나를 추가하고 링크 파일/테이블만 만들면 됩니다.
+(워드클라우드 인덱스를 쓰려면 database/keyword_index_schema.sql 의 허용 테이블 목록에도 추가)
+
+설정 항목:
+    name (str): 화면/로그에 표시할 이름
+    table (str): 댓글 저장 테이블
+    link_file (str): 수집할 유튜브 링크 목록 파일
+    controversy_date (str | None): 논란 기준일 (prompt_set 이 "split" 일 때 전/후 프롬프트 구분에 사용)
+    prompt_set (str): LLM 프롬프트 구성
+        - "split": DeepSeekAnalyzer 의 논란 전/후 프롬프트를 controversy_date 기준으로 나눠 사용
+        - "baek_jongwon": DeepSeekBaekJongwonAnalyzer 의 날짜 맥락 프롬프트 하나로 분석
+    collect_limit (int): 영상당 기본 수집 댓글 수
+    extra_fields (dict): 수집 시 댓글에 추가로 저장할 컬럼
+"""
+
+import threading
+
+from analyzer.deepseek_analyzer import DeepSeekAnalyzer
+from analyzer.deepseek_baek_jongwon_analyzer import DeepSeekBaekJongwonAnalyzer
+
+TARGETS = {
+    "im_sung_gen": {
+        "name": "임성근",
+        "table": "im_sung_gen_youtube_comments",
+        "link_file": "youtube_link.txt",
+        "controversy_date": "2026-01-19",
+        "prompt_set": "split",
+        "collect_limit": 100,
+        "extra_fields": {},
+    },
+    "baek_jongwon": {
+        "name": "백종원",
+        "table": "baek_jongwon_youtube_comments",
+        "link_file": "baek_jongwon_link.txt",
+        "controversy_date": None,
+        "prompt_set": "baek_jongwon",
+        "collect_limit": 500,
+        # collection_period: 'controversy' (논란시기 2025.02-03) / 'current' (현재 2025.12-2026.01)
+        "extra_fields": {"target_person": "백종원", "collection_period": "controversy"},
+    },
+}
+
+# 프롬프트 구성별 분석기 클래스
+PROMPT_ANALYZERS = {
+    "split": DeepSeekAnalyzer,
+    "baek_jongwon": DeepSeekBaekJongwonAnalyzer,
+}
+
+
+def get_target(key):
+    """대상 키(im_sung_gen / baek_jongwon) -> 설정 dict"""
+    if key not in TARGETS:
+        raise ValueError(f"알 수 없는 분석 대상입니다: {key} (가능: {', '.join(TARGETS)})")
+    return TARGETS[key]
+
+
+def load_urls(path):
+    """링크 파일에서 URL 목록 읽기 (# 으로 시작하는 줄은 주석)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+class LLMLabeler:
+    """
+    대상별 프롬프트로 DeepSeek 분석을 수행 (분석기는 프롬프트 구성당 하나만 만들고
+    OpenAI HTTP 클라이언트는 모든 분석기가 공유)
+    """
+
+    def __init__(self, client=None):
+        """
+        Args:
+            client: 분석기들이 공유할 OpenAI 호환 클라이언트 (없으면 첫 분석기가 만든 클라이언트 사용,
+                벤치마크에서는 bench/mock_llm.py 서버를 가리키는 클라이언트를 전달)
+        """
+        self._analyzers = {}
+        self._client = client
+        self._lock = threading.Lock()  # 여러 LLM 워커가 동시에 분석기를 만들지 않도록
+
+    def analyzer(self, prompt_set):
+        with self._lock:
+            if prompt_set not in self._analyzers:
+                analyzer = PROMPT_ANALYZERS[prompt_set](client=self._client)
+                self._client = self._client or analyzer.client
+                self._analyzers[prompt_set] = analyzer
+            return self._analyzers[prompt_set]
+
+    def label(self, target, texts, dates):
+        """
+        댓글 리스트를 대상 설정에 맞는 프롬프트로 분석
+
+        Returns:
+            list: 입력 순서대로의 LLM 결과 (실패한 항목은 None)
+        """
+        analyzer = self.analyzer(target["prompt_set"])
+        if target["prompt_set"] != "split":
+            results = analyzer.analyze_batch(texts, dates)
+            return [results[i] if i < len(results) else None for i in range(len(texts))]
+
+        # 논란 전/후 댓글을 나눠 각각의 프롬프트로 분석 후 원래 순서로 합침
+        controversy_date = target["controversy_date"]
+        results = [None] * len(texts)
+        before = [i for i, d in enumerate(dates) if d < controversy_date]
+        after = [i for i, d in enumerate(dates) if d >= controversy_date]
+        for indices, analyze_func in ((before, analyzer.analyze_batch_before_controversy),
+                                      (after, analyzer.analyze_batch_after_controversy)):
+            if not indices:
+                continue
+            group_results = analyze_func([texts[i] for i in indices], [dates[i] for i in indices])
+            for j, i in enumerate(indices):
+                if j < len(group_results):
+                    results[i] = group_results[j]
+        return results
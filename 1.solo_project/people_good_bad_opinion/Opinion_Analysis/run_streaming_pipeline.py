@@ -0,0 +1,62 @@
+import logging
+import argparse
+import os
+from database.supabase_client import SupabaseManager
+from pipeline.stages import build_router
+from pipeline.streaming import StreamingPipeline
+from pipeline.targets import TARGETS, get_target, load_urls
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="수집 → 정규화 → BERT → LLM 을 한 번에 처리하는 스트리밍 파이프라인 "
+                    "(단계별 실행은 1~4번 스크립트를 그대로 사용)"
+    )
+    parser.add_argument("--target", type=str, choices=list(TARGETS), default="im_sung_gen", help="분석 대상 (pipeline/targets.py)")
+    parser.add_argument("--url", type=str, help="수집할 유튜브 영상 URL (단일)")
+    parser.add_argument("--file", type=str, help="URL 목록이 적힌 파일 경로 (기본: 대상별 링크 파일)")
+    parser.add_argument("--limit", type=int, help="영상당 수집할 댓글 최대 개수 (기본: 대상별 설정)")
+    parser.add_argument("--queue-size", type=int, default=500, help="단계 사이 큐 최대 크기")
+    parser.add_argument("--normalize-workers", type=int, default=2, help="Kiwi 정규화 워커 수")
+    parser.add_argument("--bert-workers", type=int, default=1, help="BERT 분석 워커 수 (워커마다 모델 1개 로드)")
+    parser.add_argument("--llm-workers", type=int, default=4, help="DeepSeek 동시 요청 수")
+    parser.add_argument("--reanalyze", action="store_true", help="이미 LLM 분석이 끝난 댓글도 다시 분석")
+    parser.add_argument("--route", action="store_true", help="BERT 확신도가 높은 댓글은 LLM 없이 로컬 라벨 채택 (pipeline/routing.py)")
+
+    args = parser.parse_args()
+    target = get_target(args.target)
+    db_manager = SupabaseManager()
+
+    link_file = args.file or target["link_file"]
+    urls = []
+    if args.url:
+        urls.append(args.url)
+    elif os.path.exists(link_file):
+        urls = load_urls(link_file)
+        logger.info(f"파일({link_file})에서 {len(urls)}개의 URL을 로드했습니다.")
+
+    if not urls:
+        logger.error("처리할 URL이 없습니다.")
+        return
+
+    router = build_router(target, db_manager) if args.route else None
+    pipeline = StreamingPipeline(
+        db_manager,
+        queue_size=args.queue_size,
+        normalize_workers=args.normalize_workers,
+        bert_workers=args.bert_workers,
+        llm_workers=args.llm_workers,
+        skip_existing=not args.reanalyze,
+        router=router
+    )
+    pipeline.run(urls, limit=args.limit or target["collect_limit"], target=target)
+    if router:
+        logger.info(f"📊 라우팅 결과: {router.summary(pipeline.llm_batch_size)}")
+
+if __name__ == "__main__":
+    main()
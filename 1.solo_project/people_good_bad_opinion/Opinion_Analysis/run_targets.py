@@ -0,0 +1,69 @@
+import logging
+import argparse
+import os
+from database.supabase_client import SupabaseManager
+from pipeline.targets import TARGETS, LLMLabeler, get_target, load_urls
+from pipeline import stages
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def run_stages(targets, db, args):
+    """대상마다 1~4단계를 순서대로 실행 (Kiwi / BERT / DeepSeek 클라이언트는 한 번만 로드)"""
+    from analyzer.model_registry import get_nlp_engine, get_sentiment_analyzer
+
+    # 모델은 처음 사용할 때 로드 (INFERENCE_WORKER_URL 이 있으면 워커 사용)
+    nlp = get_nlp_engine(use_corrector=False)
+    sentiment = get_sentiment_analyzer()
+    labeler = LLMLabeler()
+    # 대상 간에도 키워드 / BERT 결과를 공유하도록 인덱스는 하나만 사용
+    dedup = stages.build_dedup_index(db) if args.dedup else None
+
+    for target in targets:
+        if not args.skip_collect:
+            urls = load_urls(target["link_file"]) if os.path.exists(target["link_file"]) else []
+            logger.info(f"[{target['name']}] 링크 파일({target['link_file']})에서 {len(urls)}개의 URL을 로드했습니다.")
+            stages.run_collection(target, urls, args.limit or target["collect_limit"], db)
+        stages.run_normalization(target, db, nlp=nlp, dedup=dedup)
+        stages.run_local_analysis(target, db, sentiment=sentiment, dedup=dedup)
+        stages.run_llm_analysis(target, db, labeler=labeler, dedup=dedup)
+
+def run_stream(targets, db, args):
+    """대상마다 스트리밍 파이프라인 실행 (같은 파이프라인 인스턴스 = 모델 재사용)"""
+    from pipeline.streaming import StreamingPipeline
+
+    pipeline = StreamingPipeline(db, llm_workers=args.llm_workers)
+    for target in targets:
+        urls = load_urls(target["link_file"]) if os.path.exists(target["link_file"]) else []
+        if not urls:
+            logger.warning(f"[{target['name']}] 처리할 URL이 없습니다. ({target['link_file']})")
+            continue
+        pipeline.run(urls, limit=args.limit or target["collect_limit"], target=target)
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 분석 대상을 한 프로세스에서 처리 (모델/클라이언트 1회 로드)")
+    parser.add_argument("--targets", type=str, default=",".join(TARGETS),
+                        help=f"쉼표로 구분한 대상 목록 (기본: {','.join(TARGETS)})")
+    parser.add_argument("--mode", type=str, choices=["stages", "stream"], default="stages",
+                        help="stages: 대상별로 1~4단계 순차 실행 / stream: 스트리밍 파이프라인")
+    parser.add_argument("--limit", type=int, help="영상당 수집할 댓글 최대 개수 (기본: 대상별 설정)")
+    parser.add_argument("--skip-collect", action="store_true", help="수집 없이 DB에 남은 미분석 댓글만 처리 (stages 모드)")
+    parser.add_argument("--dedup", action="store_true", help="유사 중복 댓글은 대표 한 건만 분석하고 결과 복사 (stages 모드)")
+    parser.add_argument("--llm-workers", type=int, default=4, help="DeepSeek 동시 요청 수 (stream 모드)")
+
+    args = parser.parse_args()
+    targets = [get_target(key.strip()) for key in args.targets.split(",") if key.strip()]
+    db_manager = SupabaseManager()
+
+    logger.info(f"=== 다중 대상 실행: {[t['name'] for t in targets]} (모드: {args.mode}) ===")
+    if args.mode == "stream":
+        run_stream(targets, db_manager, args)
+    else:
+        run_stages(targets, db_manager, args)
+    logger.info("=== 모든 대상 처리 완료 ===")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+from collections import Counter
+
+INDEX_TABLE = "keyword_frequency_index"
+# "전체" 에 합산하는 그룹 (LLM 분석 전인 미분류는 제외)
+ANALYZED_GROUPS = ["긍정", "부정", "그외"]
+UNCLASSIFIED_GROUP = "미분류"
+
+FONT_PATHS = [
+    '/System/Library/Fonts/Supplemental/AppleGothic.ttf',
+    '/Library/Fonts/NanumGothic.ttf',
+    'C:/Windows/Fonts/malgun.ttf'
+]
+
+
+def find_font():
+    """사용 가능한 한글 폰트 경로 (없으면 None)"""
+    return next((fp for fp in FONT_PATHS if os.path.exists(fp)), None)
+
+
+def fetch_keyword_frequencies(client, table_name, sentiment_group=None, start_day=None, end_day=None, page_size=1000):
+    """
+    keyword_frequency_index 에서 키워드 빈도를 합산해 가져옵니다.
+
+    Args:
+        client: Supabase 클라이언트
+        table_name: 원본 댓글 테이블 이름
+        sentiment_group: 긍정 / 부정 / 그외 (None 또는 "전체"면 미분류를 뺀 세 그룹 합계)
+        start_day, end_day: 작성일 범위 (YYYY-MM-DD, end_day 는 포함하지 않음)
+
+    Returns:
+        dict: {키워드: 빈도} (인덱스가 비어 있으면 빈 dict)
+    """
+    frequencies = Counter()
+    offset = 0
+
+    while True:
+        query = client.table(INDEX_TABLE)\
+            .select("keyword, count")\
+            .eq("table_name", table_name)
+        if sentiment_group and sentiment_group != "전체":
+            query = query.eq("sentiment_group", sentiment_group)
+        else:
+            query = query.in_("sentiment_group", ANALYZED_GROUPS)
+        if start_day:
+            query = query.gte("day", start_day)
+        if end_day:
+            query = query.lt("day", end_day)
+
+        batch_data = query.range(offset, offset + page_size - 1).execute().data
+        if not batch_data:
+            break
+
+        for row in batch_data:
+            frequencies[row["keyword"]] += row["count"]
+        if len(batch_data) < page_size:
+            break
+        offset += page_size
+
+    return dict(frequencies)
+
+
+def frequencies_from_keywords(keyword_lists):
+    """
+    댓글별 keywords 배열에서 직접 빈도 계산 (인덱스가 아직 만들어지지 않았을 때 사용)
+    """
+    frequencies = Counter()
+    for keywords in keyword_lists:
+        if keywords is None:
+            continue
+        frequencies.update(word for word in keywords if len(word) > 1)
+    return dict(frequencies)
+
+
+def top_keywords(frequencies, n=10):
+    """빈도 dict 에서 상위 n개 [(키워드, 빈도)]"""
+    return Counter(frequencies).most_common(n)
+
+
+def render_wordcloud(frequencies, colormap, width=1200, height=400):
+    """빈도 dict 로 워드클라우드 이미지(PIL) 생성 (텍스트 재분석 없이 generate_from_frequencies 사용)"""
+    from wordcloud import WordCloud
+
+    wc = WordCloud(
+        font_path=find_font(),
+        width=width,
+        height=height,
+        background_color='white',
+        colormap=colormap
+    ).generate_from_frequencies(frequencies)
+    return wc.to_image()
@@ -0,0 +1,28 @@
+import os
+import sys
+
+
+def current_rss_mb():
+    """현재 RSS (MB, Linux /proc 기준, 없으면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError):
+        return None
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 측정할 수 없는 환경이면 None)"""
+    try:
+        import resource  # Unix 전용
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        # Windows: 최대 작업 집합(peak_wset)
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        return round(peak / (1024 * 1024), 1) if peak else None
+    # Linux 는 KB, macOS 는 byte 단위
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
@@ -34,6 +34,57 @@ CREATE TABLE daily_video_trends (
     PRIMARY KEY (keyword, upload_date, collected_date)
 );
 
+-- ========================================
+-- 키워드별 업로드 날짜 요약 테이블
+-- ========================================
+-- 목적: 가장 최근 수집 기준의 업로드 날짜별 합계 (team 프로젝트 daily_trends 와 같은 형식)
+-- 다중 키워드 수집(track_keywords) 시 daily_video_trends 와 함께 일괄 저장됩니다.
+
+CREATE TABLE IF NOT EXISTS daily_trends (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    date DATE NOT NULL,                 -- 영상이 업로드된 날짜
+    keyword TEXT NOT NULL,              -- 검색 키워드
+    video_count INT,                    -- 해당 날짜에 업로드된 영상 개수
+    total_views BIGINT,                 -- 총 조회수
+    total_likes BIGINT,                 -- 총 좋아요
+    total_comments BIGINT,              -- 총 댓글
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()),
+    UNIQUE(date, keyword)
+);
+
+-- ========================================
+-- 수집 날짜별 롤업 테이블
+-- ========================================
+-- 목적: 타임라인 화면(scripts/check_timeline.py, Opinion_Analysis 5_영상_트렌드 페이지)이
+--       daily_video_trends 전체를 읽어 수집 날짜별로 다시 합산하지 않도록
+--       (키워드, 수집 날짜) 단위 합계와 직전 수집 대비 증가량을 저장 시점에 미리 계산합니다.
+-- 갱신: TrendDatabase.save_trend_data / save_trend_data_bulk 가 저장 후 자동 갱신
+--       기존 데이터는 TrendDatabase.rebuild_rollup() (scripts/check_timeline.py --rebuild) 로 한 번 채움
+
+CREATE TABLE IF NOT EXISTS daily_video_trend_rollup (
+    keyword TEXT NOT NULL,
+    collected_date DATE NOT NULL,
+
+    upload_date_count INT DEFAULT 0,    -- 합산된 업로드 날짜 수
+    video_count INT DEFAULT 0,
+    total_views BIGINT DEFAULT 0,
+    total_likes BIGINT DEFAULT 0,
+    total_comments BIGINT DEFAULT 0,
+
+    -- 직전 수집 날짜(previous_collected_date) 대비 증가량 / 증가율 (%)
+    previous_collected_date DATE,
+    video_growth INT DEFAULT 0,
+    views_growth BIGINT DEFAULT 0,
+    likes_growth BIGINT DEFAULT 0,
+    comments_growth BIGINT DEFAULT 0,
+    views_growth_rate DECIMAL(10, 2) DEFAULT 0,
+    likes_growth_rate DECIMAL(10, 2) DEFAULT 0,
+    comments_growth_rate DECIMAL(10, 2) DEFAULT 0,
+
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT TIMEZONE('utc'::text, NOW()),
+    PRIMARY KEY (keyword, collected_date)
+);
+
 -- ========================================
 -- 인덱스 생성 (검색 속도 향상)
 -- ========================================
@@ -67,6 +118,11 @@ BEFORE UPDATE ON daily_video_trends
 FOR EACH ROW
 EXECUTE FUNCTION update_updated_at_column();
 
+CREATE TRIGGER update_daily_video_trend_rollup_updated_at
+BEFORE UPDATE ON daily_video_trend_rollup
+FOR EACH ROW
+EXECUTE FUNCTION update_updated_at_column();
+
 -- ========================================
 -- 샘플 쿼리 (참고용)
 -- ========================================
@@ -3,6 +3,7 @@
 YouTube 트렌드 통합 수집 스크립트
 - API 키 자동 전환 기능
 - 날짜 범위 지정 수집
+- 여러 키워드 한 번에 수집 (영상 통계 조회 공유)
 - 에러 처리 및 재시도
 """
 import sys
@@ -30,8 +31,8 @@ def main():
         
         tracker = AdvancedTrendTracker()
         
-        # 설정
-        keyword = "임성근 쉐프"
+        # 설정 (여러 키워드를 한 번에 수집: .env 의 TRACK_KEYWORDS="키워드1,키워드2" 로 변경 가능)
+        keywords = [k.strip() for k in os.getenv("TRACK_KEYWORDS", "임성근 쉐프").split(",") if k.strip()]
         
         # 수집 범위 설정
         print("📌 수집 범위를 선택하세요:")
@@ -63,13 +64,14 @@ def main():
         total_days = (end_date - start_date).days + 1
 
         print(f"\n📌 수집 설정:")
-        print(f"   - 키워드: {keyword}")
+        print(f"   - 키워드: {', '.join(keywords)} ({len(keywords)}개)")
         print(f"   - 수집 범위: {start_date} ~ {end_date}")
         print(f"   - 총 기간: {total_days}일")
-        # 일별 검색 (1~2페이지) + 통계 배치 조회
-        est_search = total_days * 2  # 일당 평균 1~2 페이지
-        est_stats = max(1, total_days * 3 // 50)  # 영상 수 추정 / 50
-        print(f"   - API 방식: 일별 검색 (누락 방지) + 배치 통계 조회")
+        # 적응형 구간 검색 (영상 50개당 약 1페이지) + 통계 배치 조회
+        est_videos = total_days * 3  # 일당 평균 영상 수 추정
+        est_search = max(1, est_videos // 50 + 1) * len(keywords)
+        est_stats = max(1, est_videos * len(keywords) // 50)  # 영상 수 추정 / 50 (키워드 간 중복 영상은 한 번만 조회)
+        print(f"   - API 방식: 적응형 구간 검색 (500개 제한 자동 회피) + 배치 통계 조회")
         print(f"   - API 예상 호출: 검색 ~{est_search}회 + 통계 ~{est_stats}회 = ~{est_search + est_stats}회\n")
         
         response = input("⚠️  계속 진행하시겠습니까? (y/n): ")
@@ -81,7 +83,7 @@ def main():
         print("💡 Tip: API 할당량 초과 시 자동으로 다음 키로 전환됩니다.\n")
         
         # 트렌드 추적 실행
-        tracker.track_date_range(keyword, start_date, end_date)
+        tracker.track_keywords(keywords, start_date, end_date)
         
         print("\n" + "="*60)
         print("✅ 수집 완료!")
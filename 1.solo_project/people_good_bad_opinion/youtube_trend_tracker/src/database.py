@@ -14,6 +14,10 @@ load_dotenv(dotenv_path=config_path)
 if sys.stdout.encoding != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# 수집 날짜별 롤업 테이블 (keyword, collected_date 단위 합계 + 직전 수집 대비 증가량)
+ROLLUP_TABLE = "daily_video_trend_rollup"
+ROLLUP_METRICS = ('video_count', 'total_views', 'total_likes', 'total_comments')
+
 class TrendDatabase:
     """YouTube 트렌드 데이터 관리 클래스"""
     
@@ -66,12 +70,246 @@ class TrendDatabase:
                   f"업로드: {trend_data['upload_date']} | "
                   f"수집: {trend_data['collected_date']} | "
                   f"조회수: {trend_data['total_views']:,}")
-            
+
+            self.refresh_rollup(trend_data['keyword'], data_to_insert['collected_date'])
             return response
         except Exception as e:
             print(f"[!] 저장 중 오류: {e}")
             return None
 
+    def save_trend_data_bulk(self, trend_rows, chunk_size=500):
+        """
+        여러 키워드/업로드 날짜의 일별 트렌드 데이터를 한 번에 저장
+
+        Args:
+            trend_rows (list): save_trend_data 와 같은 형식의 dict 리스트
+            chunk_size (int): 한 번의 upsert 요청에 담을 행 수
+
+        Returns:
+            int: 저장된 행 수
+        """
+        saved = self._upsert_bulk(
+            "daily_video_trends", trend_rows, "keyword,upload_date,collected_date", chunk_size
+        )
+
+        # 저장된 (키워드, 수집 날짜) 조합의 롤업 갱신
+        touched = {(row['keyword'], self._date_str(row['collected_date'])) for row in trend_rows}
+        for keyword, collected_date in sorted(touched):
+            self.refresh_rollup(keyword, collected_date)
+        return saved
+
+    def save_daily_trends_bulk(self, summary_rows, chunk_size=500):
+        """
+        키워드별 업로드 날짜 요약을 'daily_trends' 테이블에 한 번에 저장
+
+        Args:
+            summary_rows (list): {
+                'date': date, 'keyword': str, 'video_count': int,
+                'total_views': int, 'total_likes': int, 'total_comments': int
+            } 리스트
+
+        Returns:
+            int: 저장된 행 수
+        """
+        return self._upsert_bulk("daily_trends", summary_rows, "date,keyword", chunk_size)
+
+    def _upsert_bulk(self, table, rows, on_conflict, chunk_size):
+        saved = 0
+        for i in range(0, len(rows), chunk_size):
+            chunk = []
+            for row in rows[i:i+chunk_size]:
+                row = row.copy()
+                for col in ('date', 'upload_date', 'collected_date'):
+                    if isinstance(row.get(col), date):
+                        row[col] = row[col].isoformat()
+                chunk.append(row)
+            try:
+                self.supabase.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+                saved += len(chunk)
+            except Exception as e:
+                print(f"[!] {table} 일괄 저장 중 오류: {e}")
+        print(f"[+] {table} 일괄 저장 완료: {saved}/{len(rows)}건")
+        return saved
+
+    @staticmethod
+    def _date_str(value):
+        return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+    # ========================================
+    # 수집 날짜별 롤업 (daily_video_trend_rollup)
+    # ========================================
+
+    @staticmethod
+    def _rollup_growth(current, previous):
+        """직전 수집 롤업 대비 증가량 / 증가율 (tracker 의 calculate_growth 와 같은 계산)"""
+        growth = {}
+        for metric, name in (('video_count', 'video'), ('total_views', 'views'),
+                             ('total_likes', 'likes'), ('total_comments', 'comments')):
+            prev_value = previous[metric] if previous else None
+            diff = current[metric] - prev_value if prev_value is not None else 0
+            growth[f'{name}_growth'] = diff
+            if name != 'video':
+                growth[f'{name}_growth_rate'] = round(diff / prev_value * 100, 2) if prev_value else 0.0
+        growth['previous_collected_date'] = previous['collected_date'] if previous else None
+        return growth
+
+    def _get_adjacent_rollup(self, keyword, collected_date, before=True):
+        """collected_date 직전(before) / 직후 수집 날짜의 롤업 행"""
+        query = self.supabase.table(ROLLUP_TABLE).select("*").eq("keyword", keyword)
+        if before:
+            query = query.lt("collected_date", collected_date).order("collected_date", desc=True)
+        else:
+            query = query.gt("collected_date", collected_date).order("collected_date", desc=False)
+        response = query.limit(1).execute()
+        return response.data[0] if response.data else None
+
+    def refresh_rollup(self, keyword, collected_date):
+        """
+        (키워드, 수집 날짜) 롤업을 daily_video_trends 에서 다시 계산해 저장
+        다음 수집 날짜의 롤업이 이미 있으면 그 증가량도 다시 계산 (과거 날짜 재수집 대비)
+
+        Args:
+            keyword (str): 검색 키워드
+            collected_date (date | str): 수집 날짜
+
+        Returns:
+            dict or None: 저장된 롤업 행
+        """
+        collected_date = self._date_str(collected_date)
+        try:
+            rows = self.get_trends_by_collected_date(keyword, date.fromisoformat(collected_date))
+            if not rows:
+                return None
+
+            rollup = {'keyword': keyword, 'collected_date': collected_date, 'upload_date_count': len(rows)}
+            for metric in ROLLUP_METRICS:
+                rollup[metric] = sum(row.get(metric) or 0 for row in rows.values())
+            rollup.update(self._rollup_growth(rollup, self._get_adjacent_rollup(keyword, collected_date)))
+            self.supabase.table(ROLLUP_TABLE).upsert(rollup, on_conflict="keyword,collected_date").execute()
+
+            following = self._get_adjacent_rollup(keyword, collected_date, before=False)
+            if following:
+                following.update(self._rollup_growth(following, rollup))
+                following.pop('updated_at', None)
+                self.supabase.table(ROLLUP_TABLE).upsert(following, on_conflict="keyword,collected_date").execute()
+            return rollup
+        except Exception as e:
+            print(f"[!] 롤업 갱신 중 오류 ({keyword}, {collected_date}): {e}")
+            return None
+
+    def rebuild_rollup(self, keyword=None, page_size=1000):
+        """
+        daily_video_trends 전체를 읽어 롤업 테이블을 다시 만듦 (최초 도입 / 복구용)
+
+        Args:
+            keyword (str): 특정 키워드만 재구축 (None 이면 전체)
+
+        Returns:
+            int: 저장된 롤업 행 수
+        """
+        totals = {}
+        offset = 0
+        while True:
+            query = self.supabase.table("daily_video_trends").select(
+                "keyword, collected_date, " + ", ".join(ROLLUP_METRICS)
+            )
+            if keyword:
+                query = query.eq("keyword", keyword)
+            response = query.order("keyword").order("collected_date").order("upload_date").range(
+                offset, offset + page_size - 1
+            ).execute()
+
+            for row in response.data or []:
+                key = (row['keyword'], row['collected_date'])
+                rollup = totals.setdefault(key, {
+                    'keyword': row['keyword'], 'collected_date': row['collected_date'],
+                    'upload_date_count': 0, **{metric: 0 for metric in ROLLUP_METRICS}
+                })
+                rollup['upload_date_count'] += 1
+                for metric in ROLLUP_METRICS:
+                    rollup[metric] += row.get(metric) or 0
+            if not response.data or len(response.data) < page_size:
+                break
+            offset += page_size
+
+        # 키워드별로 수집 날짜 순서대로 증가량 계산
+        rollup_rows = []
+        previous = None
+        for key in sorted(totals):
+            rollup = totals[key]
+            if previous and previous['keyword'] != rollup['keyword']:
+                previous = None
+            rollup.update(self._rollup_growth(rollup, previous))
+            rollup_rows.append(rollup)
+            previous = rollup
+
+        return self._upsert_bulk(ROLLUP_TABLE, rollup_rows, "keyword,collected_date", 500)
+
+    def get_rollup(self, keyword=None, start_date=None, end_date=None, page_size=1000):
+        """
+        수집 날짜별 롤업 조회 (타임라인 화면용, 업로드 날짜 수와 무관하게 수집 날짜당 1행)
+
+        Args:
+            keyword (str): 검색 키워드 (None 이면 전체 키워드)
+            start_date / end_date (date | str): 수집 날짜 범위 (포함)
+
+        Returns:
+            list: 롤업 행 리스트 (키워드, 수집 날짜 오름차순)
+        """
+        rows = []
+        offset = 0
+        try:
+            while True:
+                query = self.supabase.table(ROLLUP_TABLE).select("*")
+                if keyword:
+                    query = query.eq("keyword", keyword)
+                if start_date:
+                    query = query.gte("collected_date", self._date_str(start_date))
+                if end_date:
+                    query = query.lte("collected_date", self._date_str(end_date))
+                response = query.order("keyword").order("collected_date").range(
+                    offset, offset + page_size - 1
+                ).execute()
+                rows.extend(response.data or [])
+                if not response.data or len(response.data) < page_size:
+                    break
+                offset += page_size
+        except Exception as e:
+            print(f"[!] 롤업 조회 중 오류: {e}")
+        return rows
+
+    def get_trends_by_collected_date(self, keyword, collected_date):
+        """
+        특정 수집 날짜의 키워드 데이터 전체를 업로드 날짜별로 조회
+        (업로드 날짜마다 get_previous_day_data / get_current_data 를 호출하는 대신 한 번에 조회)
+
+        Args:
+            keyword (str): 검색 키워드
+            collected_date (date): 수집 날짜
+
+        Returns:
+            dict: {'YYYY-MM-DD'(업로드 날짜): row}
+        """
+        rows = {}
+        page_size = 1000
+        offset = 0
+        try:
+            while True:
+                response = self.supabase.table("daily_video_trends").select("*").eq(
+                    "keyword", keyword
+                ).eq(
+                    "collected_date", collected_date.isoformat()
+                ).range(offset, offset + page_size - 1).execute()
+
+                for row in response.data or []:
+                    rows[row['upload_date']] = row
+                if not response.data or len(response.data) < page_size:
+                    break
+                offset += page_size
+        except Exception as e:
+            print(f"[!] 수집 날짜별 데이터 조회 중 오류: {e}")
+        return rows
+
     def get_previous_day_data(self, keyword, upload_date, collected_date):
         """
         전날 수집한 같은 업로드 날짜의 데이터 조회
@@ -0,0 +1,183 @@
+"""
+YouTube 검색 결과 상한(약 500개)을 피하기 위한 적응형 시간 분할기
+
+search.list 는 한 검색 조건당 최대 약 500개(50개 x 10페이지)까지만 돌려주기 때문에
+인기 키워드는 고정 30일/6시간 구간으로 나눠도 결과가 조용히 잘립니다.
+
+동작 방식:
+  1. 구간의 첫 페이지를 조회 (이 호출 결과는 버리지 않고 그대로 사용)
+  2. 다음 페이지가 없으면 그 구간은 끝 (한산한 기간은 큰 구간 하나로 처리 = 구간 병합)
+  3. pageInfo.totalResults 와 첫 페이지 영상들의 업로드 시각 분포로 영상 밀도를 추정
+  4. 남은 구간의 예상 영상 수가 상한 안쪽이면 그대로 페이징,
+     넘으면 상한 안에 들어오도록 구간 개수를 미리 계산해 분할 후 재귀 처리
+"""
+import math
+from datetime import datetime, timedelta, timezone
+
+# YouTube 검색 API 한 조건당 실제로 받을 수 있는 최대 결과 수
+SEARCH_RESULT_CAP = 500
+PAGE_SIZE = 50
+
+
+def to_rfc3339(dt):
+    """datetime -> YouTube API 시간 문자열 (2024-01-01T00:00:00Z)"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def parse_published_at(value):
+    """'2024-01-01T12:34:56Z' -> datetime (UTC)"""
+    return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc)
+
+
+class AdaptiveTimeSlicer:
+    """
+    영상 밀도에 맞춰 검색 구간 크기를 정하는 분할기
+
+    Args:
+        search_page (callable): search_page(start_str, end_str, page_token) -> search.list 응답(dict)
+                                (API 키 전환 등 예외 처리는 호출하는 쪽에서 담당)
+        result_cap (int): 한 구간에서 받을 수 있는 최대 결과 수
+        safety_ratio (float): 추정 오차를 고려해 상한의 몇 %까지만 채울지
+        min_window (timedelta): 더 이상 나누지 않는 최소 구간 길이
+    """
+
+    def __init__(self, search_page, result_cap=SEARCH_RESULT_CAP, safety_ratio=0.8,
+                 min_window=timedelta(minutes=10)):
+        self.search_page = search_page
+        self.result_cap = result_cap
+        self.target_per_window = max(PAGE_SIZE, int(result_cap * safety_ratio))
+        self.min_window = min_window
+
+        self.search_calls = 0
+        self.windows = []           # 실제로 끝까지 조회한 구간 목록 [(start, end, 영상 수)]
+        self.truncated_windows = []  # 최소 구간인데도 상한에 걸린 구간
+        self.error = None           # keep_partial=True 로 수집하다 중단된 경우의 예외
+
+    def collect(self, start_time, end_time, keep_partial=False):
+        """
+        start_time ~ end_time 사이 검색 결과 전체 수집
+
+        Args:
+            keep_partial (bool): True 면 도중에 예외(할당량 초과 등)가 나도 다시 던지지 않고
+                                 그때까지 받은 결과를 반환 (예외는 self.error 에 보관)
+
+        Returns:
+            list: search.list 의 items (videoId 기준 중복 제거)
+        """
+        self.error = None
+        items = {}
+        try:
+            self._collect_window(start_time, end_time, items)
+        except Exception as e:
+            if not keep_partial:
+                raise
+            self.error = e
+        return list(items.values())
+
+    def _fetch(self, start_time, end_time, page_token=None):
+        self.search_calls += 1
+        return self.search_page(to_rfc3339(start_time), to_rfc3339(end_time), page_token)
+
+    def _collect_window(self, start_time, end_time, items):
+        if start_time >= end_time:
+            return
+
+        first = self._fetch(start_time, end_time)
+        page_items = [it for it in first.get("items", []) if it.get("id", {}).get("videoId")]
+        self._add_items(page_items, items)
+
+        next_page_token = first.get("nextPageToken")
+        if not next_page_token or not page_items:
+            # 한 페이지로 끝나는 한산한 구간
+            self.windows.append((start_time, end_time, len(page_items)))
+            return
+
+        estimate = self._estimate_count(first, page_items, start_time, end_time)
+        oldest = min(parse_published_at(it["snippet"]["publishedAt"]) for it in page_items)
+        fetched = len(page_items)
+
+        # 상한 안쪽이면 분할 없이 이어서 페이징
+        if estimate <= self.target_per_window or end_time - start_time < self.min_window * 2:
+            more, oldest, has_more = self._page_through(start_time, end_time, next_page_token, items)
+            fetched += more
+            if not has_more:
+                self.windows.append((start_time, end_time, fetched))
+                return
+            if end_time - start_time < self.min_window * 2:
+                self.windows.append((start_time, end_time, fetched))
+                self.truncated_windows.append((start_time, end_time))
+                print(f"  ⚠️  {to_rfc3339(start_time)} ~ {to_rfc3339(end_time)} 구간이 최소 크기인데도 "
+                      f"검색 상한({self.result_cap}개)에 도달했습니다. 일부 누락 가능")
+                return
+            # 추정이 빗나가 상한에 걸린 경우: 남은 구간은 받은 밀도로 다시 추정
+            estimate = fetched + fetched * (oldest - start_time).total_seconds() / max(
+                (end_time - oldest).total_seconds(), 1)
+
+        # 지금까지 받은 페이지(최신순)가 이미 [가장 오래된 영상 시각, end_time] 을 덮고 있으므로
+        # 나머지 [start_time, 가장 오래된 영상 시각] 만 나눠서 조회
+        remain_end = min(end_time, oldest + timedelta(seconds=1))
+        remain_estimate = max(estimate - fetched, 1)
+        for sub_start, sub_end in self.split(start_time, remain_end, remain_estimate):
+            self._collect_window(sub_start, sub_end, items)
+
+    def _page_through(self, start_time, end_time, page_token, items):
+        """
+        다음 페이지들을 이어서 조회
+
+        Returns:
+            tuple: (추가로 받은 영상 수, 가장 오래된 영상 시각, 상한에 걸려 남은 결과가 있는지)
+        """
+        fetched = 0
+        oldest = end_time
+        while page_token:
+            response = self._fetch(start_time, end_time, page_token)
+            page_items = [it for it in response.get("items", []) if it.get("id", {}).get("videoId")]
+            if not page_items:
+                return fetched, oldest, False
+            self._add_items(page_items, items)
+            fetched += len(page_items)
+            oldest = min([oldest] + [parse_published_at(it["snippet"]["publishedAt"]) for it in page_items])
+            page_token = response.get("nextPageToken")
+        # YouTube는 상한에 도달하면 nextPageToken 없이 결과를 끊어버림
+        return fetched, oldest, fetched + PAGE_SIZE >= self.result_cap
+
+    def _estimate_count(self, response, page_items, start_time, end_time):
+        """
+        totalResults 와 첫 페이지 시각 분포로 구간 영상 수 추정
+
+        totalResults 는 과대 추정되는 경우가 많아 상한값으로만 사용하고,
+        실제 분할 개수는 첫 페이지가 덮은 시간 대비 영상 수(밀도)로 정함
+        """
+        total_results = response.get("pageInfo", {}).get("totalResults", 0)
+
+        density_estimate = 0
+        published = [parse_published_at(it["snippet"]["publishedAt"]) for it in page_items]
+        covered = (end_time - min(published)).total_seconds()
+        if covered > 0:
+            # 첫 페이지가 덮은 시간 대비 영상 수로 전체 구간 환산
+            density_estimate = int(len(page_items) * (end_time - start_time).total_seconds() / covered)
+        else:
+            # 첫 페이지 영상이 전부 같은 시각 -> 매우 밀집된 구간
+            density_estimate = self.result_cap * 2
+
+        if total_results > 0:
+            return min(total_results, density_estimate)
+        return density_estimate
+
+    def split(self, start_time, end_time, estimate):
+        """예상 영상 수 기준으로 구간 개수를 미리 정해 균등 분할"""
+        count = max(2, math.ceil(estimate / self.target_per_window))
+        span = end_time - start_time
+        max_count = max(1, int(span / self.min_window))
+        count = min(count, max_count)
+
+        step = span / count
+        bounds = [start_time + step * i for i in range(count)] + [end_time]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    @staticmethod
+    def _add_items(page_items, items):
+        for item in page_items:
+            items.setdefault(item["id"]["videoId"], item)
@@ -7,6 +7,7 @@ import sys
 import io
 from pathlib import Path
 from src.database import TrendDatabase
+from src.time_slicer import AdaptiveTimeSlicer
 import time
 
 # 환경 설정 - config/.env 파일 로드
@@ -36,6 +37,7 @@ class AdvancedTrendTracker:
         
         self.current_key_index = 0
         self.exhausted_keys = set() # 실패한 키 인덱스 추적
+        self.video_stats_cache = {} # video_id -> 통계 (실행 단위로 키워드 간 공유)
         self.youtube = build("youtube", "v3", developerKey=self.api_keys[self.current_key_index])
         self.db = TrendDatabase()
         
@@ -60,32 +62,22 @@ class AdvancedTrendTracker:
         
         return False
 
-    def search_videos_by_time_range(self, keyword, start_time, end_time, retry_count=0, depth=0):
+    def _search_page(self, keyword, start_str, end_str, page_token=None):
         """
-        특정 시간 범위에 업로드된 영상 검색 (재귀적 시간 분할 포함)
-        
+        검색 API 한 페이지 호출 (할당량 초과 시 API 키 자동 전환 후 재시도)
+
         Args:
             keyword (str): 검색 키워드
-            start_time (datetime): 시작 시간 (UTC)
-            end_time (datetime): 종료 시간 (UTC)
-            retry_count (int): 재시도 횟수
-            depth (int): 재귀 깊이
-            
+            start_str (str): 시작 시간 (RFC3339, UTC)
+            end_str (str): 종료 시간 (RFC3339, UTC)
+            page_token (str): 다음 페이지 토큰
+
         Returns:
-            list: 영상 정보 리스트
+            dict: search.list 응답
         """
-        start_str = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-        end_str = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
-        
-        videos = []
-        next_page_token = None
-        page_count = 0
-        max_pages = 20  # 최대 20페이지 (1000개 제한)
-        
-        try:
-            while True:
-                # 검색 API 호출
-                search_response = self.youtube.search().list(
+        while True:
+            try:
+                response = self.youtube.search().list(
                     q=keyword,
                     part="id,snippet",
                     publishedAfter=start_str,
@@ -95,147 +87,102 @@ class AdvancedTrendTracker:
                     order="date",
                     regionCode="KR",
                     relevanceLanguage="ko",
-                    pageToken=next_page_token
+                    pageToken=page_token
                 ).execute()
+                time.sleep(0.3)  # API 호출 제한 방지
+                return response
+            except Exception as e:
+                if "quotaExceeded" in str(e):
+                    print(f"[!] API 할당량 초과 (키 #{self.current_key_index + 1})")
+                    if not self.switch_api_key():
+                        print(f"[!] 모든 API 키의 할당량이 소진되었습니다.")
+                        raise
+                    print(f"[↻] 재시도 중...")
+                    time.sleep(1)
+                    continue
+                raise
 
-                items = search_response.get("items", [])
-                if not items:
-                    break
+    def search_video_items(self, keyword, start_time, end_time):
+        """
+        시간 범위의 검색 결과 전체 수집 (적응형 시간 분할)
 
-                # 영상 ID 추출
-                video_ids = [item["id"]["videoId"] for item in items]
-                
-                # 상세 정보 조회
-                stats_response = self.youtube.videos().list(
-                    part="statistics,snippet",
-                    id=",".join(video_ids)
-                ).execute()
+        영상 밀도에 맞춰 구간 크기를 미리 정하므로 500개 검색 상한에 걸리지 않고,
+        한산한 기간은 큰 구간 하나로 조회해 검색 호출 수를 최소화합니다.
 
-                # 통계 수집
-                for item in stats_response.get("items", []):
-                    stats = item["statistics"]
-                    videos.append({
-                        "video_id": item["id"],
-                        "title": item["snippet"]["title"],
-                        "views": int(stats.get("viewCount", 0)),
-                        "likes": int(stats.get("likeCount", 0)),
-                        "comments": int(stats.get("commentCount", 0))
-                    })
-
-                # 다음 페이지 확인
-                next_page_token = search_response.get("nextPageToken")
-                page_count += 1
-                
-                # 페이지 제한에 도달하면 시간 범위를 분할
-                if page_count >= max_pages and next_page_token:
-                    if depth < 3:  # 최대 3단계까지 분할 (6시간 -> 3시간 -> 1.5시간)
-                        print(f"  ⚠️  결과가 많아 시간 범위를 분할합니다 (깊이: {depth+1})")
-                        
-                        # 시간 범위를 반으로 분할
-                        mid_time = start_time + (end_time - start_time) / 2
-                        
-                        # 전반부 검색
-                        videos_first = self.search_videos_by_time_range(
-                            keyword, start_time, mid_time, retry_count, depth + 1
-                        )
-                        time.sleep(0.5)
-                        
-                        # 후반부 검색
-                        videos_second = self.search_videos_by_time_range(
-                            keyword, mid_time, end_time, retry_count, depth + 1
-                        )
-                        
-                        # 중복 제거 후 병합
-                        all_videos = videos + videos_first + videos_second
-                        seen_ids = set()
-                        unique_videos = []
-                        for v in all_videos:
-                            if v['video_id'] not in seen_ids:
-                                seen_ids.add(v['video_id'])
-                                unique_videos.append(v)
-                        
-                        return unique_videos
-                    else:
-                        print(f"  ⚠️  최대 분할 깊이 도달, 일부 영상이 누락될 수 있습니다")
-                        break
-                
-                if not next_page_token:
-                    break
-                    
-                # API 호출 제한 방지
-                time.sleep(0.5)
-                
+        Args:
+            keyword (str): 검색 키워드
+            start_time (datetime): 시작 시간 (UTC)
+            end_time (datetime): 종료 시간 (UTC)
+
+        Returns:
+            tuple: (search.list items 리스트, 검색 API 호출 수)
+        """
+        slicer = AdaptiveTimeSlicer(
+            lambda start_str, end_str, page_token: self._search_page(keyword, start_str, end_str, page_token)
+        )
+        items = slicer.collect(start_time, end_time)
+        if len(slicer.windows) > 1:
+            print(f"  → 검색 구간 {len(slicer.windows)}개로 자동 분할 (API {slicer.search_calls}회)")
+        return items, slicer.search_calls
+
+    def search_videos_by_time_range(self, keyword, start_time, end_time):
+        """
+        특정 시간 범위에 업로드된 영상 검색 (적응형 시간 분할 + 배치 통계 조회)
+        
+        Args:
+            keyword (str): 검색 키워드
+            start_time (datetime): 시작 시간 (UTC)
+            end_time (datetime): 종료 시간 (UTC)
+            
+        Returns:
+            list: 영상 정보 리스트
+        """
+        try:
+            items, _ = self.search_video_items(keyword, start_time, end_time)
         except Exception as e:
             if "quotaExceeded" in str(e):
-                print(f"[!] API 할당량 초과 (키 #{self.current_key_index + 1})")
-                
-                # API 키 전환 시도
-                if retry_count < len(self.api_keys) - 1:
-                    if self.switch_api_key():
-                        print(f"[↻] 재시도 중...")
-                        time.sleep(1)
-                        return self.search_videos_by_time_range(
-                            keyword, start_time, end_time, retry_count + 1, depth
-                        )
-                
-                print(f"[!] 모든 API 키의 할당량이 소진되었습니다.")
                 raise
-            else:
-                print(f"[!] 검색 중 오류: {e}")
-        
+            print(f"[!] 검색 중 오류: {e}")
+            return []
+
+        video_ids = [item["id"]["videoId"] for item in items]
+        videos = []
+
+        # 상세 정보 조회 (50개씩)
+        for i in range(0, len(video_ids), 50):
+            stats_response = self.youtube.videos().list(
+                part="statistics,snippet",
+                id=",".join(video_ids[i:i+50])
+            ).execute()
+
+            for item in stats_response.get("items", []):
+                stats = item["statistics"]
+                videos.append({
+                    "video_id": item["id"],
+                    "title": item["snippet"]["title"],
+                    "views": int(stats.get("viewCount", 0)),
+                    "likes": int(stats.get("likeCount", 0)),
+                    "comments": int(stats.get("commentCount", 0))
+                })
+            time.sleep(0.3)
+
         return videos
 
-    def search_videos_by_upload_date(self, keyword, upload_date, retry_count=0):
+    def search_videos_by_upload_date(self, keyword, upload_date):
         """
-        특정 날짜에 업로드된 영상 검색 (6시간 단위로 분할)
+        특정 날짜에 업로드된 영상 검색
         
         Args:
             keyword (str): 검색 키워드
             upload_date (date): 업로드 날짜
-            retry_count (int): 재시도 횟수
             
         Returns:
             list: 영상 정보 리스트
         """
-        all_videos = []
-        
-        # 하루를 6시간씩 4개 구간으로 분할
-        time_ranges = [
-            (0, 6),   # 00:00 - 06:00
-            (6, 12),  # 06:00 - 12:00
-            (12, 18), # 12:00 - 18:00
-            (18, None)  # 18:00 - 다음날 00:00
-        ]
-        
-        for start_hour, end_hour in time_ranges:
-            start_time = datetime.combine(upload_date, datetime.min.time()).replace(
-                hour=start_hour, tzinfo=timezone.utc
-            )
-            
-            # 마지막 구간은 다음 날 00:00으로 설정
-            if end_hour is None:
-                end_time = datetime.combine(upload_date + timedelta(days=1), datetime.min.time()).replace(
-                    tzinfo=timezone.utc
-                )
-            else:
-                end_time = datetime.combine(upload_date, datetime.min.time()).replace(
-                    hour=end_hour, tzinfo=timezone.utc
-                )
-            
-            videos = self.search_videos_by_time_range(keyword, start_time, end_time, retry_count)
-            all_videos.extend(videos)
-            
-            time.sleep(0.3)  # 구간 사이 대기
-        
-        # 중복 제거
-        seen_ids = set()
-        unique_videos = []
-        for v in all_videos:
-            if v['video_id'] not in seen_ids:
-                seen_ids.add(v['video_id'])
-                unique_videos.append(v)
-        
-        return unique_videos
+        start_time = datetime.combine(upload_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+        end_time = start_time + timedelta(days=1) - timedelta(seconds=1)
+
+        return self.search_videos_by_time_range(keyword, start_time, end_time)
 
     def calculate_growth(self, current_stats, previous_stats):
         """
@@ -276,18 +223,83 @@ class AdvancedTrendTracker:
             'comments_growth_rate': round(comments_growth_rate, 2)
         }
 
+    def fetch_video_stats(self, video_ids):
+        """
+        영상 통계 일괄 조회 (실행 단위 캐시 사용)
+
+        이미 조회한 영상은 캐시에서 꺼내고, 처음 보는 영상만 50개씩 videos.list 로 조회합니다.
+        여러 키워드에 같은 영상이 걸려도 통계는 한 번만 조회됩니다.
+
+        Args:
+            video_ids (list): 영상 ID 리스트
+
+        Returns:
+            int: 통계 조회 API 호출 수
+        """
+        missing_ids = [vid for vid in dict.fromkeys(video_ids) if vid not in self.video_stats_cache]
+        call_count = 0
+        i = 0
+
+        while i < len(missing_ids):
+            batch_ids = missing_ids[i:i+50]
+
+            try:
+                stats_response = self.youtube.videos().list(
+                    part="statistics",
+                    id=",".join(batch_ids)
+                ).execute()
+                call_count += 1
+
+                for item in stats_response.get("items", []):
+                    stats = item["statistics"]
+                    self.video_stats_cache[item["id"]] = {
+                        "views": int(stats.get("viewCount", 0)),
+                        "likes": int(stats.get("likeCount", 0)),
+                        "comments": int(stats.get("commentCount", 0))
+                    }
+
+            except Exception as e:
+                if "quotaExceeded" in str(e):
+                    print(f"[!] API 할당량 초과 (키 #{self.current_key_index + 1})")
+                    if not self.switch_api_key():
+                        print(f"[!] 모든 API 키의 할당량이 소진되었습니다.")
+                        raise
+                    continue
+                print(f"  → 통계 조회 오류: {e}")
+
+            i += 50
+            print(f"  → {min(i, len(missing_ids))}/{len(missing_ids)} 처리 완료")
+            time.sleep(0.3)
+
+        return call_count
+
     def track_date_range(self, keyword, start_date, end_date):
         """
-        특정 날짜 범위의 영상들의 현재 통계 수집 및 저장
+        특정 날짜 범위의 영상들의 현재 통계 수집 및 저장 (단일 키워드)
+
+        Args:
+            keyword (str): 검색 키워드
+            start_date (date): 시작 날짜 (포함)
+            end_date (date): 종료 날짜 (포함)
+        """
+        self.track_keywords([keyword], start_date, end_date)
+
+    def track_keywords(self, keywords, start_date, end_date):
+        """
+        여러 키워드의 날짜 범위 영상 통계를 한 번에 수집 및 저장
 
         최적화 방식:
-          1단계: 일별 루프로 검색 (6시간 분할/재귀 없이 단순 페이징)
-                 → 일별 40~60개 영상도 누락 없이 수집
-          2단계: 전체 영상 ID를 50개씩 배치로 통계 조회
-          3단계: 업로드 날짜별 집계 후 DB 저장
+          1단계: 키워드별로 전체 기간을 적응형 시간 분할로 검색
+                 → 영상 밀도에 맞춰 구간을 나눠 500개 검색 상한에서도 누락 없이 수집
+          2단계: 모든 키워드의 영상 ID를 합쳐 중복 제거 후 50개씩 배치로 통계 조회
+                 → 여러 키워드에 걸친 영상도 통계는 한 번만 조회 (실행 단위 캐시)
+          3단계: 키워드 x 업로드 날짜별 집계 후 daily_video_trends / daily_trends 일괄 저장
+
+        도중에 할당량 소진 등으로 검색 / 통계 조회가 실패하면, 그때까지 검색을 마친 키워드는
+        2~3단계를 끝까지 진행해 저장한 뒤 예외를 다시 발생시킵니다 (이미 쓴 검색 할당량 보존).
 
         Args:
-            keyword (str): 검색 키워드
+            keywords (list): 검색 키워드 리스트
             start_date (date): 시작 날짜 (포함)
             end_date (date): 종료 날짜 (포함)
         """
@@ -302,218 +314,194 @@ class AdvancedTrendTracker:
 
         print(f"\n{'='*60}")
         print(f"[*] 트렌드 추적 시작 (최적화 모드)")
-        print(f"    키워드: {keyword}")
+        print(f"    키워드: {', '.join(keywords)}")
         print(f"    수집 날짜: {collected_date}")
         print(f"    수집 범위: {start_date} ~ {end_date} ({total_days}일)")
         print(f"    사용 가능한 API 키: {len(self.api_keys)}개")
         print(f"{'='*60}\n")
 
-        # ── Step 1: 일별 루프로 검색 (단순 페이징만, 6시간 분할 없음) ──
-        #   일별 40~60개 영상 → 페이지 1~2회면 충분 (500개 제한 안전)
-        print("[1/3] 일별 영상 목록 검색 중...")
+        # ── Step 1: 키워드별로 전체 기간을 적응형 시간 분할로 검색 ──
+        #   한산한 기간은 큰 구간 하나로, 영상이 몰린 기간만 잘게 나눠 500개 제한 회피
+        print("[1/3] 영상 목록 검색 중...")
 
-        all_video_ids = []
-        video_publish_dates = {}  # video_id -> "YYYY-MM-DD"
+        range_start = datetime.combine(start_date, datetime.min.time()).replace(tzinfo=timezone.utc)
+        range_end = datetime.combine(end_date + timedelta(days=1), datetime.min.time()).replace(
+            tzinfo=timezone.utc
+        ) - timedelta(seconds=1)
 
-        current_date = start_date
-        day_num = 1
+        keyword_videos = {}  # keyword -> {video_id: "YYYY-MM-DD"}
+        pending_error = None  # 수집을 중단시킨 예외 (저장까지 마친 뒤 다시 발생)
 
-        while current_date <= end_date:
-            day_start_str = datetime.combine(current_date, datetime.min.time()).replace(
-                tzinfo=timezone.utc
-            ).strftime('%Y-%m-%dT%H:%M:%SZ')
-            day_end_str = (datetime.combine(current_date + timedelta(days=1), datetime.min.time()).replace(
-                tzinfo=timezone.utc
-            ) - timedelta(seconds=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        for index, keyword in enumerate(keywords):
+            try:
+                items, search_calls = self.search_video_items(keyword, range_start, range_end)
+            except Exception as e:
+                if "quotaExceeded" in str(e):
+                    print(f"[!] '{keyword}' {start_date}부터 내일 다시 실행하세요.")
+                print(f"[!] 검색 중단: {', '.join(keywords[index:])} 미수집 "
+                      f"(검색을 마친 {len(keyword_videos)}개 키워드는 계속 저장)")
+                pending_error = e
+                break
+            api_call_count += search_calls
 
-            next_page_token = None
-            day_count = 0
+            video_publish_dates = {}  # video_id -> "YYYY-MM-DD"
+            day_counts = defaultdict(int)
 
-            while True:
-                try:
-                    search_response = self.youtube.search().list(
-                        q=keyword,
-                        part="id,snippet",
-                        publishedAfter=day_start_str,
-                        publishedBefore=day_end_str,
-                        maxResults=50,
-                        type="video",
-                        order="date",
-                        regionCode="KR",
-                        relevanceLanguage="ko",
-                        pageToken=next_page_token
-                    ).execute()
-                    api_call_count += 1
-
-                    items = search_response.get("items", [])
-                    if not items:
-                        break
-
-                    for item in items:
-                        vid = item["id"]["videoId"]
-                        published = item["snippet"]["publishedAt"][:10]
-                        if vid not in video_publish_dates:
-                            all_video_ids.append(vid)
-                            video_publish_dates[vid] = published
-                            day_count += 1
-
-                    next_page_token = search_response.get("nextPageToken")
-                    if not next_page_token:
-                        break
-
-                    time.sleep(0.3)
-
-                except Exception as e:
-                    if "quotaExceeded" in str(e):
-                        print(f"[!] API 할당량 초과 (키 #{self.current_key_index + 1})")
-                        if not self.switch_api_key():
-                            print(f"[!] 모든 API 키의 할당량이 소진되었습니다.")
-                            print(f"[!] {current_date}부터 내일 다시 실행하세요.")
-                            raise
-                        continue
-                    raise
+            # 최신순 결과를 업로드 시각 기준으로 정렬해 일별 개수 집계
+            for item in sorted(items, key=lambda it: it["snippet"]["publishedAt"]):
+                published = item["snippet"]["publishedAt"][:10]
+                video_publish_dates[item["id"]["videoId"]] = published
+                day_counts[published] += 1
+
+            keyword_videos[keyword] = video_publish_dates
 
-            if day_count > 0:
-                print(f"  [{day_num}/{total_days}] {current_date}: {day_count}개 영상")
-            else:
-                print(f"  [{day_num}/{total_days}] {current_date}: 영상 없음")
+            print(f"  [{keyword}] 총 {len(video_publish_dates)}개 영상 (API {search_calls}회)")
+            current_date = start_date
+            day_num = 1
+
+            while current_date <= end_date:
+                day_count = day_counts.get(current_date.isoformat(), 0)
+                if day_count > 0:
+                    print(f"  [{day_num}/{total_days}] {current_date}: {day_count}개 영상")
+                else:
+                    print(f"  [{day_num}/{total_days}] {current_date}: 영상 없음")
 
-            current_date += timedelta(days=1)
-            day_num += 1
-            time.sleep(0.2)
+                current_date += timedelta(days=1)
+                day_num += 1
 
-        print(f"  ✓ 검색 완료: 총 {len(all_video_ids)}개 영상 (API {api_call_count}회)")
+        all_video_ids = list(dict.fromkeys(
+            vid for video_publish_dates in keyword_videos.values() for vid in video_publish_dates
+        ))
+        total_hits = sum(len(v) for v in keyword_videos.values())
+        print(f"  ✓ 검색 완료: 총 {len(all_video_ids)}개 영상 "
+              f"(키워드 중복 {total_hits - len(all_video_ids)}개 제외, API {api_call_count}회)")
 
         if not all_video_ids:
             print("[!] 검색 결과가 없습니다.")
+            if pending_error is not None:
+                raise pending_error
             return
 
-        # ── Step 2: 전체 영상 ID를 배치로 통계 조회 (50개씩) ──
+        # ── Step 2: 전체 영상 ID를 배치로 통계 조회 (50개씩, 캐시된 영상 제외) ──
         print(f"\n[2/3] 영상 통계 일괄 조회 중 ({len(all_video_ids)}개)...")
 
-        all_videos = []
-        stats_call_count = 0
-
-        for i in range(0, len(all_video_ids), 50):
-            batch_ids = all_video_ids[i:i+50]
-
-            try:
-                stats_response = self.youtube.videos().list(
-                    part="statistics",
-                    id=",".join(batch_ids)
-                ).execute()
-                api_call_count += 1
-                stats_call_count += 1
-
-                for item in stats_response.get("items", []):
-                    stats = item["statistics"]
-                    vid = item["id"]
-                    all_videos.append({
-                        "video_id": vid,
-                        "upload_date": video_publish_dates.get(vid, "unknown"),
-                        "views": int(stats.get("viewCount", 0)),
-                        "likes": int(stats.get("likeCount", 0)),
-                        "comments": int(stats.get("commentCount", 0))
-                    })
-
-            except Exception as e:
-                if "quotaExceeded" in str(e):
-                    print(f"[!] API 할당량 초과 (키 #{self.current_key_index + 1})")
-                    if not self.switch_api_key():
-                        print(f"[!] 모든 API 키의 할당량이 소진되었습니다.")
-                        raise
-                    continue
-                print(f"  → 통계 조회 오류: {e}")
-
-            print(f"  → {min(i+50, len(all_video_ids))}/{len(all_video_ids)} 처리 완료")
-            time.sleep(0.3)
-
-        print(f"  ✓ 통계 조회 완료 (API {stats_call_count}회)")
+        try:
+            stats_call_count = self.fetch_video_stats(all_video_ids)
+            api_call_count += stats_call_count
+            print(f"  ✓ 통계 조회 완료 (API {stats_call_count}회)")
+        except Exception as e:
+            # 통계를 받은 영상까지만 집계 (영상 수가 줄어든 날짜는 3단계에서 기존 데이터 유지)
+            cached = sum(1 for vid in all_video_ids if vid in self.video_stats_cache)
+            print(f"[!] 통계 조회 중단: {cached}/{len(all_video_ids)}개 영상만 집계합니다.")
+            pending_error = pending_error or e
 
-        # ── Step 3: 업로드 날짜별 집계 및 저장 ──
+        # ── Step 3: 키워드 x 업로드 날짜별 집계 및 일괄 저장 ──
         print(f"\n[3/3] 날짜별 집계 및 저장 중...")
 
-        date_groups = defaultdict(list)
-        for video in all_videos:
-            date_groups[video['upload_date']].append(video)
-
-        success_count = 0
+        previous_date = collected_date - timedelta(days=1)
+        trend_rows = []
+        summary_rows = []
         error_count = 0
+        found_count = 0
 
-        for upload_date_str in sorted(date_groups.keys()):
-            videos = date_groups[upload_date_str]
+        for keyword, video_publish_dates in keyword_videos.items():
+            date_groups = defaultdict(list)
+            for vid, upload_date_str in video_publish_dates.items():
+                stats = self.video_stats_cache.get(vid)
+                if stats:
+                    date_groups[upload_date_str].append(stats)
+                    found_count += 1
 
-            try:
-                upload_dt = date.fromisoformat(upload_date_str)
-            except ValueError:
-                print(f"  → 날짜 파싱 오류: {upload_date_str}, 건너뜀")
-                error_count += 1
-                continue
-
-            current_stats = {
-                'keyword': keyword,
-                'upload_date': upload_dt,
-                'collected_date': collected_date,
-                'video_count': len(videos),
-                'total_views': sum(v['views'] for v in videos),
-                'total_likes': sum(v['likes'] for v in videos),
-                'total_comments': sum(v['comments'] for v in videos)
-            }
-
-            # 전날 데이터 조회
-            previous_data = self.db.get_previous_day_data(
-                keyword, upload_dt, collected_date
-            )
+            # 전날/오늘 데이터를 업로드 날짜마다 조회하지 않고 키워드당 한 번에 조회
+            previous_rows = self.db.get_trends_by_collected_date(keyword, previous_date)
+            existing_rows = self.db.get_trends_by_collected_date(keyword, collected_date)
 
-            # 증가량 계산
-            growth_data = self.calculate_growth(current_stats, previous_data)
-            current_stats.update(growth_data)
+            for upload_date_str in sorted(date_groups.keys()):
+                videos = date_groups[upload_date_str]
 
-            # DB 저장 (기존 데이터와 video_count 비교)
-            existing_data = self.db.get_current_data(keyword, upload_dt, collected_date)
-            
-            if existing_data:
-                old_count = existing_data.get('video_count', 0)
-                if old_count > current_stats['video_count']:
-                    print(f"  → [{upload_date_str}] 건너뜀: 기존 데이터의 영상 수({old_count}개)가 현재({current_stats['video_count']}개)보다 많음")
+                try:
+                    upload_dt = date.fromisoformat(upload_date_str)
+                except ValueError:
+                    print(f"  → 날짜 파싱 오류: {upload_date_str}, 건너뜀")
+                    error_count += 1
                     continue
-                else:
-                    print(f"  → [{upload_date_str}] 업데이트: 기존({old_count}개) -> 현재({current_stats['video_count']}개)")
 
-            # DB 저장
-            self.db.save_trend_data(current_stats)
-            success_count += 1
+                current_stats = {
+                    'keyword': keyword,
+                    'upload_date': upload_dt,
+                    'collected_date': collected_date,
+                    'video_count': len(videos),
+                    'total_views': sum(v['views'] for v in videos),
+                    'total_likes': sum(v['likes'] for v in videos),
+                    'total_comments': sum(v['comments'] for v in videos)
+                }
+
+                # 증가량 계산
+                previous_data = previous_rows.get(upload_date_str)
+                growth_data = self.calculate_growth(current_stats, previous_data)
+                current_stats.update(growth_data)
+
+                # 기존 데이터와 video_count 비교
+                existing_data = existing_rows.get(upload_date_str)
+
+                if existing_data:
+                    old_count = existing_data.get('video_count', 0)
+                    if old_count > current_stats['video_count']:
+                        print(f"  → [{keyword} {upload_date_str}] 건너뜀: 기존 데이터의 영상 수({old_count}개)가 현재({current_stats['video_count']}개)보다 많음")
+                        continue
+                    else:
+                        print(f"  → [{keyword} {upload_date_str}] 업데이트: 기존({old_count}개) -> 현재({current_stats['video_count']}개)")
+
+                trend_rows.append(current_stats)
+                summary_rows.append({
+                    'date': upload_dt,
+                    'keyword': keyword,
+                    'video_count': current_stats['video_count'],
+                    'total_views': current_stats['total_views'],
+                    'total_likes': current_stats['total_likes'],
+                    'total_comments': current_stats['total_comments']
+                })
+
+                # 증가량 표시
+                if previous_data:
+                    print(f"  [{keyword} {upload_date_str}] 영상: {len(videos)}개 | "
+                          f"조회수: {current_stats['total_views']:,} "
+                          f"(+{growth_data['views_growth']:,}, {growth_data['views_growth_rate']:+.1f}%)")
+                else:
+                    print(f"  [{keyword} {upload_date_str}] 영상: {len(videos)}개 | "
+                          f"조회수: {current_stats['total_views']:,} (첫 수집)")
 
-            # 증가량 표시
-            if previous_data:
-                print(f"  [{upload_date_str}] 영상: {len(videos)}개 | "
-                      f"조회수: {current_stats['total_views']:,} "
-                      f"(+{growth_data['views_growth']:,}, {growth_data['views_growth_rate']:+.1f}%)")
-            else:
-                print(f"  [{upload_date_str}] 영상: {len(videos)}개 | "
-                      f"조회수: {current_stats['total_views']:,} (첫 수집)")
+        # DB 일괄 저장
+        success_count = self.db.save_trend_data_bulk(trend_rows)
+        self.db.save_daily_trends_bulk(summary_rows)
 
         print(f"\n{'='*60}")
-        print(f"[✓] 트렌드 추적 완료")
-        print(f"    검색된 영상: {len(all_videos)}개")
+        if pending_error is None:
+            print(f"[✓] 트렌드 추적 완료")
+        else:
+            print(f"[!] 트렌드 추적 일부 완료 (수집한 키워드: {', '.join(keyword_videos)})")
+        print(f"    검색된 영상: {found_count}개 (고유 {len(all_video_ids)}개)")
         print(f"    저장된 날짜: {success_count}일")
         print(f"    오류: {error_count}일")
         print(f"    총 API 호출: {api_call_count}회")
         print(f"{'='*60}\n")
 
+        if pending_error is not None:
+            raise pending_error
+
 def main():
     """메인 함수"""
     try:
         tracker = AdvancedTrendTracker()
         
         # 설정
-        keyword = "임성근 쉐프"
+        keywords = ["임성근 쉐프"]
         lookback_days = 30  # 기본값
         
         # 트렌드 추적 실행
         today = date.today()
         start_date = today - timedelta(days=lookback_days)
-        tracker.track_date_range(keyword, start_date, today - timedelta(days=1))
+        tracker.track_keywords(keywords, start_date, today - timedelta(days=1))
         
     except Exception as e:
         print(f"[!] 실행 중 오류: {e}")
@@ -12,7 +12,14 @@ class Settings:
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
     
     # Crawler Settings
-    HEADLESS = False  # Set to True for production
+    # ZIGZAG_HEADLESS=true for production (no browser window, images/fonts blocked)
+    HEADLESS = os.getenv("ZIGZAG_HEADLESS", "false").lower() in ("1", "true", "yes")
     TIMEOUT = 30000
+    CONCURRENCY = int(os.getenv("ZIGZAG_CONCURRENCY", "4"))  # product pages scraped in parallel
+    MAX_PRODUCTS = int(os.getenv("ZIGZAG_MAX_PRODUCTS", "20"))  # top-N products per category
+    MAX_REVIEWS = int(os.getenv("ZIGZAG_MAX_REVIEWS", "20"))  # reviews per product
+    # Read product / review JSON from XHR/GraphQL responses; DOM scraping is the fallback
+    CAPTURE = os.getenv("ZIGZAG_CAPTURE", "true").lower() in ("1", "true", "yes")
+    REQUEST_JITTER = float(os.getenv("ZIGZAG_REQUEST_JITTER", "0.5"))  # max random pause (s) per product
 
 settings = Settings()
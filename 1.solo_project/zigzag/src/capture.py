@@ -0,0 +1,236 @@
+import asyncio
+import json
+import re
+
+# Only XHR / fetch responses from these URLs are kept (Zigzag pages talk to a GraphQL / REST API)
+API_URL_KEYWORDS = ("graphql", "/api/")
+
+# Field names differ between API versions, so every field is looked up by a list of candidates
+NAME_KEYS = ("name", "product_name", "productName")
+BRAND_KEYS = ("shop_name", "shopName", "brand_name", "brandName", "store_name", "storeName")
+BRAND_PARENT_KEYS = ("shop", "store", "brand")
+PRICE_KEYS = ("final_price", "finalPrice", "discount_price", "discountPrice", "sales_price", "salesPrice", "price")
+REVIEW_COUNT_KEYS = ("review_count", "reviewCount", "total_review_count", "totalReviewCount")
+RATING_KEYS = ("review_score", "reviewScore", "rating_average", "ratingAverage", "average_rating", "averageRating")
+IMAGE_KEYS = ("image_url", "imageUrl", "main_image_url", "thumbnail_url", "thumbnailUrl")
+
+REVIEW_TEXT_KEYS = ("contents", "content", "review_text", "reviewText", "text", "body")
+REVIEW_RATING_KEYS = ("rating", "score", "review_score", "reviewScore")
+
+# Cursor pagination: request variable name -> where the next cursor is in the response
+CURSOR_VARIABLES = ("after", "cursor", "end_cursor", "next_cursor")
+NEXT_CURSOR_KEYS = ("end_cursor", "endCursor", "next_cursor", "nextCursor")
+HAS_NEXT_KEYS = ("has_next", "hasNext", "has_next_page", "hasNextPage")
+# Headers Playwright sets itself when replaying a request
+SKIP_REPLAY_HEADERS = {"content-length", "host", "cookie", "accept-encoding"}
+
+PRODUCT_ID_PATTERN = re.compile(r"/catalog/products/(\d+)")
+
+
+def _walk(obj):
+    """Every dict inside a JSON document, in document order"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            yield item
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+
+
+def _first(d, keys, depth=2):
+    """First non-empty value for any of keys in d (also checks nested dicts up to depth)"""
+    for key in keys:
+        value = d.get(key)
+        if value not in (None, ""):
+            return value
+    if depth > 0:
+        for value in d.values():
+            if isinstance(value, dict):
+                found = _first(value, keys, depth - 1)
+                if found not in (None, ""):
+                    return found
+    return None
+
+
+def _to_number(value, cast):
+    if isinstance(value, (int, float)):
+        return cast(value)
+    if isinstance(value, str):
+        match = re.search(r"\d+(\.\d+)?", value.replace(",", ""))
+        if match:
+            return cast(float(match.group()))
+    return None
+
+
+def parse_product(documents, url):
+    """
+    Product fields from captured API responses.
+
+    Picks the dict that has a product name and a price, preferring the one whose id matches the URL.
+    Returns None when nothing product-like was captured (caller falls back to the DOM).
+    """
+    match = PRODUCT_ID_PATTERN.search(url)
+    product_id = match.group(1) if match else None
+    candidates = [
+        d for document in documents for d in _walk(document)
+        if isinstance(_first(d, NAME_KEYS, depth=0), str) and _first(d, PRICE_KEYS) is not None
+    ]
+    if not candidates:
+        return None
+    # Related / recommended products are on the page too; prefer the one with this page's id
+    best = next((d for d in candidates
+                 if product_id in {str(d.get(key)) for key in ("id", "product_id", "productId", "catalog_product_id")}),
+                candidates[0])
+
+    brand = _first(best, BRAND_KEYS)
+    if brand is None:
+        for key in BRAND_PARENT_KEYS:
+            if isinstance(best.get(key), dict):
+                brand = _first(best[key], NAME_KEYS, depth=0)
+                break
+    return {
+        "brand_name": brand if isinstance(brand, str) else "Unknown",
+        "product_name": best[next(k for k in NAME_KEYS if isinstance(best.get(k), str))].strip(),
+        "final_price": _to_number(_first(best, PRICE_KEYS), int) or 0,
+        "review_count": _to_number(_first(best, REVIEW_COUNT_KEYS), int) or 0,
+        "rating_average": _to_number(_first(best, RATING_KEYS), float) or 0.0,
+        "image_url": _first(best, IMAGE_KEYS) or "",
+    }
+
+
+def parse_reviews(documents):
+    """Review dicts ({"content", "rating"}) from captured API responses, de-duplicated, in page order"""
+    reviews, seen = [], set()
+    for document in documents:
+        for d in _walk(document):
+            text = _first(d, REVIEW_TEXT_KEYS, depth=0)
+            rating = _to_number(_first(d, REVIEW_RATING_KEYS, depth=0), int)
+            if not isinstance(text, str) or not text.strip() or rating is None:
+                continue
+            key = d.get("id") or text.strip()
+            if key in seen:
+                continue
+            seen.add(key)
+            reviews.append({"content": text.strip(), "rating": rating})
+    return reviews
+
+
+def _next_cursor(document):
+    """(next cursor, has_next) from a paginated response"""
+    for d in _walk(document):
+        cursor = _first(d, NEXT_CURSOR_KEYS, depth=0)
+        has_next = _first(d, HAS_NEXT_KEYS, depth=0)
+        if cursor is not None or has_next is not None:
+            return cursor, bool(has_next) if has_next is not None else cursor is not None
+    return None, False
+
+
+class ResponseCapture:
+    """
+    Collects JSON API responses of one page via page.on("response").
+
+    Usage:
+        capture = ResponseCapture(page)
+        await page.goto(url)
+        await capture.drain()
+        product = parse_product(capture.documents(), url)
+        capture.detach()
+    """
+
+    def __init__(self, page, url_keywords=API_URL_KEYWORDS):
+        self.page = page
+        self.url_keywords = url_keywords
+        self.responses = []
+        self._tasks = set()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        request = response.request
+        if request.resource_type not in ("xhr", "fetch"):
+            return
+        if not any(keyword in response.url for keyword in self.url_keywords):
+            return
+        # The event handler is sync; reading the body is async
+        task = asyncio.ensure_future(self._read(response))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _read(self, response):
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        request = response.request
+        self.responses.append({
+            "url": response.url,
+            "method": request.method,
+            "headers": request.headers,
+            "post_data": request.post_data,
+            "data": data,
+        })
+
+    async def drain(self):
+        """Wait until every response seen so far has been read"""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def detach(self):
+        self.page.remove_listener("response", self._on_response)
+
+    def documents(self):
+        return [entry["data"] for entry in self.responses]
+
+    def review_request(self):
+        """The last captured JSON POST request whose response contained reviews (template for paging)"""
+        for entry in reversed(self.responses):
+            if entry["method"] == "POST" and entry["post_data"] and parse_reviews([entry["data"]]):
+                return entry
+        return None
+
+    async def fetch_more_reviews(self, limit):
+        """
+        Page through reviews by replaying the captured review request with the next cursor / page.
+
+        Returns:
+            list: Review dicts from the extra pages (at most `limit`, may repeat already captured ones)
+        """
+        entry = self.review_request()
+        if entry is None:
+            return []
+        try:
+            body = json.loads(entry["post_data"])
+        except ValueError:
+            return []
+        # Batched GraphQL requests send a list of operations
+        operation = body[0] if isinstance(body, list) and body else body
+        variables = operation.get("variables") if isinstance(operation, dict) else None
+        if not isinstance(variables, dict):
+            return []
+
+        headers = {k: v for k, v in entry["headers"].items() if k.lower() not in SKIP_REPLAY_HEADERS}
+        document = entry["data"]
+        collected = []
+        while len(collected) < limit:
+            cursor, has_next = _next_cursor(document)
+            cursor_key = next((key for key in CURSOR_VARIABLES if key in variables), None)
+            if cursor_key and cursor is not None and has_next:
+                variables[cursor_key] = cursor
+            elif "page" in variables and isinstance(variables["page"], int):
+                variables["page"] += 1
+            elif "offset" in variables and isinstance(variables["offset"], int):
+                variables["offset"] += len(parse_reviews([document])) or 1
+            else:
+                break
+
+            response = await self.page.request.fetch(
+                entry["url"], method="POST", headers=headers, data=json.dumps(body))
+            if not response.ok:
+                break
+            document = await response.json()
+            page_reviews = parse_reviews([document])
+            if not page_reviews:
+                break
+            collected.extend(page_reviews)
+        return collected[:limit]
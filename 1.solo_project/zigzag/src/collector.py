@@ -1,23 +1,70 @@
 import asyncio
 import random
 import re
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from src.capture import ResponseCapture, parse_product, parse_reviews
 from src.database import DatabaseManager
+from settings import settings
+
+PRODUCT_LINK_SELECTOR = 'a[class*="product-card-link"], a[href*="/catalog/products/"]'
+REVIEW_ITEM_SELECTOR = 'div[data-review-feed-index], div[class*="ReviewItem"], div[data-custom-ta-key*="PDP_REVIEW_CELL"], li[class*="ReviewItem"]'
+# Headless mode skips heavy assets (og:image is read from the meta tag, not the rendered image)
+BLOCKED_RESOURCES = {"image", "media", "font"}
+
+
+async def _settle(page, timeout=5000):
+    """Wait for network idle instead of a fixed sleep (long-polling pages may never go idle)"""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except PlaywrightTimeoutError:
+        pass
+
+
+async def _wait_for_more(page, selector, previous_count, timeout=3000):
+    """Wait until more elements matching selector are rendered. Returns the new count."""
+    try:
+        await page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[selector, previous_count], timeout=timeout
+        )
+    except PlaywrightTimeoutError:
+        pass
+    return await page.locator(selector).count()
+
 
 class ZigzagCollector:
-    def __init__(self):
+    """
+    Args:
+        headless (bool): Run Chromium without a window (production). Defaults to settings.HEADLESS.
+        concurrency (int): Number of product pages scraped in parallel. Defaults to settings.CONCURRENCY.
+        max_products (int): Number of top products to scrape per category. Defaults to settings.MAX_PRODUCTS.
+        max_reviews (int): Reviews per product. Defaults to settings.MAX_REVIEWS.
+        capture (bool): Read product / review data from the page's API responses (DOM scraping as fallback).
+                        Defaults to settings.CAPTURE.
+    """
+
+    def __init__(self, headless=None, concurrency=None, max_products=None, max_reviews=None, capture=None):
         self.db = DatabaseManager()
         self.base_url = "https://zigzag.kr"
+        self.headless = settings.HEADLESS if headless is None else headless
+        self.concurrency = max(1, concurrency or settings.CONCURRENCY)
+        self.max_products = max_products or settings.MAX_PRODUCTS
+        self.max_reviews = max_reviews or settings.MAX_REVIEWS
+        self.capture = settings.CAPTURE if capture is None else capture
 
     async def run(self, category_name: str):
         async with async_playwright() as p:
-            # Headless=True for more stable execution in CLI, but keeping False for now to monitor
-            browser = await p.chromium.launch(headless=False)
+            browser = await p.chromium.launch(headless=self.headless)
             context = await browser.new_context(
                 viewport={'width': 1280, 'height': 800},
                 user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
             )
+            context.set_default_timeout(settings.TIMEOUT)
+            if self.headless:
+                await context.route("**/*", lambda route: route.abort()
+                                    if route.request.resource_type in BLOCKED_RESOURCES else route.continue_())
             page = await context.new_page()
+            clicked = False
 
             try:
                 # 1. 메인 페이지 접속
@@ -37,9 +84,8 @@ class ZigzagCollector:
                     # Fallback to direct navigation
                     await page.goto(f"{self.base_url}/categories")
                 
-                await page.wait_for_load_state("networkidle")
-                await asyncio.sleep(3)
-                
+                await _settle(page)
+
                 # 3. 대항목 클릭
                 print(f"Finding category item: {category_name}")
                 
@@ -48,7 +94,7 @@ class ZigzagCollector:
                 if await sidebar_item.count() > 0:
                     print(f"Clicking sidebar item: {category_name}")
                     await sidebar_item.click()
-                    await asyncio.sleep(1)
+                    await _settle(page, timeout=2000)
 
                 # Now find the header button in the content area that leads to the full page.
                 # Usually contains the name and a chevron ">".
@@ -61,7 +107,7 @@ class ZigzagCollector:
                 if await header_link.count() > 0:
                     print(f"Clicking main category header link for: {category_name}")
                     await header_link.click()
-                    await asyncio.sleep(3)
+                    await _settle(page)
                     clicked = True
                 else:
                     # Final fallback: search for text and try to find a clickable parent or siblings
@@ -74,7 +120,7 @@ class ZigzagCollector:
                             target = category_locators.nth(i)
                             old_url = page.url
                             await target.click()
-                            await asyncio.sleep(2)
+                            await _settle(page, timeout=3000)
                             if page.url != old_url:
                                 clicked = True
                                 print(f"Successfully navigated via fallback to: {page.url}")
@@ -92,21 +138,26 @@ class ZigzagCollector:
                 sort_btn = page.locator('button').filter(has_text=re.compile(r"순$|인기|추천|랭킹")).first
                 if await sort_btn.count() > 0:
                     await sort_btn.click()
-                    await asyncio.sleep(1)
+                    await _settle(page, timeout=2000)
                     pop_opt = page.locator('//p[text()="인기순"] | //span[text()="인기순"] | //div[text()="인기순"] | //li[contains(., "인기순")]').first
                     if await pop_opt.count() > 0:
                         await pop_opt.click()
-                        await asyncio.sleep(2)
+                        await _settle(page)
 
                 # 5. 상품 리스트 확보 (무한 스크롤)
+                # Scroll until enough cards are rendered or scrolling stops loading new ones
                 print("Scrolling to load products...")
-                for _ in range(3):
+                count = await page.locator(PRODUCT_LINK_SELECTOR).count()
+                while count < self.max_products:
                     await page.mouse.wheel(0, 1500)
-                    await asyncio.sleep(2)
+                    new_count = await _wait_for_more(page, PRODUCT_LINK_SELECTOR, count)
+                    if new_count <= count:
+                        break
+                    count = new_count
 
                 # 상품 카드 식별 (Verified selector: a[class*="product-card-link"])
                 # Also fallback to general product link pattern
-                product_links = await page.locator('a[class*="product-card-link"], a[href*="/catalog/products/"]').all()
+                product_links = await page.locator(PRODUCT_LINK_SELECTOR).all()
                 unique_urls = []
                 seen_urls = set()
                 
@@ -119,149 +170,222 @@ class ZigzagCollector:
                             unique_urls.append(full_url)
                 
                 print(f"Found {len(unique_urls)} unique products.")
-                target_urls = unique_urls[:20]
-
-                # 6. 상세 페이지 순회
-                for idx, prod_url in enumerate(target_urls):
-                    print(f"[{idx+1}/{len(target_urls)}] Scraping {prod_url}...")
-                    try:
-                        await self._scrape_product_detail(context, prod_url, category_name)
-                    except Exception as e:
-                        print(f"Failed to scrape {prod_url}: {e}")
-                    
-                    await asyncio.sleep(random.uniform(1, 2))
+                target_urls = unique_urls[:self.max_products]
+
+                # 6. 상세 페이지 순회 (page pool, up to `concurrency` products at once)
+                await self._scrape_products(context, target_urls, category_name)
 
             except Exception as e:
                 print(f"Critical Error: {e}")
             finally:
                 await browser.close()
 
-    async def _scrape_product_detail(self, context, url, category):
-        page = await context.new_page()
+    async def _scrape_products(self, context, urls, category):
+        """Scrape product details with a pool of reusable pages, `concurrency` at a time"""
+        pool = asyncio.Queue()
+        for _ in range(min(self.concurrency, len(urls))):
+            pool.put_nowait(await context.new_page())
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def worker(idx, url):
+            async with semaphore:
+                page = await pool.get()
+                try:
+                    print(f"[{idx+1}/{len(urls)}] Scraping {url}...")
+                    await self._scrape_product_detail(page, url, category)
+                except Exception as e:
+                    print(f"Failed to scrape {url}: {e}")
+                finally:
+                    # Small jitter so the pool does not hit the site in lockstep
+                    await asyncio.sleep(random.uniform(0, settings.REQUEST_JITTER))
+                    pool.put_nowait(page)
+
+        await asyncio.gather(*(worker(idx, url) for idx, url in enumerate(urls)))
+        while not pool.empty():
+            await pool.get_nowait().close()
+
+    async def _scrape_product_detail(self, page, url, category):
+        # Network capture: read product / review JSON from the page's own API calls
+        capture = ResponseCapture(page) if self.capture else None
         try:
             await page.goto(url, timeout=30000, wait_until="domcontentloaded")
-            await asyncio.sleep(3) # Wait for AJAX
-
-            # 1. 상품명
-            product_name = "Unknown"
+            # Wait for the product title to render instead of a fixed sleep
             try:
-                # Primary: H1 with semantic classes
-                name_sel = page.locator('h1[class*="BODY"], h1[class*="css-"], h1').first
-                if await name_sel.count() > 0:
-                    product_name = (await name_sel.text_content()).strip()
-                else:
-                    # Fallback to OG title
-                    og_title = await page.locator("meta[property='og:title']").get_attribute("content")
-                    if og_title:
-                        product_name = og_title.split(" - ")[0].strip()
-            except:
+                await page.wait_for_selector("h1", timeout=10000)
+            except PlaywrightTimeoutError:
                 pass
 
-            # 2. 브랜드명
-            brand_name = "Unknown"
-            # Updated selectors based on current site structure
-            brand_sel = page.locator('a[class*="e1jx89fy1"], h2[class*="e1qy47wz6"], [class*="StoreName"], p[class*="brand"]').first
-            if await brand_sel.count() > 0:
-                brand_name = (await brand_sel.text_content()).strip()
-
-            # 3. 가격
-            final_price = 0
-            # Target specific price classes
-            price_sel = page.locator('[class*="e1sus6ys1"], span[class*="SalesPrice"], span[class*="Price"].bold, div[class*="SalesPrice"]').first
-            if await price_sel.count() > 0:
-                text = await price_sel.text_content()
-                match = re.search(r"[\d,]+", text)
-                if match:
-                    final_price = int(match.group().replace(",", ""))
-
-            # 4. 리뷰 정보 (Count & Rating)
-            review_count = 0
-            rating_average = 0.0
-            
-            # Review count summary near title/rating
-            rev_cnt_sel = page.locator('[class*="evpy3qu0"], [class*="review_count"], a[href*="/review"] span').first
-            if await rev_cnt_sel.count() > 0:
-                text = await rev_cnt_sel.text_content()
-                match = re.search(r"[\d,]+", text)
-                if match:
-                    review_count = int(match.group().replace(",", ""))
-
-            # Rating
-            rating_sel = page.locator('[class*="Rating"], span[class*="rating_score"]').first
-            if await rating_sel.count() > 0:
-                text = await rating_sel.text_content()
-                match = re.search(r"(\d+(\.\d+)?)", text)
-                if match:
-                    rating_average = float(match.group(1))
-
-            # 5. 이미지
-            image_url = ""
-            try:
-                image_url = await page.locator("meta[property='og:image']").get_attribute("content")
-            except:
-                pass
+            product = None
+            if capture:
+                await _settle(page, timeout=3000)
+                await capture.drain()
+                product = parse_product(capture.documents(), url)
+            source = "api" if product else "dom"
+            if product is None:
+                # DOM fallback (API response not captured or not recognised)
+                product = await self._product_from_dom(page)
 
-            product_data = {
-                "category_major": category,
-                "brand_name": brand_name,
-                "product_name": product_name,
-                "final_price": final_price,
-                "review_count": review_count,
-                "rating_average": rating_average,
-                "image_url": image_url,
-                "product_url": url
-            }
-            
-            product_id = self.db.save_product(product_data)
-            print(f"Saved: {product_name[:30]}... | Price: {final_price} | Reviews: {review_count}")
+            product_data = {"category_major": category, **product, "product_url": url}
+            product_name = product_data["product_name"]
+
+            # DB / local JSON writes are blocking, keep them off the event loop
+            product_id = await asyncio.to_thread(self.db.save_product, product_data)
+            print(f"Saved ({source}): {product_name[:30]}... | Price: {product_data['final_price']} | Reviews: {product_data['review_count']}")
 
-            # 6. 리뷰 수집 (최대 20개)
+            # 6. 리뷰 수집 (최대 max_reviews개)
             print(f"Collecting reviews for {product_name}...")
-            rev_tab = page.locator('button:has-text("리뷰"), a:has-text("리뷰")').first
-            if await rev_tab.count() > 0:
-                await rev_tab.click()
-                await asyncio.sleep(2)
-                # Scroll to ensure lazy items load
-                for _ in range(3):
-                    await page.mouse.wheel(0, 1000)
-                    await asyncio.sleep(0.5)
-
-            reviews = []
-            # Updated selectors for review items container and content
-            # data-review-feed-index is a very reliable selector for Zigzag reviews
-            review_els = await page.locator('div[data-review-feed-index], div[class*="ReviewItem"], div[data-custom-ta-key*="PDP_REVIEW_CELL"], li[class*="ReviewItem"]').all()
-            print(f"Found {len(review_els)} potential review elements.")
-            
-            for item in review_els[:20]:
-                content = ""
-                rating = 5
-                
-                # Content: span[class*="ebrcgb90"] is highly specific for review text
-                content_el = item.locator('span[class*="ebrcgb90"], span[class*="zds4_"], div[class*="BODY"], div[class*="content"], p[class*="text"]').first
-                 if await content_el.count() > 0:
-                    content = (await content_el.text_content()).strip()
-                
-                # Rating: aria-label contains star count
-                ## 라뷰별 별점 데이터는 그림으로 수치화 되어 있음 이거 한번 스크립트에서 확인 해봐야함ss
-                star_el = item.locator('[aria-label*="별점"], [class*="Rating"], [class*="star"]').first
-                if await star_el.count() > 0:
-                    label = await star_el.get_attribute("aria-label")
-                    if label:
-                        match = re.search(r"\d", label)
-                        if match: rating = int(match.group())
-                
-                if content:
-                    reviews.append({"content": content, "rating": rating})
+            reviews = await self._reviews_from_capture(page, capture) if capture else []
+            source = "api" if reviews else "dom"
+            if not reviews:
+                reviews = await self._reviews_from_dom(page, tab_opened=capture is not None)
 
             if reviews:
-                self.db.save_reviews(product_id, reviews)
-                print(f"Success: Collected {len(reviews)} reviews.")
+                await asyncio.to_thread(self.db.save_reviews, product_id, reviews)
+                print(f"Success: Collected {len(reviews)} reviews ({source}).")
             else:
                 print("No reviews found or failed to parse reviews.")
 
         finally:
-            await page.close()
+            if capture:
+                capture.detach()
+            # Page goes back to the pool; drop per-product state
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                pass
+
+    async def _open_review_tab(self, page):
+        rev_tab = page.locator('button:has-text("리뷰"), a:has-text("리뷰")').first
+        if await rev_tab.count() > 0:
+            await rev_tab.click()
+            return True
+        return False
+
+    async def _reviews_from_capture(self, page, capture):
+        """Reviews from captured API responses; opens the review tab and pages the review API if needed"""
+        reviews = parse_reviews(capture.documents())
+        if len(reviews) < self.max_reviews and await self._open_review_tab(page):
+            await _settle(page, timeout=3000)
+            await capture.drain()
+            reviews = parse_reviews(capture.documents())
+        if reviews and len(reviews) < self.max_reviews:
+            # Beyond the first page: replay the captured review request with the next cursor
+            seen = {r["content"] for r in reviews}
+            try:
+                more = await capture.fetch_more_reviews(self.max_reviews - len(reviews))
+            except Exception as e:
+                print(f"Review paging failed: {e}")
+                more = []
+            for review in more:
+                if review["content"] not in seen:
+                    seen.add(review["content"])
+                    reviews.append(review)
+        return reviews[:self.max_reviews]
+
+    async def _product_from_dom(self, page):
+        # 1. 상품명
+        product_name = "Unknown"
+        try:
+            # Primary: H1 with semantic classes
+            name_sel = page.locator('h1[class*="BODY"], h1[class*="css-"], h1').first
+            if await name_sel.count() > 0:
+                product_name = (await name_sel.text_content()).strip()
+            else:
+                # Fallback to OG title
+                og_title = await page.locator("meta[property='og:title']").get_attribute("content")
+                if og_title:
+                    product_name = og_title.split(" - ")[0].strip()
+        except:
+            pass
+
+        # 2. 브랜드명
+        brand_name = "Unknown"
+        # Updated selectors based on current site structure
+        brand_sel = page.locator('a[class*="e1jx89fy1"], h2[class*="e1qy47wz6"], [class*="StoreName"], p[class*="brand"]').first
+        if await brand_sel.count() > 0:
+            brand_name = (await brand_sel.text_content()).strip()
 
+        # 3. 가격
+        final_price = 0
+        # Target specific price classes
+        price_sel = page.locator('[class*="e1sus6ys1"], span[class*="SalesPrice"], span[class*="Price"].bold, div[class*="SalesPrice"]').first
+        if await price_sel.count() > 0:
+            text = await price_sel.text_content()
+            match = re.search(r"[\d,]+", text)
+            if match:
+                final_price = int(match.group().replace(",", ""))
 
+        # 4. 리뷰 정보 (Count & Rating)
+        review_count = 0
+        rating_average = 0.0
+        
+        # Review count summary near title/rating
+        rev_cnt_sel = page.locator('[class*="evpy3qu0"], [class*="review_count"], a[href*="/review"] span').first
+        if await rev_cnt_sel.count() > 0:
+            text = await rev_cnt_sel.text_content()
+            match = re.search(r"[\d,]+", text)
+            if match:
+                review_count = int(match.group().replace(",", ""))
+
+        # Rating
+        rating_sel = page.locator('[class*="Rating"], span[class*="rating_score"]').first
+        if await rating_sel.count() > 0:
+            text = await rating_sel.text_content()
+            match = re.search(r"(\d+(\.\d+)?)", text)
+            if match:
+                rating_average = float(match.group(1))
+
+        # 5. 이미지
+        image_url = ""
+        try:
+            image_url = await page.locator("meta[property='og:image']").get_attribute("content")
+        except:
+            pass
 
+        return {
+            "brand_name": brand_name,
+            "product_name": product_name,
+            "final_price": final_price,
+            "review_count": review_count,
+            "rating_average": rating_average,
+            "image_url": image_url,
+        }
+
+    async def _reviews_from_dom(self, page, tab_opened=False):
+        if tab_opened or await self._open_review_tab(page):
+            count = await _wait_for_more(page, REVIEW_ITEM_SELECTOR, 0, timeout=5000)
+            # Scroll to ensure lazy items load
+            for _ in range(3):
+                if count >= self.max_reviews:
+                    break
+                await page.mouse.wheel(0, 1000)
+                count = await _wait_for_more(page, REVIEW_ITEM_SELECTOR, count, timeout=1500)
+
+        reviews = []
+        # Updated selectors for review items container and content
+        # data-review-feed-index is a very reliable selector for Zigzag reviews
+        review_els = await page.locator(REVIEW_ITEM_SELECTOR).all()
+        print(f"Found {len(review_els)} potential review elements.")
+        
+        for item in review_els[:self.max_reviews]:
+            content = ""
+            rating = 5
+            
+            # Content: span[class*="ebrcgb90"] is highly specific for review text
+            content_el = item.locator('span[class*="ebrcgb90"], span[class*="zds4_"], div[class*="BODY"], div[class*="content"], p[class*="text"]').first
+            if await content_el.count() > 0:
+                content = (await content_el.text_content()).strip()
+            
+            # Rating: aria-label contains star count
+            ## 라뷰별 별점 데이터는 그림으로 수치화 되어 있음 이거 한번 스크립트에서 확인 해봐야함ss
+            star_el = item.locator('[aria-label*="별점"], [class*="Rating"], [class*="star"]').first
+            if await star_el.count() > 0:
+                label = await star_el.get_attribute("aria-label")
+                if label:
+                    match = re.search(r"\d", label)
+                    if match: rating = int(match.group())
+            
+            if content:
+                reviews.append({"content": content, "rating": rating})
 
+        return reviews
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from datetime import datetime
 from supabase import create_client, Client
 import sys
@@ -14,6 +15,8 @@ from settings import settings
 class DatabaseManager:
     def __init__(self):
         self.local_storage_path = str(PROJECT_ROOT / "config" / "data" / "collected_results.json")
+        # Collector saves from several worker threads; serialize the JSON read-modify-write
+        self._local_lock = threading.Lock()
         
         # Ensure data directory exists
         os.makedirs(os.path.dirname(self.local_storage_path), exist_ok=True)
@@ -30,6 +33,10 @@ class DatabaseManager:
 
     def _save_local(self, data: dict, data_type: str):
         """Append data to local JSON file for fallback."""
+        with self._local_lock:
+            return self._append_local(data, data_type)
+
+    def _append_local(self, data: dict, data_type: str):
         try:
             current_data = []
             if os.path.exists(self.local_storage_path):
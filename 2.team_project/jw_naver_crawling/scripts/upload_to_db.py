@@ -7,7 +7,7 @@ import io
 if sys.stdout.encoding != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
-def upload_csv_to_db(csv_path):
+def upload_csv_to_db(csv_path, chunk_size=500):
     try:
         # DB 매니저 초기화
         db = SupabaseManager()
@@ -20,19 +20,23 @@ def upload_csv_to_db(csv_path):
         total_rows = len(df)
         print(f"[*] 총 {total_rows}개의 데이터를 DB에 업로드합니다...")
         
-        success_count = 0
-        for _, row in df.iterrows():
-            data = {
+        # 한 행씩 upsert 하지 않고 chunk_size 개씩 묶어서 한 번에 upsert
+        rows = [
+            {
                 "date": row['date'],
                 "keyword": row['keyword'],
                 "total_count": int(row['total_count'])
             }
-            
-            res = db.insert_blog_trend(data)
+            for row in df.to_dict('records')
+        ]
+        
+        success_count = 0
+        for i in range(0, total_rows, chunk_size):
+            chunk = rows[i:i + chunk_size]
+            res = db.insert_blog_trends(chunk)
             if res:
-                success_count += 1
-                if success_count % 50 == 0:
-                    print(f"[...] 진행 중: {success_count}/{total_rows}")
+                success_count += len(chunk)
+                print(f"[...] 진행 중: {success_count}/{total_rows}")
         
         print(f"\n[+] 업로드 완료! (성공: {success_count}/{total_rows})")
         
@@ -1,5 +1,4 @@
 import os
-import time
 import pandas as pd
 from datetime import datetime, timedelta
 import sys
@@ -8,8 +7,11 @@ from pathlib import Path
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+# 팀 공용 네이버 블로그 수집 모듈 (2.team_project/src/naver_blog)
+sys.path.insert(0, str(PROJECT_ROOT.parent / 'src'))
 
 from scraper import NaverBlogCrawler
+from naver_blog import BatchWriter, CsvSink
 
 def main():
     # 1. 설정
@@ -21,6 +23,9 @@ def main():
     end_date_str = "2026-01-16"
     # 저장 파일명
     output_file = f"{keyword}_blog_counts.csv"
+    # 수집 방식: 기본은 "daily"(하루씩 조회)
+    # 포스팅이 드문 키워드를 긴 기간 수집할 때만 "bisect"(구간 합계 조회 후 필요한 곳만 분할)로 바꿔서 사용
+    count_mode = "daily"
     
     start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
     end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")
@@ -30,10 +35,11 @@ def main():
     print(f"=== {keyword} 네이버 블로그 포스팅 수집 시작 (CSV 전용) ===")
     print(f"기간: {start_date_str} ~ {end_date_str} ({total_days}일)")
     print(f"저장 파일: {output_file}")
+    print(f"수집 방식: {count_mode}")
     print("-" * 40)
 
     # 2. 초기화
-    crawler = NaverBlogCrawler()
+    crawler = NaverBlogCrawler(count_mode=count_mode)
     
     results = []
     current_dt = start_dt
@@ -53,35 +59,17 @@ def main():
             print(f"[!] 기존 파일을 읽는 중 오류가 발생했습니다: {e}")
             print("[*] 처음부터 수집을 시작합니다.")
 
-    # 3. 루프 실행
+    # 3. 루프 실행 (여러 날짜를 동시에 조회, 결과는 날짜순으로 모아서 CSV에 저장)
     try:
-        while current_dt <= end_dt:
-            date_str = current_dt.strftime("%Y-%m-%d")
-            print(f"\n[+] 날짜: {date_str}", end=" ", flush=True)
-            
-            count = crawler.get_blog_count(keyword, start_date=date_str, end_date=date_str)
-            
-            if count is not None:
-                print(f"-> {count:,}건")
-                data_row = {
-                    "date": date_str,
-                    "keyword": keyword,
-                    "total_count": count
-                }
-                results.append(data_row)
-                
-                # CSV 실시간 저장 (데이터 유실 방지)
-                df = pd.DataFrame([data_row])
-                if not os.path.exists(output_file):
-                    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        with BatchWriter([CsvSink(output_file)], batch_size=30) as writer:
+            for data_row in crawler.iter_daily_counts([keyword], current_dt, end_dt):
+                count = data_row["total_count"]
+                if count is not None:
+                    print(f"[+] 날짜: {data_row['date']} -> {count:,}건")
+                    results.append(data_row)
+                    writer.write(data_row)
                 else:
-                    df.to_csv(output_file, mode='a', index=False, header=False, encoding='utf-8-sig')
-            else:
-                print("-> 실패")
-            
-            # 요청 간 딜레이 (0.5초)
-            time.sleep(0.5)
-            current_dt += timedelta(days=1)
+                    print(f"[+] 날짜: {data_row['date']} -> 실패")
             
     except KeyboardInterrupt:
         print("\n\n[!] 사용자에 의해 중단되었습니다. 현재까지의 데이터는 저장되었습니다.")
@@ -35,3 +35,18 @@ class SupabaseManager:
         except Exception as e:
             print(f"[!] DB 저장 중 오류 발생 ({data.get('date', 'unknown')}): {e}")
             return None
+
+    def insert_blog_trends(self, rows):
+        """
+        여러 행을 naver_blog_trends 테이블에 한 번에 삽입/업데이트합니다.
+        rows: insert_blog_trend 의 data 형식 리스트
+        """
+        try:
+            response = self.supabase.table("naver_blog_trends").upsert(
+                rows,
+                on_conflict="date,keyword"
+            ).execute()
+            return response
+        except Exception as e:
+            print(f"[!] DB 일괄 저장 중 오류 발생 ({len(rows)}건): {e}")
+            return None
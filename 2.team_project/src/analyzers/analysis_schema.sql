@@ -14,3 +14,16 @@ CREATE TABLE IF NOT EXISTS review_analysis_result (
 );
 
 CREATE UNIQUE INDEX IF NOT EXISTS idx_unique_review_idx ON review_analysis_result (review_id);
+
+-- 아직 분석되지 않은 리뷰만 id 순으로 가져오기 (local_analyzer.py 의 run_analysis 에서 keyset 페이지네이션으로 호출)
+-- 분석된 id 전체를 내려받아 비교하지 않고 DB 에서 NOT EXISTS anti-join 으로 걸러냅니다.
+CREATE OR REPLACE FUNCTION fetch_unanalyzed_reviews(p_after_id BIGINT DEFAULT 0, p_limit INT DEFAULT 1000)
+RETURNS TABLE (id BIGINT, clean_content TEXT, address TEXT)
+LANGUAGE sql STABLE AS $$
+  SELECT b.id, b.clean_content, b.address
+  FROM blog_review b
+  WHERE b.id > p_after_id
+    AND NOT EXISTS (SELECT 1 FROM review_analysis_result r WHERE r.review_id = b.id)
+  ORDER BY b.id
+  LIMIT p_limit;
+$$;
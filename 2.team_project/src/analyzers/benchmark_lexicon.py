@@ -0,0 +1,154 @@
+"""
+LocalReviewAnalyzer 사전 매칭 벤치마크
+
+합성 블로그 본문으로 기존 방식(라벨마다 any(k in text) + 호출마다 정규식 생성)과
+컴파일된 LexiconMatcher(본문 한 번 스캔)를 비교하고, 결과가 같은지 확인합니다.
+
+- 기본 비교: 본문 N건 전체 분석 시간
+- 확장성: 본문 길이를 늘렸을 때 / 사전 크기를 늘렸을 때(무관한 키워드 추가) 건당 시간 변화
+  -> 컴파일된 매처는 본문 길이에만 비례하고 사전 크기에는 거의 영향을 받지 않아야 함
+
+실행 (2.team_project/src/analyzers 에서, Supabase 접속 없음):
+    python benchmark_lexicon.py --reviews 100000
+    python benchmark_lexicon.py --reviews 20000 --lengths 1,2,4,8 --lexicon-scales 1,4,16
+"""
+import argparse
+import random
+import re
+import time
+
+from local_analyzer import LEXICON, PRODUCT_KEYWORDS, LexiconMatcher
+
+FILLER = [
+    "오늘은 동네에 새로 생긴 디저트 가게에 다녀왔어요", "주차는 건물 뒤편에 가능했습니다",
+    "인테리어가 깔끔하고 사진 찍기 좋았어요", "오픈 시간 맞춰 갔더니 줄이 조금 있었어요",
+    "포장도 꼼꼼하게 해주셨어요", "친구랑 나눠 먹었는데", "겉은 바삭하고 속은 촉촉했어요",
+    "피스타치오 크림이 듬뿍 들어 있었고", "사장님이 친절하셨어요", "매장 안은 좁은 편이에요",
+]
+PRICES = ["4,500원", "6000원", "7,900 원", "3,500원", "12,000원", "9,800원", "1,500원"]
+
+
+def legacy_extract_price(text):
+    """기존 LocalReviewAnalyzer.extract_price"""
+    sentences = re.split(r'[.\n!]', text)
+    for sentence in sentences:
+        if any(keyword in sentence for keyword in PRODUCT_KEYWORDS):
+            for price_str in re.findall(r'(\d{1,3}(?:,\d{3})*)\s*원', sentence):
+                price_val = int(price_str.replace(",", ""))
+                if 1000 <= price_val <= 11000:
+                    return price_val
+    for keyword in PRODUCT_KEYWORDS:
+        match = re.search(rf"{keyword}.{{0,30}}?(\d{{1,3}}(?:,\d{{3}})*)\s*원", text)
+        if match:
+            price_val = int(match.group(1).replace(",", ""))
+            if 1000 <= price_val <= 11000:
+                return price_val
+    return None
+
+
+def legacy_match_lexicon(lexicon, text, category, default):
+    """기존 LocalReviewAnalyzer.match_lexicon"""
+    for label, keywords in lexicon[category].items():
+        if any(k in text for k in keywords):
+            return label
+    return default
+
+
+def legacy_analyze(lexicon, text):
+    return (legacy_extract_price(text),
+            legacy_match_lexicon(lexicon, text, "price", "평범"),
+            legacy_match_lexicon(lexicon, text, "taste", "보통"),
+            legacy_match_lexicon(lexicon, text, "visit", "없음"))
+
+
+def compiled_analyze(matcher, text):
+    scanned = matcher.scan(text)
+    price, _ = matcher.find_price(text, scanned)
+    return (price,
+            matcher.classify(scanned, "price", "평범"),
+            matcher.classify(scanned, "taste", "보통"),
+            matcher.classify(scanned, "visit", "없음"))
+
+
+def make_bodies(count, sentences, seed=42, keyword_rate=0.3):
+    """사전 키워드 / 제품 키워드 / 가격이 섞인 합성 블로그 본문 (keyword_rate: 사전 키워드가 들어간 문장 비율)"""
+    rng = random.Random(seed)
+    keywords = [k for labels in LEXICON.values() for words in labels.values() for k in words]
+    bodies = []
+    for _ in range(count):
+        parts = []
+        for _ in range(sentences):
+            roll = rng.random()
+            if roll < 0.15:
+                parts.append(f"{rng.choice(PRODUCT_KEYWORDS)} 하나에 {rng.choice(PRICES)}이었어요")
+            elif roll < 0.15 + keyword_rate:
+                parts.append(f"{rng.choice(FILLER)} {rng.choice(keywords)}")
+            else:
+                parts.append(rng.choice(FILLER))
+        bodies.append(rng.choice([". ", "!\n", "\n"]).join(parts))
+    return bodies
+
+
+def scaled_lexicon(scale, seed=7):
+    """라벨마다 본문에 나오지 않는 가짜 키워드를 추가해 사전을 scale 배로 키움"""
+    if scale <= 1:
+        return LEXICON
+    rng = random.Random(seed)
+    syllables = "갸겨교규그긔냐녀뇨뉴댜뎌됴듀랴려료류뱌벼뵤뷰쟈져죠쥬챠쳐쵸츄"
+    lexicon = {}
+    for category, labels in LEXICON.items():
+        lexicon[category] = {}
+        for label, words in labels.items():
+            extra = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+                     for _ in range(len(words) * (scale - 1))]
+            lexicon[category][label] = words + extra
+    return lexicon
+
+
+def timed(func, bodies):
+    started = time.perf_counter()
+    results = [func(body) for body in bodies]
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LocalReviewAnalyzer 사전 매칭 벤치마크 (합성 본문)")
+    parser.add_argument("--reviews", type=int, default=100000, help="본문 수")
+    parser.add_argument("--sentences", type=int, default=20, help="본문당 문장 수")
+    parser.add_argument("--keyword-rate", type=float, default=0.3, help="사전 키워드가 들어간 문장 비율")
+    parser.add_argument("--lengths", default="1,2,4", help="확장성 측정용 본문 길이 배수 (쉼표 구분)")
+    parser.add_argument("--lexicon-scales", default="1,4,16", help="확장성 측정용 사전 크기 배수 (쉼표 구분)")
+    parser.add_argument("--scale-reviews", type=int, default=5000, help="확장성 측정에 쓸 본문 수")
+    args = parser.parse_args()
+
+    bodies = make_bodies(args.reviews, args.sentences, keyword_rate=args.keyword_rate)
+    avg_len = sum(len(b) for b in bodies) / len(bodies)
+    print(f"[*] 본문 {len(bodies)}건, 평균 {avg_len:.0f}자\n")
+
+    matcher = LexiconMatcher()
+    legacy_sec, expected = timed(lambda text: legacy_analyze(LEXICON, text), bodies)
+    compiled_sec, actual = timed(lambda text: compiled_analyze(matcher, text), bodies)
+    match = "OK" if expected == actual else "MISMATCH"
+    print(f"{'case':<12}{'seconds':>10}{'reviews/s':>12}{'speedup':>10}  match")
+    print(f"{'legacy':<12}{legacy_sec:>10.2f}{len(bodies) / legacy_sec:>12.0f}{1:>9.1f}x")
+    print(f"{'compiled':<12}{compiled_sec:>10.2f}{len(bodies) / compiled_sec:>12.0f}"
+          f"{legacy_sec / compiled_sec:>9.1f}x  {match}")
+
+    print(f"\n[*] 확장성 (본문 {args.scale_reviews}건, 건당 마이크로초)")
+    print(f"{'length x':>9}{'lexicon x':>11}{'keywords':>10}{'legacy':>10}{'compiled':>10}")
+    for length in (int(x) for x in args.lengths.split(",")):
+        sample = make_bodies(args.scale_reviews, args.sentences * length, seed=length,
+                             keyword_rate=args.keyword_rate)
+        for scale in (int(x) for x in args.lexicon_scales.split(",")):
+            lexicon = scaled_lexicon(scale)
+            size = sum(len(words) for labels in lexicon.values() for words in labels.values())
+            scaled_matcher = LexiconMatcher(lexicon, PRODUCT_KEYWORDS)
+            legacy_sec, expected = timed(lambda text: legacy_analyze(lexicon, text), sample)
+            compiled_sec, actual = timed(lambda text: compiled_analyze(scaled_matcher, text), sample)
+            flag = "" if expected == actual else "  MISMATCH"
+            print(f"{length:>9}{scale:>11}{size:>10}{legacy_sec / len(sample) * 1e6:>10.1f}"
+                  f"{compiled_sec / len(sample) * 1e6:>10.1f}{flag}")
+
+
+if __name__ == "__main__":
+    main()
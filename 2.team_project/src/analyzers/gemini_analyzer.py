@@ -1,9 +1,13 @@
 import os
 import json
 import time
+import random
+import asyncio
 from dotenv import load_dotenv
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from supabase import create_client, Client
+from region_extractor import default_extractor as region_extractor
 
 # 환경 변수 로드
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,6 +16,121 @@ env_path = os.path.join(current_dir, "../../.env")
 if os.path.exists(env_path):
     load_dotenv(env_path)
 
+# 할당량 설정 (.env 로 변경 가능, 기본값은 무료 등급 기준)
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "5"))              # 분당 요청 수
+GEMINI_TPM = int(os.getenv("GEMINI_TPM", "250000"))         # 분당 토큰 수
+GEMINI_BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "5"))  # 프롬프트 하나에 넣을 리뷰 수
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "4"))  # 동시에 보낼 요청 수
+
+MAX_CONTENT_CHARS = 4000     # 리뷰 하나당 본문 길이 제한 (토큰 제한 고려)
+MAX_PROMPT_CHARS = 16000     # 프롬프트 하나에 넣을 본문 길이 합계 제한
+OUTPUT_TOKENS_PER_REVIEW = 300  # 리뷰 하나당 예상 응답 토큰
+MAX_RETRIES = 5
+
+ANALYSIS_FIELDS_GUIDE = """
+        1. "region": 상가의 정확한 위치(도로명 주소 또는 지점명)를 기입하세요.
+        2. "price_range": 본문의 가격 정보를 추출하세요, 반드시 개당 0000원으로 부탁함 (정보 없으면 "정보 없음")
+        3. "price_feedback": 반드시 [비쌈, 저렴, 보통] 중 하나만 선택하세요.
+        4. "taste_rating": 반드시 [매우 맛있음, 맛있음, 보통, 맛없음, 매우 맛없음] 중 하나만 선택하세요.
+        5. "visit_again": 반드시 [있음, 고려, 없음] 중 하나만 선택하세요.
+        6. "visit_reason": 위 결정의 이유(웨이팅, 가격, 맛 등)를 기입하세요.
+        7. "summary": 전체 내용을 한 줄로 요약하세요."""
+
+
+def estimate_tokens(text):
+    """한국어 본문 기준 보수적인 토큰 수 추정 (글자 수와 비슷하게 잡음)"""
+    return len(text)
+
+
+class TokenBucketLimiter:
+    """
+    분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 지키는 토큰 버킷 (asyncio 용)
+
+    버킷은 1분 동안 한도만큼 일정하게 채워지며, 요청은 요청 1개 + 예상 토큰이 모두 있을 때만 나갑니다.
+    응답 후 실제 사용 토큰으로 보정(settle)해서 추정 오차가 누적되지 않게 합니다.
+    """
+
+    def __init__(self, rpm, tpm):
+        self.capacity = {"requests": float(rpm), "tokens": float(tpm)}
+        self.available = dict(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        for key, capacity in self.capacity.items():
+            self.available[key] = min(capacity, self.available[key] + elapsed * capacity / 60)
+
+    async def acquire(self, tokens):
+        tokens = min(tokens, self.capacity["tokens"])  # 한도보다 큰 요청도 언젠가는 나가도록
+        async with self.lock:
+            while True:
+                self._refill()
+                need = {"requests": 1 - self.available["requests"], "tokens": tokens - self.available["tokens"]}
+                if need["requests"] <= 0 and need["tokens"] <= 0:
+                    self.available["requests"] -= 1
+                    self.available["tokens"] -= tokens
+                    return
+                # 부족한 쪽이 채워질 때까지 대기
+                wait = max(need[key] * 60 / self.capacity[key] for key in need if need[key] > 0)
+                await asyncio.sleep(wait)
+
+    def settle(self, estimated, actual):
+        """예상 토큰과 실제 사용 토큰의 차이를 버킷에 반영"""
+        if actual is not None:
+            self.available["tokens"] = min(self.capacity["tokens"],
+                                           self.available["tokens"] + estimated - actual)
+
+    def penalize(self, seconds):
+        """429 를 받으면 seconds 동안은 새 요청이 나가지 않도록 요청 버킷을 비움"""
+        self.available["requests"] = min(self.available["requests"], -seconds * self.capacity["requests"] / 60)
+
+
+def _is_rate_limited(error):
+    return isinstance(error, google_exceptions.ResourceExhausted) or getattr(error, "code", None) == 429
+
+
+def postprocess_region(analysis, content):
+    """
+    Gemini 결과의 region 을 본문 주소 규칙으로 보정하고 자치구 / 신뢰도를 함께 기록
+
+    Gemini 가 지역을 비워 두거나 "정보 없음"으로 답하면 본문에서 찾은 주소(없으면 자치구)로 채웁니다.
+    """
+    extracted = region_extractor.extract(content or "")
+    if not analysis.get("region") or analysis.get("region") == "정보 없음":
+        analysis["region"] = extracted["address"] or extracted["district"] or "정보 없음"
+    analysis["district"] = extracted["district"]
+    analysis["region_confidence"] = extracted["confidence"]
+    return analysis
+
+
+def _parse_json(text):
+    """응답에서 JSON 부분만 추출 (코드 블록으로 감싸서 오는 경우 대비)"""
+    text = text.strip()
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0].strip()
+    return json.loads(text)
+
+
+def _batch_results(data):
+    """
+    묶음 응답 -> {리뷰 id(str): 분석 결과 dict}
+
+    요청한 id 키 객체 외에 게시글 순서대로 [{"id": ..., ...}, ...] 배열로 오는 경우도 허용
+    (그 외 형태는 빈 dict -> 해당 묶음은 다음 실행에서 다시 분석)
+    """
+    if isinstance(data, dict):
+        return {str(key): value for key, value in data.items() if isinstance(value, dict)}
+    if isinstance(data, list):
+        return {str(item["id"]): {k: v for k, v in item.items() if k != "id"}
+                for item in data if isinstance(item, dict) and item.get("id") is not None}
+    return {}
+
+
 class GeminiAnalyzer:
     def __init__(self):
         # API 키 설정
@@ -40,70 +159,149 @@ class GeminiAnalyzer:
         {content}
 
         [반환 형식 지침]
-        1. "region": 상가의 정확한 위치(도로명 주소 또는 지점명)를 기입하세요.
-        2. "price_range": 본문의 가격 정보를 추출하세요, 반드시 개당 0000원으로 부탁함 (정보 없으면 "정보 없음")
-        3. "price_feedback": 반드시 [비쌈, 저렴, 보통] 중 하나만 선택하세요.
-        4. "taste_rating": 반드시 [매우 맛있음, 맛있음, 보통, 맛없음, 매우 맛없음] 중 하나만 선택하세요.
-        5. "visit_again": 반드시 [있음, 고려, 없음] 중 하나만 선택하세요.
-        6. "visit_reason": 위 결정의 이유(웨이팅, 가격, 맛 등)를 기입하세요.
-        7. "summary": 전체 내용을 한 줄로 요약하세요.
+{ANALYSIS_FIELDS_GUIDE}
 
         반드시 위 7가지 필드를 포함한 JSON 형식만 반환하세요.
         """
         try:
             response = self.model.generate_content(prompt)
             # JSON만 추출하기 위한 정규화
-            text = response.text.strip()
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0].strip()
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0].strip()
-            
-            return json.loads(text)
+            return postprocess_region(_parse_json(response.text), content)
         except Exception as e:
             print(f"Gemini Analysis Error: {e}")
             return None
 
-    def run_batch_analysis(self, limit=10):
-        """AI 분석이 안된 데이터를 가져와서 분석 진행"""
+    def build_batch_prompt(self, records):
+        """여러 리뷰를 id 로 구분해 한 번에 분석하는 프롬프트"""
+        reviews = json.dumps(
+            [{"id": str(r["id"]), "content": r["clean_content"][:MAX_CONTENT_CHARS]} for r in records],
+            ensure_ascii=False
+        )
+        return f"""
+        당신은 데이터 분석 전문가입니다. 아래 블로그 게시글 {len(records)}개를 각각 분석하여 지정된 JSON 형식으로 요약해 주세요.
+        내용에 관련 정보가 없는 경우 "정보 없음"이라고 기재해 주세요. 반드시 JSON 형식만 반환하세요.
+
+        [분석할 게시글 목록 (JSON, id 별 content)]
+        {reviews}
+
+        [게시글별 반환 형식 지침]
+{ANALYSIS_FIELDS_GUIDE}
+
+        [전체 반환 형식]
+        입력 게시글의 id 를 키로, 위 7가지 필드를 가진 객체를 값으로 하는 JSON 객체 하나만 반환하세요.
+        예: {{"123": {{"region": "...", "price_range": "...", "price_feedback": "...", "taste_rating": "...", "visit_again": "...", "visit_reason": "...", "summary": "..."}}}}
+        """
+
+    def pack_batches(self, records, batch_size):
+        """리뷰 수(batch_size)와 본문 길이 합계(MAX_PROMPT_CHARS) 안에서 리뷰를 묶음"""
+        batch, chars = [], 0
+        for record in records:
+            length = min(len(record["clean_content"]), MAX_CONTENT_CHARS)
+            if batch and (len(batch) >= batch_size or chars + length > MAX_PROMPT_CHARS):
+                yield batch
+                batch, chars = [], 0
+            batch.append(record)
+            chars += length
+        if batch:
+            yield batch
+
+    async def analyze_batch_async(self, records, limiter):
+        """
+        리뷰 묶음을 한 번의 요청으로 분석 (429 일 때만 지수 백오프로 재시도)
+
+        Returns:
+            dict: {리뷰 id: 분석 결과} (응답에 빠진 리뷰는 포함하지 않음)
+        """
+        prompt = self.build_batch_prompt(records)
+        estimated = estimate_tokens(prompt) + OUTPUT_TOKENS_PER_REVIEW * len(records)
+
+        for attempt in range(MAX_RETRIES):
+            await limiter.acquire(estimated)
+            try:
+                response = await self.model.generate_content_async(
+                    prompt, generation_config={"response_mime_type": "application/json"}
+                )
+            except Exception as e:
+                if not _is_rate_limited(e):
+                    print(f"Gemini Analysis Error: {e}")
+                    return {}
+                delay = min(60, 2 ** attempt * 4) + random.uniform(0, 1)
+                limiter.penalize(delay)
+                print(f"⏳ 429 할당량 초과, {delay:.1f}초 후 재시도 ({attempt + 1}/{MAX_RETRIES})")
+                continue
+
+            usage = getattr(response, "usage_metadata", None)
+            limiter.settle(estimated, getattr(usage, "total_token_count", None))
+            try:
+                data = _batch_results(_parse_json(response.text))
+            except Exception as e:
+                print(f"Gemini Response Parse Error: {e}")
+                return {}
+            by_id = {str(r["id"]): r for r in records}
+            return {by_id[key]["id"]: postprocess_region(value, by_id[key]["clean_content"])
+                    for key, value in data.items() if key in by_id}
+
+        print(f"❌ 재시도 한도 초과, {len(records)}건은 다음 실행에서 다시 분석합니다.")
+        return {}
+
+    def fetch_pending(self, limit):
+        """ai_analysis 가 비어 있는 리뷰를 id 순으로 limit 건까지 가져오기 (짧은 본문 제외)"""
+        records, last_id = [], 0
+        while len(records) < limit:
+            page = self.supabase.table("blog_reviews")\
+                .select("id, clean_content")\
+                .is_("ai_analysis", "null")\
+                .gt("id", last_id)\
+                .order("id")\
+                .limit(min(1000, limit * 2))\
+                .execute().data
+            if not page:
+                break
+            last_id = page[-1]["id"]
+            for record in page:
+                if not record["clean_content"] or len(record["clean_content"]) < 50:
+                    print(f"Skipping record {record['id']} due to short content.")
+                    continue
+                records.append(record)
+        return records[:limit]
+
+    def save_results(self, results):
+        """분석 결과를 id 기준으로 한 번에 저장"""
+        rows = [{"id": record_id, "ai_analysis": analysis} for record_id, analysis in results.items()]
+        if rows:
+            self.supabase.table("blog_reviews").upsert(rows, on_conflict="id").execute()
+
+    async def run_batch_analysis_async(self, limit=20, batch_size=GEMINI_BATCH_SIZE,
+                                       rpm=GEMINI_RPM, tpm=GEMINI_TPM, concurrency=GEMINI_CONCURRENCY):
+        """AI 분석이 안된 데이터를 묶음 프롬프트로 나눠 할당량(RPM/TPM) 안에서 동시에 분석"""
         print(f"Fetching up to {limit} records for analysis...")
-        
-        # ai_analysis가 null인 데이터 가져오기
-        records = self.supabase.table("blog_reviews")\
-            .select("id, clean_content")\
-            .is_("ai_analysis", "null")\
-            .limit(limit)\
-            .execute()
-        
-        if not records.data:
+        records = await asyncio.to_thread(self.fetch_pending, limit)
+        if not records:
             print("No new records to analyze.")
-            return
-
-        for record in records.data:
-            record_id = record['id']
-            content = record['clean_content']
-            
-            if not content or len(content) < 50:
-                print(f"Skipping record {record_id} due to short content.")
-                continue
-                
-            print(f"Analyzing record {record_id}...")
-            analysis_result = self.analyze_content(content[:4000]) # 토큰 제한 고려
-            
-            if analysis_result:
-                # Supabase 업데이트
-                self.supabase.table("blog_reviews")\
-                    .update({"ai_analysis": analysis_result})\
-                    .eq("id", record_id)\
-                    .execute()
-                print(f"Successfully updated record {record_id}")
-                # 분당 호출 제한(RPM 5회)을 고려하여 12초 이상 대기
-                print("Waiting 13 seconds for quota...")
-                time.sleep(13)
-            else:
-                # 에러 발생 시(주로 할당량) 조금 더 길게 대기 후 다음 레코드 시도
-                print("Analysis failed, waiting 20 seconds before retry...")
-                time.sleep(20)
+            return 0
+
+        limiter = TokenBucketLimiter(rpm, tpm)
+        semaphore = asyncio.Semaphore(concurrency)
+        batches = list(self.pack_batches(records, batch_size))
+        print(f"Analyzing {len(records)} records in {len(batches)} requests (RPM {rpm}, TPM {tpm})...")
+
+        async def worker(batch):
+            async with semaphore:
+                results = await self.analyze_batch_async(batch, limiter)
+            if results:
+                await asyncio.to_thread(self.save_results, results)
+                print(f"Successfully updated {len(results)}/{len(batch)} records "
+                      f"({', '.join(str(record_id) for record_id in results)})")
+            return len(results)
+
+        started = time.monotonic()
+        updated = sum(await asyncio.gather(*(worker(batch) for batch in batches)))
+        print(f"✨ {updated}/{len(records)} records analyzed in {time.monotonic() - started:.1f}s")
+        return updated
+
+    def run_batch_analysis(self, limit=20, **kwargs):
+        """AI 분석이 안된 데이터를 가져와서 분석 진행"""
+        return asyncio.run(self.run_batch_analysis_async(limit, **kwargs))
 
 if __name__ == "__main__":
     analyzer = GeminiAnalyzer()
@@ -1,14 +1,252 @@
 import os
 import json
 import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dotenv import load_dotenv
 from supabase import create_client, Client
+from region_extractor import default_extractor as region_extractor
 
 # 환경 변수 로드
 current_dir = os.path.dirname(os.path.abspath(__file__))
 env_path = os.path.join(current_dir, "../../.env")
 load_dotenv(env_path)
 
+# 키워드 사전 정의 (카테고리 -> 라벨 -> 키워드, 라벨 순서가 우선순위)
+LEXICON = {
+    "price": {
+        "저렴": ["가성비", "저렴", "싼", "착한 가격", "혜자", "부담 없는"],
+        "비쌈": ["비싼", "사악", "가격대 있는", "양에 비해", "비싸다", "고가"],
+        "보통": ["적당", "보통", "무난", "나쁘지 않은 가격"]
+    },
+    "taste": {
+        "매우 맛있음": ["최고", "인생", "존맛", "역대급", "대박", "미쳤다"],
+        "맛있음": ["맛있", "추천", "괜찮", "굿", "성공적"],
+        "보통": ["보통", "평범", "무난", "나쁘지 않은"],
+        "맛없음": ["그저 그런", "쏘쏘", "제 스타일은 아닌", "아쉬운"],
+        "매우 맛없음": ["실망", "다시는 안", "돈 아까운", "최악"]
+    },
+    "visit": {
+        "있음": ["재방문", "또 갈", "자주 갈", "단골", "생각날"],
+        "고려": ["한두번은", "가끔", "근처라면", "생각해보면"],
+        "없음": ["다시는", "안 갈", "웨이팅하면서까지", "절대"]
+    }
+}
+
+# 가격을 찾을 제품 키워드 (순서대로 근처 가격 탐색)
+PRODUCT_KEYWORDS = ["두바이", "쫀득", "쿠키", "두쫀쿠", "초콜릿쿠키"]
+
+PRICE_PATTERN = re.compile(r'(\d{1,3}(?:,\d{3})*)\s*원')
+SENTENCE_END = re.compile(r'[.\n!]')
+PRICE_MIN, PRICE_MAX = 1000, 11000
+PRICE_WINDOW = 30  # 제품 키워드 뒤 가격까지 허용 글자 수
+
+
+def _trie_pattern(words):
+    """키워드 목록을 접두사 트리 모양 정규식으로 변환 (위치마다 가장 긴 키워드 하나를 매칭)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # 여기서 끝나는 키워드가 있으면 더 긴 키워드를 먼저 시도하고 실패 시 여기서 종료
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class LexiconMatcher:
+    """
+    사전 키워드 / 제품 키워드를 정규식 하나(접두사 트리)로 컴파일해서 본문을 한 번만 훑는 매처
+
+    - 정규식 엔진(C)이 본문을 한 번 훑으며 위치마다 가장 긴 키워드를 찾으므로
+      비용이 사전 크기가 아니라 본문 길이에 비례
+    - 매칭된 키워드의 접두사 키워드 라벨도 함께 적중 처리 (예: "나쁘지 않은 가격" -> "나쁘지 않은")
+    - 더 긴 매칭에 가려질 수 있는 키워드(예: "최고가" 의 "고가")는 가린 키워드가 나왔을 때만 따로 확인
+    - 결과는 기존 match_lexicon / extract_price 와 동일
+    """
+
+    def __init__(self, lexicon=LEXICON, product_keywords=PRODUCT_KEYWORDS):
+        self.lexicon = lexicon
+        self.product_keywords = product_keywords
+
+        # 키워드 -> {(카테고리, 라벨)} (제품 키워드는 ("product", 키워드))
+        targets = {}
+        for category, labels in lexicon.items():
+            for label, keywords in labels.items():
+                for keyword in keywords:
+                    targets.setdefault(keyword, set()).add((category, label))
+        for keyword in product_keywords:
+            targets.setdefault(keyword, set()).add(("product", keyword))
+
+        # 매칭된 키워드의 모든 접두사 키워드 결과까지 미리 합쳐 둠
+        self._hits = {
+            word: tuple(set().union(*(targets[word[:i]] for i in range(1, len(word) + 1) if word[:i] in targets)))
+            for word in targets
+        }
+        # word 안쪽 위치에서 시작할 수 있는 키워드 (word 매칭에 가려져 findall 로는 안 보일 수 있음)
+        self._shadowed = {}
+        for word in targets:
+            rests = [word[i:] for i in range(1, len(word))]
+            shadowed = tuple(k for k in targets if any(k.startswith(r) or r.startswith(k) for r in rests))
+            if shadowed:
+                self._shadowed[word] = shadowed
+        self._pattern = re.compile(_trie_pattern(targets))
+
+    def scan(self, text):
+        """
+        본문을 한 번 훑어서 카테고리별 적중 라벨 수집
+
+        Returns:
+            dict: {"hits": {카테고리: {라벨}, "product": {본문에 나온 제품 키워드}}}
+        """
+        words = set(self._pattern.findall(text))
+        hits = {category: set() for category in self.lexicon}
+        hits["product"] = set()
+        for word in words:
+            for category, label in self._hits[word]:
+                hits[category].add(label)
+
+        # 가려졌을 수 있는 키워드는 아직 적중하지 않은 라벨이 있을 때만 본문에서 직접 확인
+        for word in words:
+            for keyword in self._shadowed.get(word, ()):
+                new_hits = [hit for hit in self._hits[keyword] if hit[1] not in hits[hit[0]]]
+                if new_hits and keyword in text:
+                    for category, label in new_hits:
+                        hits[category].add(label)
+        return {"hits": hits}
+
+    def _product_ends(self, text):
+        """제품 키워드별 등장 끝 위치 (겹치는 등장도 모두, 앞에서부터)"""
+        ends = {}
+        for keyword in self.product_keywords:
+            pos = text.find(keyword)
+            while pos >= 0:
+                ends.setdefault(keyword, []).append(pos + len(keyword))
+                pos = text.find(keyword, pos + 1)
+        return ends
+
+    def classify(self, scanned, category, default="보통"):
+        """적중 라벨 중 사전 순서상 첫 라벨 (match_lexicon 과 같은 우선순위)"""
+        found = scanned["hits"][category]
+        for label in self.lexicon[category]:
+            if label in found:
+                return label
+        return default
+
+    def find_price(self, text, scanned=None):
+        """
+        제품 키워드 근처의 가격과 위치
+
+        1. 제품 키워드가 있는 문장(., 줄바꿈, ! 기준)을 앞에서부터 보며 문장 안 첫 유효 가격
+        2. 없으면 제품 키워드 순서대로 키워드 뒤 30자 안(줄바꿈 없이)에서 가장 가까운 가격
+
+        Returns:
+            tuple: (가격, (시작, 끝)) 또는 (None, None)
+        """
+        scanned = scanned or self.scan(text)
+        if not scanned["hits"]["product"]:
+            return None, None
+        products = self._product_ends(text)
+
+        # 제품 키워드가 나온 문장만 앞에서부터 확인 (대부분 첫 문장에서 끝나므로 본문 전체를 나누지 않음)
+        checked = -1
+        for end in sorted(end for ends in products.values() for end in ends):
+            if end <= checked:
+                continue  # 이미 확인한 문장
+            start = max(text.rfind(".", 0, end), text.rfind("\n", 0, end), text.rfind("!", 0, end)) + 1
+            match = SENTENCE_END.search(text, end)
+            stop = match.start() if match else len(text)
+            for match in PRICE_PATTERN.finditer(text, start, stop):
+                value = int(match.group(1).replace(",", ""))
+                if PRICE_MIN <= value <= PRICE_MAX:
+                    return value, match.span(1)
+            checked = stop
+
+        for keyword in self.product_keywords:
+            for end in products.get(keyword, ()):
+                match = self._price_after(text, end)
+                if match:
+                    value = int(match.group(1).replace(",", ""))
+                    if PRICE_MIN <= value <= PRICE_MAX:
+                        return value, match.span(1)
+                    break  # 키워드의 첫 후보 가격만 확인 (기존 re.search 와 동일)
+        return None, None
+
+    @staticmethod
+    def _price_after(text, end):
+        """키워드 끝 위치 뒤 PRICE_WINDOW 글자 안에서 가장 가까운 가격 매치"""
+        for offset in range(PRICE_WINDOW + 1):
+            pos = end + offset
+            if pos >= len(text):
+                return None
+            if text[pos].isdigit():
+                match = PRICE_PATTERN.match(text, pos)
+                if match:
+                    return match
+            if text[pos] == "\n":
+                return None
+        return None
+
+
+# 프로세스 풀 워커마다 한 번만 만드는 매처 (정규식 컴파일 비용을 워커당 1회로)
+_worker_matcher = None
+
+
+def _init_worker():
+    global _worker_matcher
+    _worker_matcher = LexiconMatcher()
+
+
+def analyze_record(record, matcher):
+    """로컬 룰 기반 분석 (LocalReviewAnalyzer.analyze_locally 와 프로세스 풀 워커가 공유)"""
+    text = record['clean_content'] or ""
+    # 본문은 한 번만 훑고 모든 카테고리 / 가격에 재사용
+    scanned = matcher.scan(text)
+
+    # 1. 지역 추출 (스크레이퍼가 저장한 주소가 없으면 본문에서 주소 -> 자치구 순으로 추출)
+    region = record.get('address')
+    if not region:
+        extracted = region_extractor.extract(text)
+        region = extracted["address"] or extracted["district"] or '정보 없음'
+
+    # 2. 가격 정보 (정수형)
+    product_price, _ = matcher.find_price(text, scanned)
+
+    # 3. 가격 피드백 (기본값: 평범)
+    price_feedback = matcher.classify(scanned, "price", "평범")
+
+    # 4. 맛 평가 (기본값: 보통)
+    taste_rating = matcher.classify(scanned, "taste", "보통")
+
+    # 5. 재방문 의사 (기본값: 없음)
+    visit_again = matcher.classify(scanned, "visit", "없음")
+
+    # 6. 방문 사유 간소화
+    visit_reason = f"{taste_rating} 평가 및 {price_feedback} 가격대"
+
+    return {
+        "review_id": record['id'],
+        "region": region,
+        "product_price": product_price,  # 컬럼명 변경 및 정수 데이터 대입
+        "price_feedback": price_feedback,
+        "taste_rating": taste_rating,
+        "visit_again": visit_again,
+        "visit_reason": visit_reason
+    }
+
+
+def _analyze_chunk(records):
+    return [analyze_record(record, _worker_matcher) for record in records]
+
+
 class LocalReviewAnalyzer:
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
@@ -19,125 +257,128 @@ class LocalReviewAnalyzer:
             
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
         
-        # 키워드 사전 정의
-        self.lexicon = {
-            "price": {
-                "저렴": ["가성비", "저렴", "싼", "착한 가격", "혜자", "부담 없는"],
-                "비쌈": ["비싼", "사악", "가격대 있는", "양에 비해", "비싸다", "고가"],
-                "보통": ["적당", "보통", "무난", "나쁘지 않은 가격"]
-            },
-            "taste": {
-                "매우 맛있음": ["최고", "인생", "존맛", "역대급", "대박", "미쳤다"],
-                "맛있음": ["맛있", "추천", "괜찮", "굿", "성공적"],
-                "보통": ["보통", "평범", "무난", "나쁘지 않은"],
-                "맛없음": ["그저 그런", "쏘쏘", "제 스타일은 아닌", "아쉬운"],
-                "매우 맛없음": ["실망", "다시는 안", "돈 아까운", "최악"]
-            },
-            "visit": {
-                "있음": ["재방문", "또 갈", "자주 갈", "단골", "생각날"],
-                "고려": ["한두번은", "가끔", "근처라면", "생각해보면"],
-                "없음": ["다시는", "안 갈", "웨이팅하면서까지", "절대"]
-            }
-        }
+        self.lexicon = LEXICON
+        # 사전 / 제품 키워드를 한 번만 컴파일해서 모든 리뷰에 재사용
+        self.matcher = LexiconMatcher(self.lexicon, PRODUCT_KEYWORDS)
+        # 미분석 리뷰 조회에 anti-join 함수(fetch_unanalyzed_reviews) 사용 여부 (없으면 자동으로 끔)
+        self._use_rpc = True
 
     def extract_price(self, text):
         """본문에서 '두바이 쿠키' 키워드 근처의 가격 패턴만 정밀 추출 및 정수 반환 (1,000~11,000)"""
-        sentences = re.split(r'[.\n!]', text)
-        product_keywords = ["두바이", "쫀득", "쿠키", "두쫀쿠", "초콜릿쿠키"]
-        
-        for sentence in sentences:
-            if any(keyword in sentence for keyword in product_keywords):
-                price_matches = re.findall(r'(\d{1,3}(?:,\d{3})*)\s*원', sentence)
-                for price_str in price_matches:
-                    price_val = int(price_str.replace(",", ""))
-                    if 1000 <= price_val <= 11000:
-                        return price_val # 정수형으로 반환
-                        
-        for keyword in product_keywords:
-            pattern = rf"{keyword}.{{0,30}}?(\d{{1,3}}(?:,\d{{3}})*)\s*원"
-            match = re.search(pattern, text)
-            if match:
-                price_val = int(match.group(1).replace(",", ""))
-                if 1000 <= price_val <= 11000:
-                    return price_val # 정수형으로 반환
-
-        return None # 정보 없음 시 None(DB에서는 null) 반환
+        price, _ = self.matcher.find_price(text)
+        return price  # 정보 없음 시 None(DB에서는 null) 반환
 
     def match_lexicon(self, text, category, default="보통"):
         """사전 기반 키워드 매칭"""
-        for label, keywords in self.lexicon[category].items():
-            if any(k in text for k in keywords):
-                return label
-        return default
+        return self.matcher.classify(self.matcher.scan(text), category, default)
 
     def analyze_locally(self, record):
         """로컬 룰 기반 분석 실행"""
-        text = record['clean_content']
-        
-        # 1. 지역 추출
-        region = record.get('address', '정보 없음')
-        
-        # 2. 가격 정보 (정수형)
-        product_price = self.extract_price(text)
-        
-        # 3. 가격 피드백 (기본값: 평범)
-        price_feedback = self.match_lexicon(text, "price", "평범")
-        
-        # 4. 맛 평가 (기본값: 보통)
-        taste_rating = self.match_lexicon(text, "taste", "보통")
-        
-        # 5. 재방문 의사 (기본값: 없음)
-        visit_again = self.match_lexicon(text, "visit", "없음")
-        
-        # 6. 방문 사유 간소화
-        visit_reason = f"{taste_rating} 평가 및 {price_feedback} 가격대"
-
-        return {
-            "review_id": record['id'],
-            "region": region,
-            "product_price": product_price,  # 컬럼명 변경 및 정수 데이터 대입
-            "price_feedback": price_feedback,
-            "taste_rating": taste_rating,
-            "visit_again": visit_again,
-            "visit_reason": visit_reason
-        }
+        return analyze_record(record, self.matcher)
 
-    def run_analysis(self, limit=100):
-        print(f"Fetching {limit} records for Local Analysis...")
-        
-        # 1. 이미 분석된 review_id 목록 가져오기
-        analyzed_records = self.supabase.table("review_analysis_result")\
-            .select("review_id").execute()
-        analyzed_ids = {r['review_id'] for r in analyzed_records.data}
-        print(f"Total analyzed records in DB: {len(analyzed_ids)}")
-
-        # 2. 원본 리뷰 가져오기
-        records = self.supabase.table("blog_review").select("*").limit(limit).execute()
-        
-        if not records.data:
-            print("No records found in blog_review.")
-            return
+    def fetch_unanalyzed(self, after_id=0, page_size=1000):
+        """
+        아직 review_analysis_result 에 없는 리뷰를 id 순으로 한 페이지 가져오기 (keyset 페이지네이션)
 
-        processed_count = 0
-        for record in records.data:
-            # 3. 방어 로직: 이미 분석된 ID는 건너뛰기
-            if record['id'] in analyzed_ids:
-                continue
-                
-            print(f"Analyzing {record['id']}: {record['title'][:30]}...")
-            idx_result = self.analyze_locally(record)
-            
-            # 4. 별도의 결과 테이블에 저장
+        analysis_schema.sql 의 fetch_unanalyzed_reviews 함수(NOT EXISTS anti-join)를 사용하고,
+        함수가 아직 없으면 blog_review 를 id 순으로 읽고 해당 페이지의 id 만 결과 테이블에서 확인
+
+        Returns:
+            tuple: (분석할 리뷰 리스트, 다음 페이지 시작 id 또는 끝이면 None)
+        """
+        if self._use_rpc:
             try:
-                self.supabase.table("review_analysis_result").upsert(idx_result).execute()
-                print(f"✅ Saved analysis for ID {record['id']}")
-                processed_count += 1
+                rows = self.supabase.rpc(
+                    "fetch_unanalyzed_reviews", {"p_after_id": after_id, "p_limit": page_size}
+                ).execute().data
+                return rows, (rows[-1]["id"] if len(rows) == page_size else None)
             except Exception as e:
-                print(f"❌ DB Error: {e}")
-        
+                print(f"⚠️ fetch_unanalyzed_reviews 호출 실패, 페이지별 확인으로 전환: {e}")
+                self._use_rpc = False
+
+        page = self.supabase.table("blog_review")\
+            .select("id, clean_content, address")\
+            .gt("id", after_id)\
+            .order("id")\
+            .limit(page_size)\
+            .execute().data
+        if not page:
+            return [], None
+        done = self.supabase.table("review_analysis_result")\
+            .select("review_id")\
+            .in_("review_id", [r["id"] for r in page])\
+            .execute().data
+        done_ids = {r["review_id"] for r in done}
+        rows = [r for r in page if r["id"] not in done_ids]
+        return rows, (page[-1]["id"] if len(page) == page_size else None)
+
+    def iter_unanalyzed(self, limit=None, page_size=1000):
+        """분석할 리뷰를 페이지 단위로 끝까지(또는 limit 건까지) 내보냄"""
+        after_id, fetched = 0, 0
+        while after_id is not None:
+            rows, after_id = self.fetch_unanalyzed(after_id, page_size)
+            if limit is not None:
+                rows = rows[:limit - fetched]
+            if rows:
+                fetched += len(rows)
+                yield rows
+            if limit is not None and fetched >= limit:
+                return
+
+    def save_results(self, results, chunk_size=500):
+        """분석 결과를 chunk_size 건씩 묶어 upsert (review_id 기준). 저장한 건수 반환"""
+        saved = 0
+        for i in range(0, len(results), chunk_size):
+            chunk = results[i:i + chunk_size]
+            try:
+                self.supabase.table("review_analysis_result").upsert(chunk, on_conflict="review_id").execute()
+                saved += len(chunk)
+            except Exception as e:
+                print(f"❌ DB Error ({len(chunk)}건): {e}")
+        return saved
+
+    def run_analysis(self, limit=None, workers=None, page_size=1000, chunk_size=500):
+        """
+        미분석 리뷰 전체(또는 limit 건)를 분석해서 결과 테이블에 저장
+
+        Args:
+            limit: 이번 실행에서 분석할 최대 건수 (None 이면 전부)
+            workers: 분석 프로세스 수 (기본: CPU 수, 1 이면 현재 프로세스에서 분석)
+            page_size: 한 번에 가져올 리뷰 수
+            chunk_size: 한 번에 upsert 할 결과 수
+        """
+        workers = workers or os.cpu_count() or 1
+        print(f"Fetching {'all' if limit is None else limit} unanalyzed records for Local Analysis "
+              f"(workers={workers})...")
+
+        pages = self.iter_unanalyzed(limit, page_size)
+        processed_count = 0
+        if workers == 1:
+            for rows in pages:
+                processed_count += self.save_results([self.analyze_locally(r) for r in rows], chunk_size)
+                print(f"✅ Saved {processed_count} analyses")
+        else:
+            # 페이지 조회(메인 프로세스) / 룰 분석(워커) / 저장(메인 프로세스)이 겹쳐서 진행
+            # (executor.map 은 입력을 한꺼번에 모두 읽으므로 진행 중인 묶음 수를 workers * 2 로 제한)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                chunks = (rows[i:i + chunk_size] for rows in pages for i in range(0, len(rows), chunk_size))
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_analyze_chunk, chunk))
+                    if len(pending) >= workers * 2:
+                        processed_count += self.save_results(pending.popleft().result(), chunk_size)
+                        print(f"✅ Saved {processed_count} analyses")
+                while pending:
+                    processed_count += self.save_results(pending.popleft().result(), chunk_size)
+                    print(f"✅ Saved {processed_count} analyses")
+
+        if not processed_count:
+            print("No unanalyzed records found in blog_review.")
         print(f"\n✨ Analysis cycle completed. New records processed: {processed_count}")
+        return processed_count
+
 
 if __name__ == "__main__":
     analyzer = LocalReviewAnalyzer()
-    # 1000개 수집된 데이터에 맞춰 분석 한도를 늘립니다.
-    analyzer.run_analysis(limit=1000)
+    # 미분석 리뷰를 모두 분석합니다. (건수 제한: limit=1000)
+    analyzer.run_analysis()
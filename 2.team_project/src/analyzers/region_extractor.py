@@ -0,0 +1,131 @@
+"""
+서울 자치구 / 주소 추출기
+
+스크레이퍼가 글마다 자치구를 끼워 넣은 주소 정규식을 새로 만들고 타 지역 목록을 하나씩 찾던 부분을
+25개 구 전체를 담은 정규식 하나로 바꿔 한 번만 컴파일합니다.
+스크레이퍼(naver_scraper.py), LocalReviewAnalyzer, GeminiAnalyzer 후처리가 같은 규칙을 공유합니다.
+
+extract(text) 한 번으로 자치구 / 주소 / 신뢰도를 함께 반환합니다.
+    confidence 1.0  "서울(특별)시 OO구 ...로/길" 도로명 주소
+               0.8  "서울(특별)시 OO구 ...동/가/번지" 지번 주소
+               0.5  상세 주소는 없지만 본문 앞부분에 서울 자치구 언급
+               0.0  자치구를 찾지 못했거나 본문 앞부분이 타 지역 글
+"""
+import re
+
+SEOUL_DISTRICTS = [
+    "강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구",
+    "노원구", "도봉구", "동대문구", "동작구", "마포구", "서대문구", "서초구", "성동구",
+    "성북구", "송파구", "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구"
+]
+OTHER_REGIONS = ["제주", "부산", "대구", "인천", "광주", "대전", "울산", "수원", "성남", "고양", "용인", "천안", "청주"]
+
+# 타 지역 / 자치구 언급을 확인할 본문 앞부분 길이
+REGION_HEAD = 150
+DISTRICT_HEAD = 100
+ADDRESS_TEMPLATE = r"(서울특별시|서울시)\s+([가-힣]*?{district}[가-힣]*)\s+([가-힣\d\s-]+(?P<suffix>로|길|동|가|번지))"
+
+
+def _alternation(words):
+    # 긴 이름 먼저 (동대문구 / 서대문구 등이 짧은 이름보다 먼저 시도되도록)
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+class RegionExtractor:
+    """
+    서울 자치구 / 주소 추출기 (정규식은 생성 시 한 번만 컴파일)
+
+    Args:
+        districts (list): 자치구 이름 목록
+        other_regions (list): 서울이 아닌 글로 판단할 지역 이름 목록
+    """
+
+    def __init__(self, districts=SEOUL_DISTRICTS, other_regions=OTHER_REGIONS):
+        self.districts = list(districts)
+        district_group = f"(?P<district>{_alternation(self.districts)})"
+        self.address_pattern = re.compile(ADDRESS_TEMPLATE.format(district=district_group))
+        self.district_pattern = re.compile(_alternation(self.districts))
+        self.other_region_pattern = re.compile(_alternation(other_regions))
+        # 특정 구만 찾을 때 쓰는 구별 정규식 (처음 요청될 때 한 번만 컴파일)
+        self._district_patterns = {}
+
+    def _pattern_for(self, district):
+        pattern = self._district_patterns.get(district)
+        if pattern is None:
+            pattern = re.compile(ADDRESS_TEMPLATE.format(district=f"(?P<district>{re.escape(district)})"))
+            self._district_patterns[district] = pattern
+        return pattern
+
+    def is_other_region(self, text, district=None):
+        """본문 앞부분에 타 지역 이름이 있고 (지정한) 자치구 언급은 없으면 True"""
+        if not self.other_region_pattern.search(text, 0, REGION_HEAD):
+            return False
+        if district:
+            return district not in text[:DISTRICT_HEAD]
+        return not self.district_pattern.search(text, 0, DISTRICT_HEAD)
+
+    def find_address(self, text, district=None):
+        """서울 주소 match (district 를 주면 그 구의 주소만)"""
+        match = self.address_pattern.search(text)
+        if district is None or match is None or match.group("district") == district:
+            return match
+        # 다른 구 주소가 먼저 나온 경우에만 해당 구 정규식으로 다시 찾음
+        return self._pattern_for(district).search(text)
+
+    def extract(self, text, district=None):
+        """
+        본문 한 건에서 자치구 / 주소 / 신뢰도 추출
+
+        Args:
+            text (str): 정제된 본문
+            district (str): 이 구의 주소만 찾을 때 지정 (스크레이퍼의 검색 구)
+
+        Returns:
+            dict: {"district": str or None, "address": str or None, "confidence": float, "other_region": bool}
+        """
+        result = {"district": None, "address": None, "confidence": 0.0, "other_region": False}
+        if not text:
+            return result
+        if self.is_other_region(text, district):
+            result["other_region"] = True
+            return result
+
+        match = self.find_address(text, district)
+        if match:
+            result["district"] = match.group("district")
+            result["address"] = match.group(0)
+            result["confidence"] = 1.0 if match.group("suffix") in ("로", "길") else 0.8
+            return result
+
+        if district:
+            if district in text[:REGION_HEAD]:
+                result["district"], result["confidence"] = district, 0.5
+        else:
+            mention = self.district_pattern.search(text, 0, REGION_HEAD)
+            if mention:
+                result["district"], result["confidence"] = mention.group(0), 0.5
+        return result
+
+    def extract_many(self, texts, districts=None):
+        """
+        여러 본문을 한 번에 추출 (컴파일된 정규식 재사용)
+
+        Args:
+            texts (list): 본문 리스트
+            districts (list or str): 본문별 검색 구 리스트 또는 모든 본문에 같은 구 (생략 가능)
+
+        Returns:
+            list: extract() 결과 리스트 (입력 순서 유지)
+        """
+        if districts is None or isinstance(districts, str):
+            return [self.extract(text, districts) for text in texts]
+        return [self.extract(text, district) for text, district in zip(texts, districts)]
+
+
+# 모듈을 불러오는 곳(스크레이퍼 / 분석기 / 프로세스 풀 워커)마다 한 번만 컴파일
+default_extractor = RegionExtractor()
+
+
+def extract_region(text, district=None):
+    """기본 추출기로 한 건 추출"""
+    return default_extractor.extract(text, district)
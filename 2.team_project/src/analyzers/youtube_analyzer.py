@@ -1,12 +1,16 @@
 import os
+import re
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import timedelta
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
 # .env 로드
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../.env'))
 
+# 감쇠율 계산 시 '최근'으로 보는 기간
+RECENT_DAYS = 7
+
 class YouTubeReviewAnalyzer:
     def __init__(self):
         self.supabase_url = os.getenv("SUPABASE_URL")
@@ -19,40 +23,50 @@ class YouTubeReviewAnalyzer:
             "negative": ["비싸다", "사악", "질림", "거품", "탕후루꼴", "돈아깝", "별로", "실패"],
             "interest": ["안올라오나", "최근", "소식", "어디"]
         }
+        # 긍정 / 부정 키워드 전체를 하나로 묶은 정규식 (키워드가 하나도 없는 댓글을 한 번에 걸러냄)
+        self.sentiment_pattern = re.compile("|".join(
+            re.escape(k) for k in self.lexicon["positive"] + self.lexicon["negative"]))
 
-    def fetch_comments(self, video_ids=None):
-        """Supabase에서 댓글 데이터 로드"""
-        query = self.supabase.table("youtube_comments").select("*")
-        if video_ids:
-            query = query.in_("video_id", video_ids)
-        
-        response = query.execute()
-        return response.data
+    def fetch_comments(self, video_ids=None, columns="*", page_size=1000):
+        """Supabase에서 댓글 데이터 로드 (id 순 keyset 페이지네이션으로 1000건 제한 없이 전체, columns 에 id 포함)"""
+        rows, last_id = [], 0
+        while True:
+            query = self.supabase.table("youtube_comments").select(columns).gt("id", last_id)
+            if video_ids:
+                query = query.in_("video_id", video_ids)
+            page = query.order("id").limit(page_size).execute().data
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+            last_id = page[-1]["id"]
+
+    def load_comments_frame(self, video_ids=None):
+        """분석에 필요한 컬럼만 한 번에 불러와 DataFrame 으로 (published_at 은 UTC datetime)"""
+        df = pd.DataFrame(self.fetch_comments(video_ids, columns="id, video_id, text, published_at"),
+                          columns=["id", "video_id", "text", "published_at"])
+        df['published_at'] = pd.to_datetime(df['published_at'], utc=True)
+        df['text'] = df['text'].fillna("")
+        return df
+
+    def analyze_decay_rates(self, df, now=None):
+        """모든 영상의 관심도 감쇠 지표를 groupby 한 번으로 계산
+
+        Returns:
+            pd.Series: video_id -> 최근 7일 댓글 비중(%)
+        """
+        if df.empty:
+            return pd.Series(dtype=float)
+        now = now or pd.Timestamp.now(tz="UTC")
+        is_recent = df['published_at'] >= now - timedelta(days=RECENT_DAYS)
+        return is_recent.groupby(df['video_id']).mean() * 100
 
     def analyze_decay_rate(self, video_id, published_at):
         """관심도 감쇠 지표(Decay Rate) 계산
         - 과거 영상에 '최근' 댓글이 얼마나 달리는가 확인
         """
-        # 해당 영상의 모든 댓글 로드
-        comments = self.supabase.table("youtube_comments")\
-            .select("published_at")\
-            .eq("video_id", video_id)\
-            .execute().data
-        
-        if not comments:
-            return 0.0
-        
-        df = pd.DataFrame(comments)
-        df['published_at'] = pd.to_datetime(df['published_at'])
-        
-        # 최근 7일 내 댓글 수
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        recent_count = len(df[df['published_at'] >= seven_days_ago])
-        total_count = len(df)
-        
-        # 감쇠율 (최근 댓글 비중)
-        decay_rate = (recent_count / total_count) * 100 if total_count > 0 else 0
-        return decay_rate
+        # 여러 영상은 load_comments_frame + analyze_decay_rates 로 한 번에 계산
+        rates = self.analyze_decay_rates(self.load_comments_frame([video_id]))
+        return float(rates.get(video_id, 0.0))
 
     def analyze_sentiment(self, text):
         """댓글 텍스트 감성 키워드 분석"""
@@ -65,16 +79,29 @@ class YouTubeReviewAnalyzer:
             return "부정"
         return "중립"
 
+    def analyze_sentiments(self, texts):
+        """댓글 Series 전체의 감성 라벨 (analyze_sentiment 와 같은 규칙, 키워드별 str.contains 로 벡터화)"""
+        texts = texts.fillna("")
+        labels = pd.Series("중립", index=texts.index)
+        # 키워드가 하나라도 있는 댓글만 키워드별로 다시 확인
+        candidates = texts[texts.str.contains(self.sentiment_pattern)]
+        if candidates.empty:
+            return labels
+        pos_hits = sum(candidates.str.contains(k, regex=False).astype(int) for k in self.lexicon["positive"])
+        neg_hits = sum(candidates.str.contains(k, regex=False).astype(int) for k in self.lexicon["negative"])
+        labels[pos_hits[pos_hits > neg_hits].index] = "긍정"
+        labels[neg_hits[neg_hits > pos_hits].index] = "부정"
+        return labels
+
     def run_temporal_analysis(self):
-        """시계열 여론 변화 분석 실행 보고서 생성"""
-        comments = self.fetch_comments()
-        if not comments:
+        """시계열 여론 변화 분석 실행 보고서 생성 (댓글은 한 번만 불러와 모든 영상 / 기간에 재사용)"""
+        df = self.load_comments_frame()
+        if df.empty:
             print("데이터가 없습니다.")
             return
 
-        df = pd.DataFrame(comments)
-        df['published_at'] = pd.to_datetime(df['published_at'])
-        
+        df['sentiment'] = self.analyze_sentiments(df['text'])
+
         # 기간별 분리 (도입기 vs 성숙기)
         # 예: 25년 11월 이전 vs 26년 1월 이후
         intro_period = df[df['published_at'] < '2025-12-01']
@@ -88,13 +115,17 @@ class YouTubeReviewAnalyzer:
                 print("  데이터 없음")
                 continue
             
-            sentiments = data['text'].apply(self.analyze_sentiment)
-            sentiment_counts = sentiments.value_counts(normalize=True) * 100
+            sentiment_counts = data['sentiment'].value_counts(normalize=True) * 100
             
             print(f"  - 수집 댓글 수: {len(data)}")
             for label, pct in sentiment_counts.items():
                 print(f"  - {label} 비율: {pct:.1f}%")
 
+        decay_rates = self.analyze_decay_rates(df).sort_values(ascending=False)
+        print(f"\n=== 영상별 관심도 감쇠율 (최근 {RECENT_DAYS}일 댓글 비중, {len(decay_rates)}개 영상) ===")
+        for video_id, rate in decay_rates.items():
+            print(f"  - {video_id}: {rate:.1f}%")
+
 if __name__ == "__main__":
     analyzer = YouTubeReviewAnalyzer()
     analyzer.run_temporal_analysis()
@@ -0,0 +1,4 @@
+from .client import NaverBlogCountClient, daterange, parse_search_response
+from .crawler import NaverBlogCrawler
+from .page_cache import PageCache
+from .sink import BatchWriter, CsvSink, ParquetSink, SupabaseSink, make_file_sink
@@ -0,0 +1,141 @@
+"""
+네이버 블로그 수집기 벤치마크
+
+실제 네이버 서버에 부하를 주지 않도록 로컬 가짜 SearchList.naver 서버를 띄우고
+기존 방식(순차 요청 + 매번 0.5초 대기)과 공용 클라이언트(daily / bisect 모드)를 비교합니다.
+
+실행 (2.team_project/src 에서):
+    python -m naver_blog.benchmark --days 90 --latency 0.05 --sparsity 0.7
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from . import client as client_module
+from .client import NaverBlogCountClient, daterange
+
+# 가짜 서버가 요청마다 돌아가며 붙이는 XSSI 접두어 (쉼표 없는 형태 / 접두어 없음 포함)
+XSSI_PREFIXES = (b")]}',\n", b")]}'\n", b"  )]}',", b"")
+
+
+def fake_daily_count(keyword, date_str, sparsity):
+    """키워드 + 날짜로 항상 같은 일별 포스팅 수 생성 (sparsity 비율만큼은 0건)"""
+    digest = int(hashlib.md5(f"{keyword}|{date_str}".encode()).hexdigest(), 16)
+    if (digest % 1000) / 1000 < sparsity:
+        return 0
+    return digest % 300 + 1
+
+
+def make_handler(latency, sparsity, stats):
+    class FakeSearchHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query)
+            keyword = query.get("keyword", [""])[0]
+            start = query.get("startDate", [""])[0]
+            end = query.get("endDate", [""])[0]
+            total = sum(fake_daily_count(keyword, d, sparsity) for d in daterange(start, end))
+
+            time.sleep(latency)
+            with stats["lock"]:
+                stats["requests"] += 1
+                prefix = XSSI_PREFIXES[stats["requests"] % len(XSSI_PREFIXES)]
+
+            body = json.dumps({"result": {"totalCount": total}}).encode()
+            # 실제 응답처럼 XSSI 접두어를 붙여서 파싱 경로도 함께 검증
+            body = prefix + body
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeSearchHandler
+
+
+def legacy_sequential(url, keywords, dates, delay):
+    """기존 크롤러 방식: 새 연결로 하나씩 요청하고 매번 delay 초 대기"""
+    rows = []
+    for date_str in dates:
+        for keyword in keywords:
+            params = {"keyword": keyword, "startDate": date_str, "endDate": date_str}
+            response = requests.get(url, params=params, timeout=10)
+            text = response.text
+            data = json.loads(text[text.find('{'):])
+            rows.append({"date": date_str, "keyword": keyword,
+                         "total_count": data["result"]["totalCount"]})
+            time.sleep(delay)
+    return rows
+
+
+def run_case(name, stats, func):
+    with stats["lock"]:
+        stats["requests"] = 0
+    started = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - started
+    return {"name": name, "seconds": elapsed, "requests": stats["requests"], "rows": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 블로그 수집기 벤치마크 (로컬 가짜 서버)")
+    parser.add_argument("--keywords", default="두쫀쿠,포켓몬빵", help="쉼표로 구분한 키워드")
+    parser.add_argument("--days", type=int, default=60, help="수집 일수")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버 응답 지연 (초)")
+    parser.add_argument("--sparsity", type=float, default=0.7, help="포스팅 0건인 날 비율 (0~1)")
+    parser.add_argument("--legacy-delay", type=float, default=0.5, help="기존 방식 요청 간 대기 (초)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rps", type=float, default=4.0, help="공용 클라이언트 초당 요청 상한")
+    args = parser.parse_args()
+
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+    end_date = datetime(2025, 12, 31)
+    dates = list(daterange(datetime.fromordinal(end_date.toordinal() - args.days + 1), end_date))
+
+    stats = {"lock": threading.Lock(), "requests": 0}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency, args.sparsity, stats))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/ajax/SearchList.naver"
+
+    # 공용 클라이언트가 가짜 서버로 요청하도록 주소만 교체
+    original_url = client_module.SEARCH_URL
+    client_module.SEARCH_URL = url
+    try:
+        print(f"[*] {len(keywords)}개 키워드 x {len(dates)}일 = {len(keywords) * len(dates)}개 (날짜 x 키워드)")
+        print(f"[*] 응답 지연 {args.latency}s, 0건 비율 {args.sparsity:.0%}\n")
+
+        results = [run_case("legacy (sequential + sleep)", stats,
+                            lambda: legacy_sequential(url, keywords, dates, args.legacy_delay))]
+        for mode in ("daily", "bisect"):
+            client = NaverBlogCountClient(max_workers=args.workers, requests_per_second=args.rps, mode=mode)
+            results.append(run_case(f"client ({mode})", stats,
+                                    lambda: list(client.iter_daily_counts(keywords, dates[0], dates[-1]))))
+    finally:
+        client_module.SEARCH_URL = original_url
+        server.shutdown()
+
+    def as_key(rows):
+        return sorted((r["date"], r["keyword"], r["total_count"]) for r in rows)
+
+    expected = as_key(results[0]["rows"])
+    baseline = results[0]["seconds"]
+    print(f"{'case':<30}{'seconds':>10}{'requests':>10}{'speedup':>10}  match")
+    for result in results:
+        match = "OK" if as_key(result["rows"]) == expected else "MISMATCH"
+        print(f"{result['name']:<30}{result['seconds']:>10.2f}{result['requests']:>10}"
+              f"{baseline / result['seconds']:>9.1f}x  {match}")
+
+
+if __name__ == "__main__":
+    main()
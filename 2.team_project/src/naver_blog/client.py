@@ -0,0 +1,257 @@
+"""
+네이버 블로그 검색 결과 수(totalCount) 수집 클라이언트
+
+여러 크롤러(naver_dag, pokemon_crawling, jw_naver_crawling, naver_keyword_blog_crawling,
+mara_crawling)가 (날짜 x 키워드) 조합을 하나씩 순서대로 요청하고 매번 0.5초씩 쉬던 부분을
+한 곳에 모았습니다.
+
+- 스레드별로 requests.Session 을 유지해 keep-alive 로 TCP 연결을 재사용
+- max_workers 개까지 동시에 요청하되, requests_per_second 로 전체 요청 속도를 제한 (네이버 서버 예의)
+- 결과는 요청 순서(날짜순)대로 하나씩 흘려보내므로 BatchWriter 로 바로 저장 가능
+- mode="bisect": 긴 기간의 totalCount 를 먼저 조회하고 0이 아닌 구간만 반으로 나눠 일별 값을 복원
+  (포스팅이 드문 키워드는 요청 수가 크게 줄고, 매일 포스팅이 있는 키워드도 일별 조회보다 많아지지 않음)
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SEARCH_URL = "https://section.blog.naver.com/ajax/SearchList.naver"
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*"
+}
+# 응답 앞에 붙는 JSON 하이재킹 방지용 접두어 (")]}'," / ")]}'" + 줄바꿈 등 쉼표와 공백이 달라질 수 있음)
+XSSI_PREFIX_PATTERN = re.compile(r"^\s*\)\]\}',?\s*")
+# 재시도할 HTTP 상태 코드 (요청 과다 / 일시적 서버 오류)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def parse_search_response(text):
+    """SearchList.naver 응답 본문 -> dict (XSSI 접두어 제거 후 파싱)"""
+    text = XSSI_PREFIX_PATTERN.sub("", text, count=1)
+    try:
+        return json.loads(text)
+    except ValueError:
+        # 모르는 접두어가 붙은 경우: 기존 크롤러처럼 첫 '{' 부터 파싱
+        start = text.find("{")
+        if start <= 0:
+            raise
+        return json.loads(text[start:])
+
+
+class RateLimiter:
+    """모든 스레드가 공유하는 요청 간격 제한기 (초당 최대 requests_per_second 회)"""
+
+    def __init__(self, requests_per_second):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second else 0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        if not self.min_interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.min_interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class NaverBlogCountClient:
+    """
+    네이버 블로그 포스팅 수 조회 클라이언트 (세션 재사용 + 동시 요청)
+
+    Args:
+        max_workers (int): 동시에 보낼 최대 요청 수
+        requests_per_second (float): 전체 초당 요청 수 상한 (기존 순차 수집은 약 2회/초)
+        timeout (float): 요청 타임아웃 (초)
+        max_retries (int): 네트워크 오류 / 429 / 5xx 응답 시 재시도 횟수
+        backoff (float): 재시도 대기 기본 시간 (초, 시도마다 2배 + 무작위 지터)
+        mode (str): "daily" (하루씩 조회) 또는 "bisect" (구간 조회 후 필요한 곳만 이분 분할)
+        chunk_days (int): bisect 모드에서 처음 조회할 구간 길이 (일)
+    """
+
+    def __init__(self, max_workers=4, requests_per_second=4.0, timeout=10, max_retries=3, backoff=1.0,
+                 mode="daily", chunk_days=32):
+        if mode not in ("daily", "bisect"):
+            raise ValueError(f"[!] 지원하지 않는 수집 모드입니다: {mode} (daily / bisect)")
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.mode = mode
+        self.chunk_days = max(1, chunk_days)
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._local = threading.local()
+
+    def _session(self):
+        """스레드마다 하나의 Session 을 만들어 재사용 (keep-alive)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount("https://", adapter)
+            self._local.session = session
+        return session
+
+    def get_blog_count(self, keyword, start_date="", end_date=""):
+        """
+        특정 기간 동안의 블로그 포스팅 수를 가져옵니다.
+
+        Returns:
+            int or None: 포스팅 수 (실패 시 None)
+        """
+        params = {
+            "countPerPage": "7",
+            "currentPage": "1",
+            "startDate": start_date,
+            "endDate": end_date,
+            "keyword": keyword,
+            "orderBy": "sim"
+        }
+        headers = {
+            "Referer": f"https://section.blog.naver.com/Search/Post.naver?pageNo=1&rangeType=ALL&orderBy=sim&keyword={quote(keyword)}"
+        }
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.wait()
+            try:
+                response = self._session().get(SEARCH_URL, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = e
+            else:
+                if response.status_code == 200:
+                    try:
+                        data = parse_search_response(response.text)
+                    except ValueError as e:
+                        print(f"[-] Invalid JSON for keyword '{keyword}': {e}")
+                        return None
+                    return data.get("result", {}).get("totalCount", 0)
+                if response.status_code not in RETRY_STATUS:
+                    print(f"[-] HTTP Error {response.status_code} for keyword: {keyword}")
+                    return None
+                error = f"HTTP {response.status_code}"
+
+            if attempt < self.max_retries:
+                # 지수 백오프 + 지터 (여러 스레드가 동시에 재시도하지 않도록)
+                time.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+        print(f"[-] Error fetching count for '{keyword}' ({start_date}~{end_date}): {error}")
+        return None
+
+    def iter_daily_counts(self, keywords, start_date, end_date, mode=None):
+        """
+        (날짜 x 키워드) 조합의 일별 포스팅 수를 동시에 조회해 날짜순으로 하나씩 반환
+
+        Args:
+            keywords (list): 검색 키워드 리스트
+            start_date (str or datetime): 시작일 (포함)
+            end_date (str or datetime): 종료일 (포함)
+            mode (str): 이번 호출에만 쓸 수집 모드 (생략 시 클라이언트 설정)
+
+        Yields:
+            dict: {"date": "YYYY-MM-DD", "keyword": str, "total_count": int or None}
+                  (total_count 가 None 이면 조회 실패)
+        """
+        if (mode or self.mode) == "bisect":
+            # 구간(chunk) x 키워드 단위로 이분 분할 작업을 나눠 동시에 실행
+            tasks = ((chunk, keyword)
+                     for chunk in chunked(list(daterange(start_date, end_date)), self.chunk_days)
+                     for keyword in keywords)
+            chunk_rows = []
+            for i, rows in enumerate(self._ordered_map(lambda task: self.bisect_counts(task[1], task[0]), tasks), 1):
+                chunk_rows.extend(rows)
+                # 한 구간의 모든 키워드가 끝나면 날짜순으로 정렬해서 반환 (daily 모드와 같은 순서)
+                if i % len(keywords) == 0:
+                    yield from sorted(chunk_rows, key=lambda row: row["date"])
+                    chunk_rows = []
+            return
+
+        tasks = ((date_str, keyword)
+                 for date_str in daterange(start_date, end_date)
+                 for keyword in keywords)
+        yield from self._ordered_map(
+            lambda task: {"date": task[0], "keyword": task[1],
+                          "total_count": self.get_blog_count(task[1], task[0], task[0])},
+            tasks
+        )
+
+    def bisect_counts(self, keyword, dates, total=None):
+        """
+        구간 합계를 먼저 조회하고, 0이 아닌 구간만 반으로 나눠 일별 포스팅 수를 복원
+
+        왼쪽 절반만 조회하고 오른쪽은 (전체 - 왼쪽)으로 계산하므로
+        요청 수는 최대 일수와 같고, 포스팅이 없는 구간은 요청 한 번으로 끝납니다.
+
+        Args:
+            keyword (str): 검색 키워드
+            dates (list): 연속된 날짜 문자열 리스트 ("YYYY-MM-DD")
+            total (int): 이미 알고 있는 구간 합계 (없으면 조회)
+
+        Returns:
+            list: {"date", "keyword", "total_count"} 행 리스트 (날짜순)
+        """
+        if total is None:
+            total = self.get_blog_count(keyword, dates[0], dates[-1])
+            if total is None:
+                # 구간 조회 실패 -> 하루씩 조회로 대체
+                return [{"date": d, "keyword": keyword, "total_count": self.get_blog_count(keyword, d, d)}
+                        for d in dates]
+
+        if total == 0 or len(dates) == 1:
+            return [{"date": d, "keyword": keyword, "total_count": total if len(dates) == 1 else 0}
+                    for d in dates]
+
+        mid = len(dates) // 2
+        left_dates, right_dates = dates[:mid], dates[mid:]
+
+        left_total = self.get_blog_count(keyword, left_dates[0], left_dates[-1])
+        right_total = None
+        if left_total is not None and 0 <= left_total <= total:
+            right_total = total - left_total
+        # 검색 결과 수가 정확히 합산되지 않는 경우(왼쪽 > 전체) 오른쪽도 직접 조회
+        return (self.bisect_counts(keyword, left_dates, left_total)
+                + self.bisect_counts(keyword, right_dates, right_total))
+
+    def _ordered_map(self, func, tasks):
+        """진행 중인 요청 수를 제한하면서 작업 순서대로 결과를 돌려줌 (메모리 사용량 일정)"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(func, task))
+                if len(pending) >= self.max_workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def to_datetime(value):
+    """'YYYY-MM-DD' 문자열 / date / datetime -> datetime"""
+    if isinstance(value, str):
+        return datetime.strptime(value[:10], "%Y-%m-%d")
+    return datetime(value.year, value.month, value.day)
+
+
+def daterange(start_date, end_date):
+    """시작일 ~ 종료일(포함) 날짜 문자열 생성"""
+    current_dt = to_datetime(start_date)
+    end_dt = to_datetime(end_date)
+    while current_dt <= end_dt:
+        yield current_dt.strftime("%Y-%m-%d")
+        current_dt += timedelta(days=1)
+
+
+def chunked(items, size):
+    """리스트를 size 개씩 나누기"""
+    return [items[i:i+size] for i in range(0, len(items), size)]
@@ -0,0 +1,80 @@
+"""
+네이버 블로그 일별 포스팅 수 수집기 (공용)
+
+naver_dag, pokemon_crawling, jw_naver_crawling, mara_crawling, naver_keyword_blog_crawling 에
+각각 복사돼 있던 NaverBlogCrawler 의 공통 부분입니다.
+각 프로젝트는 자기 DB 매니저만 만들어서 db 로 넘기면 됩니다.
+"""
+from datetime import datetime, timedelta
+
+from .client import NaverBlogCountClient, to_datetime
+from .sink import BatchWriter, make_file_sink
+
+
+class NaverBlogCrawler:
+    """
+    네이버 블로그 일별 포스팅 수 수집기
+
+    Args:
+        db: insert_blog_trends(rows) 메서드가 있는 DB 매니저 (없으면 파일로만 저장)
+        max_workers (int): 동시 요청 수
+        requests_per_second (float): 초당 요청 상한
+        count_mode (str): "daily"(하루씩 조회) / "bisect"(긴 구간 합계 조회 후 0이 아닌 구간만 나눠서 일별 값 복원)
+    """
+
+    def __init__(self, db=None, max_workers=4, requests_per_second=4.0, count_mode="daily"):
+        self.client = NaverBlogCountClient(
+            max_workers=max_workers, requests_per_second=requests_per_second, mode=count_mode
+        )
+        self.db = db
+
+    def get_blog_count(self, keyword, start_date="", end_date=""):
+        """특정 기간 동안의 블로그 포스팅 수 조회 (실패 시 None)"""
+        return self.client.get_blog_count(keyword, start_date, end_date)
+
+    def iter_daily_counts(self, keywords, start_date, end_date):
+        """(날짜 x 키워드) 일별 포스팅 수를 동시에 조회해 날짜순으로 반환"""
+        return self.client.iter_daily_counts(keywords, start_date, end_date)
+
+    def run(self, keywords, start_date=None, end_date=None, days=180, output_file=None, batch_size=100):
+        """
+        기간 내 일별 포스팅 수를 수집해 파일(CSV/Parquet)과 DB에 일괄 저장
+
+        Args:
+            keywords (list): 검색 키워드 리스트
+            start_date, end_date (str or datetime): 수집 기간 (없으면 어제 기준 days일)
+            days (int): 기간 미지정 시 수집 일수
+            output_file (str): 저장 파일 경로 (.csv / .parquet, 없으면 파일 저장 생략)
+            batch_size (int): 몇 행마다 저장할지
+
+        Returns:
+            list: 수집 성공한 행 리스트
+        """
+        if start_date and end_date:
+            start_date_dt = to_datetime(start_date)
+            end_date_dt = to_datetime(end_date)
+        else:
+            end_date_dt = datetime.now() - timedelta(days=1)
+            start_date_dt = end_date_dt - timedelta(days=days)
+
+        print(f"[+] Starting daily aggregation for {len(keywords)} keywords")
+        print(f"[+] Period: {start_date_dt.strftime('%Y-%m-%d')} ~ {end_date_dt.strftime('%Y-%m-%d')}")
+
+        sinks = [make_file_sink(output_file)]
+        if self.db:
+            sinks.append(self.db.insert_blog_trends)
+
+        results = []
+        with BatchWriter(sinks, batch_size=batch_size) as writer:
+            for data_row in self.iter_daily_counts(keywords, start_date_dt, end_date_dt):
+                count = data_row["total_count"]
+                if count is None:
+                    print(f"  [-] {data_row['date']} {data_row['keyword']}: Failed")
+                    continue
+                print(f"  [+] {data_row['date']} {data_row['keyword']}: {count:,}건")
+                results.append(data_row)
+                writer.write(data_row)
+
+        saved_to = f" Results saved to {output_file}" if output_file else ""
+        print(f"\n[+] Successfully completed daily aggregation ({len(results)} rows).{saved_to}")
+        return results
@@ -0,0 +1,159 @@
+"""
+네이버 블로그 본문 페이지 로컬 캐시
+
+스크레이퍼를 다시 돌리거나 주소 / 가격 추출 로직만 바꿔서 재분석할 때마다
+같은 PostView.naver 페이지를 다시 내려받던 부분을 디스크 캐시로 대체합니다.
+
+- 키: (blogId, logNo) -> blog.naver.com/{id}/{no}, PostView.naver?blogId=..&logNo=.., m.blog.naver.com 모두 같은 글로 취급
+- 저장: {directory}/{blogId}/{logNo}.json.gz (HTML + ETag / Last-Modified + 받은 시각, gzip 압축)
+- ttl 이내면 네트워크 없이 캐시 반환, 지나면 If-None-Match / If-Modified-Since 로 재검증 (304 면 본문 재다운로드 없음)
+- offline=True 면 요청을 보내지 않고 캐시에 있는 글만 반환 (재파싱 / 재추출 전용)
+- validate 로 본문이 없는 페이지(삭제 / 비공개 글 안내 등)를 가려 empty_ttl 동안만 캐시 (곧 다시 확인)
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+DEFAULT_TTL = 7 * 24 * 3600
+# 본문이 없는 페이지는 일시적인 오류일 수 있어 짧게만 캐시
+EMPTY_TTL = 3600
+
+
+def blog_post_key(url):
+    """블로그 글 주소 -> (blogId, logNo) (네이버 블로그 글 주소가 아니면 None)"""
+    parsed = urlparse(url)
+    if not parsed.netloc.endswith("blog.naver.com"):
+        return None
+    query = parse_qs(parsed.query)
+    if query.get("blogId") and query.get("logNo"):
+        return query["blogId"][0], query["logNo"][0]
+    parts = [p for p in parsed.path.split("/") if p]
+    if len(parts) >= 2 and parts[1].isdigit():
+        return parts[0], parts[1]
+    return None
+
+
+class PageCache:
+    """
+    블로그 본문 HTML 디스크 캐시 (스레드 여러 개가 동시에 써도 파일 단위로 원자적 교체)
+
+    Args:
+        directory (str): 캐시 디렉토리
+        ttl (float): 재검증 없이 캐시를 그대로 쓸 시간 (초)
+        offline (bool): True 면 네트워크 요청 없이 캐시만 사용
+        validate (callable): validate(html) -> 본문이 있는 정상 페이지인지 (None 이면 모두 정상으로 취급)
+        empty_ttl (float): validate 를 통과하지 못한 페이지를 재요청 없이 쓸 시간 (초)
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_TTL, offline=False, validate=None, empty_ttl=EMPTY_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.offline = offline
+        self.validate = validate
+        self.empty_ttl = empty_ttl
+        self.stats = {"hit": 0, "revalidated": 0, "fetched": 0, "miss": 0}
+        self._stats_lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, url):
+        key = blog_post_key(url)
+        if key is None:
+            # 블로그 글이 아닌 주소는 URL 해시로 저장
+            return os.path.join(self.directory, "_other", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json.gz")
+        return os.path.join(self.directory, key[0], f"{key[1]}.json.gz")
+
+    def get(self, url):
+        """캐시 항목 (없거나 깨졌으면 None)"""
+        try:
+            with gzip.open(self.path(url), "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, html, etag=None, last_modified=None, valid=True):
+        entry = {"url": url, "fetched_at": time.time(), "etag": etag,
+                 "last_modified": last_modified, "html": html, "valid": valid}
+        path = self.path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체 (중간에 멈추거나 다른 스레드가 읽어도 반쯤 쓰인 파일이 보이지 않음)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return entry
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def is_fresh(self, entry):
+        if entry is None:
+            return False
+        ttl = self.ttl if entry.get("valid", True) else self.empty_ttl
+        return time.time() - entry.get("fetched_at", 0) < ttl
+
+    def fetch(self, session, url, timeout=10, before_request=None):
+        """
+        캐시를 거쳐 페이지 HTML 가져오기
+
+        Args:
+            session: requests.Session (요청 URL 은 호출하는 쪽에서 PostView 주소로 바꿔서 전달)
+            url (str): 요청할 주소
+            before_request (callable): 실제로 네트워크 요청을 보내기 직전에 호출 (속도 제한용)
+
+        Returns:
+            str or None: HTML (받지 못했고 캐시에도 없으면 None)
+        """
+        entry = self.get(url)
+        if self.offline or self.is_fresh(entry):
+            self._count("hit" if entry else "miss")
+            return entry["html"] if entry else None
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        if before_request:
+            before_request()
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except Exception:
+            # 네트워크 오류면 오래된 캐시라도 반환
+            return entry["html"] if entry else None
+
+        if response.status_code == 304 and entry:
+            self._count("revalidated")
+            self.put(url, entry["html"], entry.get("etag"), entry.get("last_modified"), entry.get("valid", True))
+            return entry["html"]
+        if response.status_code != 200:
+            return entry["html"] if entry else None
+
+        self._count("fetched")
+        valid = self.validate is None or bool(self.validate(response.text))
+        self.put(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"), valid)
+        return response.text
+
+    def iter_entries(self):
+        """캐시된 모든 페이지 항목 (오프라인 재파싱용)"""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json.gz"):
+                    continue
+                try:
+                    with gzip.open(os.path.join(root, name), "rt", encoding="utf-8") as f:
+                        yield json.load(f)
+                except (OSError, ValueError):
+                    continue
@@ -0,0 +1,109 @@
+"""
+수집 결과 일괄 저장 도구
+
+한 행씩 DB upsert / CSV append 하던 방식을 batch_size 개씩 모아서 한 번에 저장하도록 바꿉니다.
+"""
+import os
+
+import pandas as pd
+
+
+class BatchWriter:
+    """
+    행을 모아서 여러 저장소(sink)에 한 번에 기록
+
+    Args:
+        sinks (list): rows(list of dict) 를 받아 저장하는 함수/객체 리스트
+        batch_size (int): 몇 행마다 저장할지
+
+    사용 예:
+        with BatchWriter([db.insert_blog_trends, CsvSink("out.csv")]) as writer:
+            for row in client.iter_daily_counts(...):
+                writer.write(row)
+    """
+
+    def __init__(self, sinks, batch_size=100):
+        self.sinks = [sink for sink in sinks if sink]
+        self.batch_size = batch_size
+        self.buffer = []
+        self.written = 0
+
+    def write(self, row):
+        self.buffer.append(row)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        rows, self.buffer = self.buffer, []
+        for sink in self.sinks:
+            try:
+                sink(rows)
+            except Exception as e:
+                print(f"[!] 일괄 저장 중 오류 발생 ({len(rows)}건): {e}")
+        self.written += len(rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 중간에 멈춰도(KeyboardInterrupt 등) 모아둔 데이터는 저장
+        self.flush()
+        return False
+
+
+class CsvSink:
+    """CSV 파일에 이어쓰기 (파일이 없으면 헤더 포함해서 생성)"""
+
+    def __init__(self, path, columns=("date", "keyword", "total_count")):
+        self.path = path
+        self.columns = list(columns)
+
+    def __call__(self, rows):
+        df = pd.DataFrame(rows, columns=self.columns)
+        if os.path.exists(self.path):
+            df.to_csv(self.path, mode='a', index=False, header=False, encoding='utf-8-sig')
+        else:
+            df.to_csv(self.path, index=False, encoding='utf-8-sig')
+
+
+class SupabaseSink:
+    """Supabase 테이블에 일괄 upsert"""
+
+    def __init__(self, supabase, table="naver_blog_trends", on_conflict="date,keyword"):
+        self.supabase = supabase
+        self.table = table
+        self.on_conflict = on_conflict
+
+    def __call__(self, rows):
+        self.supabase.table(self.table).upsert(rows, on_conflict=self.on_conflict).execute()
+
+
+class ParquetSink:
+    """
+    Parquet 파일로 저장 (배치마다 part 파일 하나씩 생성, pyarrow 필요)
+
+    Parquet 은 이어쓰기가 되지 않으므로 directory 아래에 part-00001.parquet ... 로 나눠 저장합니다.
+    읽을 때는 pd.read_parquet(directory) 로 한 번에 불러올 수 있습니다.
+    """
+
+    def __init__(self, directory, columns=("date", "keyword", "total_count")):
+        self.directory = directory
+        self.columns = list(columns)
+        os.makedirs(directory, exist_ok=True)
+        self.part = len([f for f in os.listdir(directory) if f.endswith(".parquet")])
+
+    def __call__(self, rows):
+        self.part += 1
+        path = os.path.join(self.directory, f"part-{self.part:05d}.parquet")
+        pd.DataFrame(rows, columns=self.columns).to_parquet(path, index=False)
+
+
+def make_file_sink(path):
+    """확장자에 맞는 파일 sink 생성 (.parquet 또는 디렉토리 -> ParquetSink, 그 외 -> CsvSink)"""
+    if not path:
+        return None
+    if path.endswith(".parquet") or os.path.isdir(path):
+        return ParquetSink(path)
+    return CsvSink(path)
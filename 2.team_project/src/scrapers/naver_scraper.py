@@ -1,12 +1,23 @@
 import requests
 import os
+import sys
 import json
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from supabase import create_client, Client
 
+# lxml 이 있으면 본문 파싱에 사용 (html.parser 보다 수 배 빠름), 없으면 BeautifulSoup 으로 대체
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
 # .env 파일 로드
 current_dir = os.path.dirname(os.path.abspath(__file__))
 env_path = os.path.join(current_dir, "../../.env")
@@ -14,27 +25,141 @@ env_path = os.path.join(current_dir, "../../.env")
 if os.path.exists(env_path):
     load_dotenv(env_path)
 
+# 팀 공용 네이버 블로그 모듈 (요청 속도 제한 / 일괄 저장)
+sys.path.insert(0, os.path.join(current_dir, ".."))
+from naver_blog import BatchWriter
+from naver_blog.client import RateLimiter
+from naver_blog.page_cache import DEFAULT_TTL, PageCache, blog_post_key
+
+# 서울 자치구 / 주소 추출기 (분석기와 같은 규칙 사용)
+sys.path.insert(0, os.path.join(current_dir, "../analyzers"))
+from region_extractor import SEOUL_DISTRICTS, RegionExtractor
+
+BLOG_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+# 본문 영역: 스마트에디터 ONE(se-main-container) 우선, 구버전 에디터(postViewArea)
+CONTENT_XPATHS = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' se-main-container ')]",
+    "//div[@id='postViewArea']",
+)
+TEXT_XPATH = ".//text()[not(ancestor::script) and not(ancestor::style)]"
+# 본문 페이지 캐시 위치 (NAVER_PAGE_CACHE_DIR 로 변경 가능)
+DEFAULT_CACHE_DIR = os.getenv("NAVER_PAGE_CACHE_DIR") or os.path.join(current_dir, "../../.cache/blog_pages")
+
+
+def to_post_view_url(url):
+    """blog.naver.com/{blogId}/{logNo} -> 본문이 바로 들어있는 PostView.naver 주소 (iframe 우회)"""
+    if "blog.naver.com" in url and "/PostView.naver" not in url:
+        parts = url.split("/")
+        if len(parts) >= 5:
+            user_id, log_no = parts[3], parts[4]
+            return f"https://blog.naver.com/PostView.naver?blogId={user_id}&logNo={log_no}"
+    return url
+
+
+def parse_blog_content(html):
+    """블로그 HTML 에서 본문 영역 텍스트만 추출 (없으면 빈 문자열)"""
+    if not html:
+        return ""
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.document_fromstring(html)
+        except (ValueError, TypeError):
+            return ""
+        for xpath in CONTENT_XPATHS:
+            nodes = doc.xpath(xpath)
+            if nodes:
+                return " ".join(nodes[0].xpath(TEXT_XPATH)).strip()
+        return ""
+
+    soup = BeautifulSoup(html, "html.parser")
+    content_div = soup.find("div", class_="se-main-container") or soup.find("div", id="postViewArea")
+    return content_div.get_text(separator=" ").strip() if content_div else ""
+
+
+def has_blog_content(html):
+    """본문 영역(se-main-container / postViewArea)이 있는 페이지인지 (삭제 / 비공개 글 안내 페이지는 False)"""
+    if not html:
+        return False
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.document_fromstring(html)
+        except (ValueError, TypeError):
+            return False
+        return any(doc.xpath(xpath) for xpath in CONTENT_XPATHS)
+
+    soup = BeautifulSoup(html, "html.parser")
+    return bool(soup.find("div", class_="se-main-container") or soup.find("div", id="postViewArea"))
+
+
 class NaverBlogScraper:
-    def __init__(self, client_id=None, client_secret=None):
+    """
+    네이버 블로그 검색 + 본문 수집기
+
+    Args:
+        client_id, client_secret (str): 네이버 검색 API 키 (없으면 .env)
+        max_workers (int): 본문 동시 요청 수
+        requests_per_second (float): 블로그 본문 전체 초당 요청 수 상한
+        timeout (float): 요청 타임아웃 (초)
+        cache_dir (str): 본문 페이지 캐시 디렉토리 (None 이면 캐시 사용 안 함)
+        cache_ttl (float): 캐시를 재검증 없이 쓸 시간 (초)
+        offline (bool): True 면 본문을 내려받지 않고 캐시에 있는 글만 사용
+    """
+
+    def __init__(self, client_id=None, client_secret=None, max_workers=8, requests_per_second=10.0, timeout=10,
+                 cache_dir=DEFAULT_CACHE_DIR, cache_ttl=DEFAULT_TTL, offline=False):
         self.client_id = client_id or os.getenv("NAVER_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("NAVER_CLIENT_SECRET")
         self.gemini_key = os.getenv("GEMINI_API_KEY")
-        
+
         # Supabase 설정
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
-        
+
         self.base_url = "https://openapi.naver.com/v1/search/blog.json"
 
         if not self.client_id or not self.client_secret:
             raise ValueError("Naver API Credentials are missing in .env file.")
-        
+
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("Supabase Credentials are missing in .env file.")
 
         # Supabase 클라이언트 초기화
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
 
+        # 본문 동시 수집 설정 (스레드마다 Session 을 유지해 keep-alive 로 연결 재사용)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._local = threading.local()
+        self._executor = None
+        self.saved_count = 0
+        # 본문 영역이 없는 페이지(삭제 / 비공개 글)는 짧게만 캐시
+        self.page_cache = PageCache(cache_dir, ttl=cache_ttl, offline=offline,
+                                    validate=has_blog_content) if cache_dir else None
+
+    def _session(self):
+        """스레드마다 하나의 Session 을 만들어 재사용"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(BLOG_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return session
+
+    def _pool(self):
+        # 검색어마다 새로 만들면 스레드(와 Session)가 사라지므로 수집기 하나에 풀 하나만 유지
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
     def search_blog(self, query, display=100, start=1, sort='sim'):
         headers = {
             "X-Naver-Client-Id": self.client_id,
@@ -43,7 +168,7 @@ class NaverBlogScraper:
         # sort='sim'으로 변경하여 정확도순(유사도순) 수집
         params = {"query": query, "display": display, "start": start, "sort": sort}
         try:
-            response = requests.get(self.base_url, headers=headers, params=params)
+            response = self._session().get(self.base_url, headers=headers, params=params, timeout=self.timeout)
             return response.json() if response.status_code == 200 else None
         except Exception as e:
             print(f"API Request Error: {e}")
@@ -58,114 +183,146 @@ class NaverBlogScraper:
 
     def get_blog_content(self, url):
         try:
-            if "blog.naver.com" in url and "/PostView.naver" not in url:
-                parts = url.split("/")
-                if len(parts) >= 5:
-                    user_id, log_no = parts[3], parts[4]
-                    url = f"https://blog.naver.com/PostView.naver?blogId={user_id}&logNo={log_no}"
-
-            headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            res = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            content_div = soup.find("div", class_="se-main-container") or soup.find("div", id="postViewArea")
-            return content_div.get_text(separator=" ").strip() if content_div else ""
+            url = to_post_view_url(url)
+            if self.page_cache is not None:
+                return parse_blog_content(self.page_cache.fetch(
+                    self._session(), url, timeout=self.timeout, before_request=self.rate_limiter.wait))
+            self.rate_limiter.wait()
+            res = self._session().get(url, timeout=self.timeout)
+            return parse_blog_content(res.text)
         except Exception:
             return ""
 
-    def save_to_supabase(self, data):
+    def iter_cached_contents(self):
+        """캐시에 있는 모든 글의 (link, raw_content) - 네트워크 없이 주소 / 가격 재추출할 때 사용"""
+        if self.page_cache is None:
+            return
+        for entry in self.page_cache.iter_entries():
+            key = blog_post_key(entry["url"])
+            link = f"https://blog.naver.com/{key[0]}/{key[1]}" if key else entry["url"]
+            yield link, parse_blog_content(entry["html"])
+
+    def fetch_contents(self, urls):
+        """여러 블로그 본문을 동시에 가져와 요청 순서대로 반환 (실패한 글은 빈 문자열)"""
+        return list(self._pool().map(self.get_blog_content, urls))
+
+    def iter_posts(self, queries, display=20):
+        """
+        검색어별 검색 결과의 본문을 동시에 수집해 (query, item, raw_content) 를 검색어 순서대로 반환
+
+        한 검색어의 본문을 받는 동안 다음 검색어를 검색하고,
+        이미 다른 검색어에서 나온 글(link 기준)은 다시 받지 않습니다.
+        """
+        seen_links = set()
+        pending = deque()
+        for query in queries:
+            search_result = self.search_blog(query, display=display, start=1)
+            items = []
+            if search_result and 'items' in search_result:
+                for item in search_result.get("items", []):
+                    if item['link'] not in seen_links:
+                        seen_links.add(item['link'])
+                        items.append(item)
+            pending.append((query, items, [self._pool().submit(self.get_blog_content, item['link']) for item in items]))
+
+            if len(pending) > 1:
+                yield from self._drain(pending.popleft())
+        while pending:
+            yield from self._drain(pending.popleft())
+
+    @staticmethod
+    def _drain(entry):
+        query, items, futures = entry
+        for item, future in zip(items, futures):
+            yield query, item, future.result()
+
+    def save_batch(self, rows):
+        """
+        blog_review 에 일괄 upsert (link 중복은 건너뜀)
+
+        Returns:
+            int: 새로 저장된 행 수
+        """
+        if not rows:
+            return 0
         try:
-            # raw_content는 저장하지 않도록 변경
-            response = self.supabase.table("blog_review").upsert({
+            response = self.supabase.table("blog_review").upsert([{
                 "title": data['title'],
                 "link": data['link'],
                 "postdate": data['postdate'],
                 "address": data['address'],
+                "raw_content": data.get('raw_content'),
                 "clean_content": data['clean_content']
-            }).execute()
-            return response
+            } for data in rows], on_conflict="link", ignore_duplicates=True).execute()
+            inserted = len(response.data or [])
+            self.saved_count += inserted
+            return inserted
         except Exception as e:
-            # 중복 키 에러(23505) 또는 중복 문구 포함 시 무시
-            error_str = str(e).lower()
-            if '23505' in error_str or 'duplicate key' in error_str:
-                return None
-            print(f"Supabase Save Error: {e}")
-            return None
+            print(f"Supabase Save Error ({len(rows)} rows): {e}")
+            return 0
+
+    def save_to_supabase(self, data):
+        return self.save_batch([data]) > 0
 
 if __name__ == "__main__":
     scraper = NaverBlogScraper()
-    
+
     # 서울시 25개 자치구 리스트
-    seoul_districts = [
-        "강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구",
-        "노원구", "도봉구", "동대문구", "동작구", "마포구", "서대문구", "서초구", "성동구",
-        "성북구", "송파구", "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구"
-    ]
-    
+    seoul_districts = SEOUL_DISTRICTS
+
     # 검색 키워드 다양화 (중복 회피용)
     search_keywords = ["두바이 쫀득 쿠키 맛집", "두바이 초콜릿 쿠키", "두바이 쿠키 파는곳", "두바이 쫀득쿠키 후기"]
-    
-    total_collected = 0
+
     target_total = 300 # 1000개에서 300개로 하향 조정
-    
+
+    # 2. 주소 추출 + 타 지역 글 체크 (25개 구 정규식을 한 번만 컴파일)
+    extractor = RegionExtractor()
+    query_district = {
+        f"서울 {district} {keyword}": district
+        for keyword in search_keywords for district in seoul_districts
+    }
+
     print(f"🚀 Starting Diverse Small Scale Collection (Target: {target_total} Seoul items)...")
 
-    for keyword in search_keywords:
-        if total_collected >= target_total: break
-        
-        for district in seoul_districts:
-            if total_collected >= target_total: break
-            
-            query = f"서울 {district} {keyword}"
-            print(f"\n🔎 Searching: [{query}] (Unique Found: {total_collected})")
-            
-            # 300개 목표에 맞춰 지역별 수집 개수를 20개로 제한하여 골고루 수집
-            search_result = scraper.search_blog(query, display=20, start=1)
-            
-            if not search_result or 'items' not in search_result:
+    # 300개 목표에 맞춰 지역별 수집 개수를 20개로 제한하여 골고루 수집
+    with BatchWriter([scraper.save_batch], batch_size=50) as writer:
+        current_query = None
+        for query, item, raw_content in scraper.iter_posts(query_district, display=20):
+            if scraper.saved_count + len(writer.buffer) >= target_total:
+                break
+            if query != current_query:
+                current_query = query
+                print(f"\n🔎 Searching: [{query}] (Unique Found: {scraper.saved_count})")
+
+            if not raw_content: continue
+            district = query_district[query]
+
+            # 제목에서 HTML 태그 제거 (<b> 등)
+            clean_title = scraper.clean_text(item['title'])
+            clean_content = scraper.clean_text(raw_content)
+
+            # 본문 시작 부분에 타 지역이 있으면 스킵 (매우 엄격하게)
+            region = extractor.extract(clean_content, district)
+            if region["other_region"]:
+                continue
+            if not region["address"]:
+                # 상세 주소가 없더라도 서울 데이터임이 확실치 않으면 저장하지 않음 (선택)
+                # 여기서는 수집 효율을 위해 상세 주소가 없으면 스킵합니다.
                 continue
-                
-            items = search_result.get("items", [])
-            for idx, item in enumerate(items):
-                # 제목에서 HTML 태그 제거 (<b> 등)
-                clean_title = scraper.clean_text(item['title'])
-                
-                raw_content = scraper.get_blog_content(item['link'])
-                if not raw_content: continue
-                
-                clean_content = scraper.clean_text(raw_content)
-                
-                # 2. 주소 및 상호명 추출 시도
-                addr_pattern = rf"(서울특별시|서울시)\s+([가-힣]*{district}[가-힣]*)\s+([가-힣\d\s-]+(로|길|동|가|번지))"
-                match = re.search(addr_pattern, clean_content)
-                
-                # 타 지역 키워드 체크 (매우 엄격하게)
-                other_regions = ["제주", "부산", "대구", "인천", "광주", "대전", "울산", "수원", "성남", "고양", "용인", "천안", "청주"]
-                # 본문 시작 혹은 특정 키워드 주변에 타 지역이 있으면 스킵
-                if any(region in clean_content[:150] for region in other_regions) and district not in clean_content[:100]:
-                    continue
-
-                if match:
-                    address = match.group(0)
-                else:
-                    # 상세 주소가 없더라도 서울 데이터임이 확실치 않으면 저장하지 않음 (선택)
-                    # 여기서는 수집 효율을 위해 상세 주소가 없으면 스킵합니다.
-                    continue
-
-                db_data = {
-                    'title': clean_title, 
-                    'link': item['link'], 
-                    'postdate': item['postdate'],
-                    'address': address, 
-                    'clean_content': clean_content
-                }
-                
-                if scraper.save_to_supabase(db_data):
-                    total_collected += 1
-                    if total_collected % 10 == 0:
-                        print(f"✅ Unique Collected: {total_collected}...")
-                
-                if total_collected >= target_total:
-                    break
-
-    print(f"\n✨ Mission Accomplished! Total {total_collected} Seoul data synced to Supabase.")
+
+            before = scraper.saved_count
+            writer.write({
+                'title': clean_title,
+                'link': item['link'],
+                'postdate': item['postdate'],
+                'address': region["address"],
+                'raw_content': raw_content,
+                'clean_content': clean_content
+            })
+            if scraper.saved_count != before:
+                print(f"✅ Unique Collected: {scraper.saved_count}...")
+
+    scraper.close()
+    print(f"\n✨ Mission Accomplished! Total {scraper.saved_count} Seoul data synced to Supabase.")
+    if scraper.page_cache is not None:
+        print(f"[+] Page cache: {scraper.page_cache.stats}")
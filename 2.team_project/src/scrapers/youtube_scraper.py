@@ -1,5 +1,6 @@
 import os
 import re
+import json
 from datetime import datetime
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
@@ -8,6 +9,34 @@ from supabase import create_client, Client
 # .env 로드
 load_dotenv(os.path.join(os.path.dirname(__file__), '../../.env'))
 
+# 영상별 댓글 수집 진행 상황(다음 페이지 토큰) 저장 위치
+CHECKPOINT_PATH = os.getenv("YOUTUBE_CHECKPOINT_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../../.cache/youtube_comment_checkpoints.json")
+# commentThreads / comments API 한 페이지 최대 개수
+PAGE_SIZE = 100
+
+
+def _parse_time(value):
+    """API / DB 의 ISO 시각 문자열 -> timezone 있는 datetime"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _is_invalid_page_token(error):
+    """저장해 둔 pageToken 이 만료 / 무효라서 난 오류인지 (HttpError 400 또는 오류 내용에 pageToken)"""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    return status == 400 or "pagetoken" in str(error).lower()
+
+
+def _comment_row(comment_id, video_id, snippet):
+    return {
+        "comment_id": comment_id,
+        "video_id": video_id,
+        "author": snippet["authorDisplayName"],
+        "text": snippet["textDisplay"],
+        "published_at": snippet["publishedAt"],
+        "like_count": snippet["likeCount"]
+    }
+
 class YouTubeScraper:
     def __init__(self):
         self.api_key = os.getenv("YOUTUBE_API_KEY")
@@ -20,6 +49,7 @@ class YouTubeScraper:
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_KEY")
         self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+        self.checkpoint_path = CHECKPOINT_PATH
 
     def search_videos(self, query, published_after=None, published_before=None, max_results=10):
         """특정 기간의 비디오 검색"""
@@ -44,46 +74,204 @@ class YouTubeScraper:
             })
         return videos
 
-    def get_video_comments(self, video_id, max_results=100):
-        """비디오의 댓글 수집"""
-        comments = []
-        try:
-            request = self.youtube.commentThreads().list(
-                part="snippet",
+    def iter_comment_pages(self, video_id, page_token=None, include_replies=False, order="time", newer_than=None):
+        """
+        영상의 댓글 스레드를 nextPageToken 을 따라 한 페이지씩 반환
+
+        Args:
+            page_token (str): 이어서 받을 페이지 토큰 (없으면 첫 페이지부터)
+            include_replies (bool): 답글도 함께 수집 (스레드에 딸린 5개를 넘으면 comments.list 로 전부)
+            order (str): "time"(최신순) / "relevance"
+            newer_than (datetime): 최신순 수집 시 이 시각 이하의 스레드가 나오면 거기서 중단
+
+        Yields:
+            tuple: (해당 페이지 댓글 행 리스트, 다음 페이지 토큰 또는 마지막이면 None)
+        """
+        while True:
+            response = self.youtube.commentThreads().list(
+                part="snippet,replies" if include_replies else "snippet",
                 videoId=video_id,
-                maxResults=max_results,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token,
+                order=order,
                 textFormat="plainText"
-            )
-            response = request.execute()
+            ).execute()
 
+            rows = []
+            page_token = response.get("nextPageToken")
             for item in response.get("items", []):
-                snippet = item["snippet"]["topLevelComment"]["snippet"]
-                comments.append({
-                    "comment_id": item["id"],
-                    "video_id": video_id,
-                    "author": snippet["authorDisplayName"],
-                    "text": snippet["textDisplay"],
-                    "published_at": snippet["publishedAt"],
-                    "like_count": snippet["likeCount"]
-                })
+                top = item["snippet"]["topLevelComment"]["snippet"]
+                if newer_than and _parse_time(top["publishedAt"]) <= newer_than:
+                    # 최신순이므로 이후 스레드는 모두 이미 저장된 것
+                    page_token = None
+                    break
+                rows.append(_comment_row(item["id"], video_id, top))
+                if include_replies and item["snippet"].get("totalReplyCount", 0):
+                    replies = item.get("replies", {}).get("comments", [])
+                    if len(replies) < item["snippet"]["totalReplyCount"]:
+                        rows.extend(self.get_replies(item["id"], video_id))
+                    else:
+                        rows.extend(_comment_row(r["id"], video_id, r["snippet"]) for r in replies)
+
+            yield rows, page_token
+            if not page_token:
+                return
+
+    def get_replies(self, parent_id, video_id):
+        """댓글 하나의 답글 전체 (comments.list 페이지 순회)"""
+        replies, page_token = [], None
+        while True:
+            response = self.youtube.comments().list(
+                part="snippet",
+                parentId=parent_id,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token,
+                textFormat="plainText"
+            ).execute()
+            replies.extend(_comment_row(r["id"], video_id, r["snippet"]) for r in response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return replies
+
+    def get_video_comments(self, video_id, max_results=100):
+        """비디오의 댓글 수집 (max_results 개까지 페이지를 넘겨가며, None 이면 전체)"""
+        comments = []
+        try:
+            for rows, _ in self.iter_comment_pages(video_id, order="relevance"):
+                comments.extend(rows)
+                if max_results is not None and len(comments) >= max_results:
+                    return comments[:max_results]
         except Exception as e:
             print(f"⚠️ Error fetching comments for {video_id}: {e}")
-            
+
         return comments
 
-    def save_comments_to_supabase(self, comments):
-        """수집된 댓글을 Supabase에 저장 (또는 분석용 데이터셋 구성)"""
-        if not comments:
-            return
-        
-        # 테이블 이름은 프로젝트 상황에 맞게 조정 (예: youtube_comments)
-        # 여기서는 일단 분석 결과를 위해 리턴하거나 특정 테이블에 upsert
+    def load_checkpoints(self):
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_checkpoint(self, video_id, page_token, newer_than=None, done=False):
+        """
+        영상별 수집 진행 상황 저장 (done=True 면 수집 완료로 보고 삭제)
+
+        항목이 남아 있는 영상은 '수집 중' 으로 보고 다음 실행에서 page_token 부터
+        (None 이면 첫 페이지부터) 같은 기준 시각(newer_than)으로 이어서 받습니다.
+        """
+        checkpoints = self.load_checkpoints()
+        if done:
+            checkpoints.pop(video_id, None)
+        else:
+            checkpoints[video_id] = {
+                "page_token": page_token,
+                "newer_than": newer_than.isoformat() if newer_than else None,
+                "updated_at": datetime.now().isoformat()
+            }
+        os.makedirs(os.path.dirname(self.checkpoint_path), exist_ok=True)
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoints, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def get_last_seen_at(self, video_id):
+        """DB 에 저장된 해당 영상의 가장 최근 댓글(답글 제외) 작성 시각 (없으면 None)"""
+        # 답글 id 는 "부모댓글id.답글id" 형식
+        rows = self.supabase.table("youtube_comments")\
+            .select("published_at")\
+            .eq("video_id", video_id)\
+            .not_.like("comment_id", "%.%")\
+            .order("published_at", desc=True)\
+            .limit(1)\
+            .execute().data
+        return rows[0]["published_at"] if rows else None
+
+    def harvest_video_comments(self, video_id, include_replies=False, incremental=False, chunk_size=500):
+        """
+        영상의 댓글 전체를 페이지 단위로 받아 chunk_size 개씩 저장 (메모리에는 최대 chunk_size + 한 페이지)
+
+        저장이 끝난 지점의 다음 페이지 토큰을 영상별로 기록해 두므로,
+        할당량 초과 등으로 중간에 멈추면 다음 실행에서 그 페이지부터 이어서 받습니다.
+
+        Args:
+            include_replies (bool): 답글도 함께 수집
+            incremental (bool): 최신순으로 받다가 이미 저장된 가장 최근 댓글 시각에 닿으면 중단
+                                (이어받을 체크포인트가 있으면 그쪽이 우선, 기존 스레드의 새 답글은 수집하지 않음)
+            chunk_size (int): 몇 개씩 모아서 저장할지
+
+        Returns:
+            int: 저장한 댓글 수
+        """
+        checkpoint = self.load_checkpoints().get(video_id)
+        if checkpoint is not None:
+            # 끝나지 않은 이전 수집을 그때의 기준 시각으로 이어받음
+            # (첫 전체 수집이 끝나기 전에는 기준 시각이 없으므로 incremental 이어도 끝까지 받음)
+            page_token = checkpoint.get("page_token")
+            newer_than = _parse_time(checkpoint["newer_than"]) if checkpoint.get("newer_than") else None
+            print(f"  ↪️ Resuming {video_id} from saved checkpoint")
+        else:
+            page_token, newer_than = None, None
+            if incremental:
+                last_seen_at = self.get_last_seen_at(video_id)
+                newer_than = _parse_time(last_seen_at) if last_seen_at else None
+            # 첫 저장 전에 멈춰도 다음 실행이 '수집 중' 으로 보고 같은 기준으로 처음부터 받도록 먼저 기록
+            self.save_checkpoint(video_id, None, newer_than)
+
+        buffer, saved = [], 0
+        pending_token = page_token  # 버퍼에 들어온 마지막 페이지의 다음 페이지 토큰
         try:
-            # 중복 방지를 위한 upsert (comment_id 기준)
-            data = self.supabase.table("youtube_comments").upsert(comments).execute()
-            print(f"✅ Saved {len(comments)} comments to Supabase.")
+            for rows, next_token in self.iter_comment_pages(video_id, page_token, include_replies,
+                                                            newer_than=newer_than):
+                buffer.extend(rows)
+                pending_token = next_token
+                if len(buffer) < chunk_size and next_token:
+                    continue
+                stored = self.save_comments_to_supabase(buffer, chunk_size)
+                saved += stored
+                if stored < len(buffer):
+                    print(f"⚠️ {video_id} 저장 실패, 다음 실행에서 마지막 체크포인트부터 다시 수집")
+                    return saved
+                buffer = []
+                # 저장까지 끝난 뒤에만 진행 상황 기록 (저장 전에 멈추면 그 페이지부터 다시)
+                if next_token:
+                    self.save_checkpoint(video_id, next_token, newer_than)
+            self.save_checkpoint(video_id, None, done=True)
         except Exception as e:
-            print(f"❌ Supabase Save Error: {e}")
+            if page_token and not saved and not buffer and _is_invalid_page_token(e):
+                # 만료된 토큰은 매번 같은 오류가 나므로 버리고 같은 기준 시각으로 첫 페이지부터 다시
+                print(f"⚠️ Saved page token for {video_id} is no longer valid, restarting from the first page")
+                self.save_checkpoint(video_id, None, newer_than)
+                return self.harvest_video_comments(video_id, include_replies, incremental, chunk_size)
+            print(f"⚠️ Error fetching comments for {video_id}: {e} (다음 실행에서 이어서 수집)")
+            if buffer:
+                stored = self.save_comments_to_supabase(buffer, chunk_size)
+                saved += stored
+                # 버퍼의 페이지를 모두 저장했으면 그다음 페이지부터 이어받도록 기록
+                if stored == len(buffer) and pending_token:
+                    self.save_checkpoint(video_id, pending_token, newer_than)
+        return saved
+
+    def save_comments_to_supabase(self, comments, chunk_size=500):
+        """수집된 댓글을 chunk_size 개씩 나눠 Supabase에 저장 (comment_id 기준 upsert)
+
+        Returns:
+            int: 저장한 댓글 수
+        """
+        if not comments:
+            return 0
+
+        saved = 0
+        for i in range(0, len(comments), chunk_size):
+            chunk = comments[i:i + chunk_size]
+            try:
+                # 중복 방지를 위한 upsert (comment_id 기준)
+                self.supabase.table("youtube_comments").upsert(chunk, on_conflict="comment_id").execute()
+                saved += len(chunk)
+            except Exception as e:
+                print(f"❌ Supabase Save Error ({len(chunk)} comments): {e}")
+        print(f"✅ Saved {saved} comments to Supabase.")
+        return saved
 
 if __name__ == "__main__":
     scraper = YouTubeScraper()
@@ -102,6 +290,6 @@ if __name__ == "__main__":
         
         for v in videos:
             print(f"  🔍 Video: {v['title']} ({v['published_at']})")
-            comments = scraper.get_video_comments(v["video_id"], max_results=50)
-            # scraper.save_comments_to_supabase(comments) # 테이블 생성 후 주석 해제
-            print(f"     -> Collected {len(comments)} comments")
+            # 전체 댓글 + 답글을 이어받기 가능하게 수집 (이미 저장된 영상은 새 댓글만)
+            saved = scraper.harvest_video_comments(v["video_id"], include_replies=True, incremental=True)
+            print(f"     -> Collected {saved} comments")
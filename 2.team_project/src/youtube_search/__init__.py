@@ -0,0 +1 @@
+from .time_slicer import SEARCH_RESULT_CAP, AdaptiveTimeSlicer, parse_published_at, to_rfc3339
@@ -10,8 +10,10 @@ from pathlib import Path
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+sys.path.insert(0, str(PROJECT_ROOT.parent / 'src'))  # 팀 공용 모듈 (2.team_project/src)
 
 from database import SupabaseManager  # 직접 만든 데이터베이스 관리 도구
+from youtube_search import AdaptiveTimeSlicer  # 500개 검색 상한을 피하기 위한 구간 분할 도구 (팀 공용)
 
 # 1. 환경 설정 및 초기화 - config/.env 파일
 config_path = PROJECT_ROOT / 'config' / '.env'
@@ -36,91 +38,83 @@ class YouTubeTrendCrawler:
     def get_metrics_for_period(self, keyword, start_date, end_date):
         """특정 시작일~종료일 사이의 영상 정보를 수집하는 함수"""
         
-        # 유튜브 API가 요구하는 시간 형식(2024-01-01T00:00:00Z)으로 변환
-        start_time = start_date.strftime('%Y-%m-%dT00:00:00Z')
-        end_time = end_date.strftime('%Y-%m-%dT23:59:59Z')
+        # 시작일 00:00:00 ~ 종료일 23:59:59 (UTC) 범위로 맞춥니다.
+        start_time = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_time = end_date.replace(hour=23, minute=59, second=59, microsecond=0)
         
         video_list = []  # 수집한 데이터를 담을 바구니
-        next_page_token = None  # 다음 페이지가 있는지 확인하는 딱지
 
-        while True:
+        def search_page(start_str, end_str, page_token):
+            # [A] 검색 API 호출: 키워드에 맞는 영상 목록을 검색합니다.
+            return self.youtube.search().list(
+                q=keyword,
+                part="id,snippet",
+                publishedAfter=start_str,
+                publishedBefore=end_str,
+                maxResults=50,  # 한 번에 최대 50개씩
+                type="video",
+                order="date",  # 최신순 정렬
+                regionCode="KR",  # 한국 지역
+                relevanceLanguage="ko",  # 한국어 결과 우선
+                pageToken=page_token
+            ).execute()
+
+        # 영상이 몰린 기간은 잘게, 한산한 기간은 크게 나눠서 검색합니다 (500개 제한으로 인한 누락 방지!)
+        # 중간에 오류가 나도 그때까지 검색된 영상은 버리지 않고 상세 정보를 받습니다.
+        slicer = AdaptiveTimeSlicer(search_page)
+        items = slicer.collect(start_time, end_time, keep_partial=True)
+        print(f"  -> 검색 구간 {len(slicer.windows)}개로 나눠 검색했습니다. (검색 API {slicer.search_calls}회)")
+        if slicer.error is not None:
+            # 구글 API 사용 한도(할당량)를 다 썼을 때의 처리
+            if "quotaExceeded" in str(slicer.error):
+                print("\n[알림] 오늘 쓸 수 있는 유튜브 API 할당량을 모두 사용했습니다.")
+            else:
+                print(f"\n[오류] 기간 수집 중 문제가 생겼습니다: {slicer.error}")
+            print(f"  -> 그때까지 검색된 {len(items)}개 영상만 이어서 처리합니다.")
+
+        # 검색된 영상들의 ID만 쏙쏙 뽑아냅니다.
+        video_ids = [item["id"]["videoId"] for item in items]
+
+        # 50개씩 묶어서 상세 정보를 요청합니다.
+        for i in range(0, len(video_ids), 50):
             try:
-                # [A] 검색 API 호출: 키워드에 맞는 영상 목록을 검색합니다.
-                search_response = self.youtube.search().list(
-                    q=keyword,
-                    part="id,snippet",
-                    publishedAfter=start_time,
-                    publishedBefore=end_time,
-                    maxResults=50,  # 한 번에 최대 50개씩
-                    type="video",
-                    order="date",  # 최신순 정렬
-                    regionCode="KR",  # 한국 지역
-                    relevanceLanguage="ko",  # 한국어 결과 우선
-                    pageToken=next_page_token
-                ).execute()
-
-                items = search_response.get("items", [])
-                if not items:
-                    break
-
-                # 검색된 영상들의 ID만 쏙쏙 뽑아냅니다.
-                current_batch_ids = [item["id"]["videoId"] for item in items]
-                
                 # [B] 상세 정보 API 호출: 검색 결과에는 조회수 등이 없어서 다시 물어봐야 합니다.
                 stats_response = self.youtube.videos().list(
                     part="statistics,snippet",
-                    id=",".join(current_batch_ids)  # ID들을 쉼표로 연결해서 한꺼번에 요청
+                    id=",".join(video_ids[i:i+50])  # ID들을 쉼표로 연결해서 한꺼번에 요청
                 ).execute()
-
-                # 상세 정보(조회수, 좋아요, 댓글)를 하나씩 꺼내서 보관합니다.
-                for item in stats_response.get("items", []):
-                    stats = item["statistics"]
-                    pub_date = item["snippet"]["publishedAt"][:10]  # 날짜만 추출 (YYYY-MM-DD)
-                    video_list.append({
-                        "date": pub_date,
-                        "view_count": int(stats.get("viewCount", 0)),
-                        "like_count": int(stats.get("likeCount", 0)),
-                        "comment_count": int(stats.get("commentCount", 0))
-                    })
-
-                # 다음 페이지가 있는지 확인하고, 있으면 계속 돌립니다.
-                next_page_token = search_response.get("nextPageToken")
-                if not next_page_token:
-                    break
             except Exception as e:
-                # 구글 API 사용 한도(할당량)를 다 썼을 때의 처리
                 if "quotaExceeded" in str(e):
                     print("\n[알림] 오늘 쓸 수 있는 유튜브 API 할당량을 모두 사용했습니다.")
                     return video_list
                 print(f"\n[오류] 기간 수집 중 문제가 생겼습니다: {e}")
-                break
+                continue
+
+            # 상세 정보(조회수, 좋아요, 댓글)를 하나씩 꺼내서 보관합니다.
+            for item in stats_response.get("items", []):
+                stats = item["statistics"]
+                pub_date = item["snippet"]["publishedAt"][:10]  # 날짜만 추출 (YYYY-MM-DD)
+                video_list.append({
+                    "date": pub_date,
+                    "view_count": int(stats.get("viewCount", 0)),
+                    "like_count": int(stats.get("likeCount", 0)),
+                    "comment_count": int(stats.get("commentCount", 0))
+                })
 
         return video_list
 
     def get_historical_data(self, keyword, total_days=365):
         """긴 기간(365일)을 안전하게(나눠서) 수집하고 통계를 내는 함수"""
         
-        # 어제 날짜와 180일 전 날짜 계산
+        # 어제 날짜와 365일 전 날짜 계산
         end_date = datetime.now(timezone.utc) - timedelta(days=1)
         start_date = end_date - timedelta(days=total_days)
         
         print(f"[*] 전체 분석 시작: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}")
         
-        all_videos = []
-        current_end = end_date
-        
-        # 전체 기간을 30일씩 작게 쪼개서 수집합니다 (데이터 누락 방지!)
-        while current_end > start_date:
-            current_start = max(start_date, current_end - timedelta(days=30))
-            print(f"[*] 수집 중: {current_start.strftime('%Y-%m-%d')} ~ {current_end.strftime('%Y-%m-%d')}...")
-            
-            period_data = self.get_metrics_for_period(keyword, current_start, current_end)
-            all_videos.extend(period_data)
-            
-            print(f"  -> 현재까지 총 {len(all_videos)}개의 영상을 찾았습니다.")
-            
-            # 다음 구간(이전 30일)으로 이동
-            current_end = current_start - timedelta(days=1)
+        # 고정 30일 단위 대신, 영상 밀도에 맞춰 구간을 자동으로 나눠서 수집합니다.
+        all_videos = self.get_metrics_for_period(keyword, start_date, end_date)
+        print(f"  -> 총 {len(all_videos)}개의 영상을 찾았습니다.")
             
         if not all_videos:
             return None
@@ -2,6 +2,7 @@ from airflow.models import Variable  # Airflow 저장 변수 가져오는 도구
 from googleapiclient.discovery import build  # 구글 서비스(유튜브) 사용 도구
 import pandas as pd  # 데이터 표 형태 처리 도구
 from datetime import datetime, timedelta, timezone  # 날짜와 시간 계산 도구
+from qoxjf135_time_slicer import AdaptiveTimeSlicer  # 500개 검색 상한 회피용 구간 분할 도구
 ##
 class YouTubeTrendCrawler:
    
@@ -18,64 +19,68 @@ class YouTubeTrendCrawler:
     def get_metrics_for_period(self, keyword, start_date, end_date):
         """특정 날짜 범위(시작일~종료일) 동안의 영상 정보(조회수 등)를 가져오는 함수"""
         
-        # 유튜브 API 시간 형식(예: 2024-01-01T00:00:00Z)으로 날짜 변경
-        start_time = start_date.strftime('%Y-%m-%dT00:00:00Z')
-        end_time = end_date.strftime('%Y-%m-%dT23:59:59Z')
+        # 시작일 00:00:00 ~ 종료일 23:59:59 (UTC) 범위로 맞춤
+        start_time = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_time = end_date.replace(hour=23, minute=59, second=59, microsecond=0)
         
         video_list = []  # 수집 데이터 담는 바구니
-        next_page_token = None  # 검색 결과 많을 때 다음 페이지 가리키는 포인터
 
-        while True:
-            try:
-                # [A] 검색 API 호출: 키워드 부합 영상 목록 찾음
-                search_response = self.youtube.search().list(
-                    q=keyword,
-                    part="id,snippet",
-                    publishedAfter=start_time,
-                    publishedBefore=end_time,
-                    maxResults=50,  # 테스트용 조회 개수 1개 제한 (기존 50)
-                    type="video",
-                    order="date",  # 최신순
-                    regionCode="KR",  # 한국 지역
-                    relevanceLanguage="ko",  # 한국어 우선
-                    pageToken=next_page_token
-                ).execute()
+        def search_page(start_str, end_str, page_token):
+            # [A] 검색 API 호출: 키워드 부합 영상 목록 찾음
+            return self.youtube.search().list(
+                q=keyword,
+                part="id,snippet",
+                publishedAfter=start_str,
+                publishedBefore=end_str,
+                maxResults=50,
+                type="video",
+                order="date",  # 최신순
+                regionCode="KR",  # 한국 지역
+                relevanceLanguage="ko",  # 한국어 우선
+                pageToken=page_token
+            ).execute()
+
+        # 영상 밀도 따라 구간 자동 분할 (몰린 기간은 잘게, 한산한 기간은 크게 → 500개 제한 누락 방지)
+        # 중간 오류 시에도 그때까지 검색된 영상은 상세 정보 단계로 넘김
+        slicer = AdaptiveTimeSlicer(search_page)
+        items = slicer.collect(start_time, end_time, keep_partial=True)
+        print(f"[*] 검색 구간 {len(slicer.windows)}개, 검색 API {slicer.search_calls}회 호출")
+        if slicer.error is not None:
+            # API 사용 한도(할당량) 초과 시 처리
+            if "quotaExceeded" in str(slicer.error):
+                print("[알림] 금일 유튜브 API 할당량 소진됨")
+            else:
+                print(f"[오류] 데이터 수집 중 문제 발생: {slicer.error}")
+            print(f"[*] 중단 전까지 검색된 영상 {len(items)}개만 이어서 처리")
 
-                items = search_response.get("items", [])
-                if not items:
-                    break
+        # 검색 영상 고유 ID만 추출
+        video_ids = [item["id"]["videoId"] for item in items]
 
-                # 검색 영상 고유 ID만 추출
-                current_batch_ids = [item["id"]["videoId"] for item in items]
-                
+        # 50개씩 묶어 상세 정보 요청
+        for i in range(0, len(video_ids), 50):
+            try:
                 # [B] 상세 정보 API 호출: 검색 결과에 조회수 없어서 별도 요청
                 stats_response = self.youtube.videos().list(
                     part="statistics,snippet",
-                    id=",".join(current_batch_ids)  # 여러 ID 쉼표 연결해 일괄 요청
+                    id=",".join(video_ids[i:i+50])  # 여러 ID 쉼표 연결해 일괄 요청
                 ).execute()
-                
-                # 조회수, 좋아요, 댓글 수 차례로 바구니에 담음
-                for item in stats_response.get("items", []):
-                    stats = item["statistics"]
-                    pub_date = item["snippet"]["publishedAt"][:10]  # 날짜 추출 (YYYY-MM-DD)
-                    video_list.append({
-                        "date": pub_date,
-                        "view_count": int(stats.get("viewCount", 0)),
-                        "like_count": int(stats.get("likeCount", 0)),
-                        "comment_count": int(stats.get("commentCount", 0))
-                    })
-
-                # 다음 페이지 존재 여부 확인 후 진행
-                next_page_token = search_response.get("nextPageToken")
-                if not next_page_token:
-                    break
             except Exception as e:
-                # API 사용 한도(할당량) 초과 시 처리
                 if "quotaExceeded" in str(e):
                     print("[알림] 금일 유튜브 API 할당량 소진됨")
                     return video_list
                 print(f"[오류] 데이터 수집 중 문제 발생: {e}")
-                break
+                continue
+            
+            # 조회수, 좋아요, 댓글 수 차례로 바구니에 담음
+            for item in stats_response.get("items", []):
+                stats = item["statistics"]
+                pub_date = item["snippet"]["publishedAt"][:10]  # 날짜 추출 (YYYY-MM-DD)
+                video_list.append({
+                    "date": pub_date,
+                    "view_count": int(stats.get("viewCount", 0)),
+                    "like_count": int(stats.get("likeCount", 0)),
+                    "comment_count": int(stats.get("commentCount", 0))
+                })
 
         return video_list
 
@@ -94,18 +99,8 @@ class YouTubeTrendCrawler:
         
         print(f"[*] 분석 시작 범위: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')} (전체 통계 갱신함)")
         
-        all_videos = []
-        current_end = end_date
-        
-        # 유튜브 검색 제한 회피 위해 30일 단위 수집
-        while current_end >= start_date:
-            current_start = max(start_date, current_end - timedelta(days=30))
-            print(f"[*] 기간 수집 중: {current_start.strftime('%Y-%m-%d')} ~ {current_end.strftime('%Y-%m-%d')}...")
-            
-            period_data = self.get_metrics_for_period(keyword, current_start, current_end)
-            all_videos.extend(period_data)
-            
-            current_end = current_start - timedelta(days=1)
+        # 고정 30일 단위 대신 영상 밀도 맞춰 구간 자동 분할 수집 (검색 상한 누락 방지)
+        all_videos = self.get_metrics_for_period(keyword, start_date, end_date)
             
         if not all_videos:
             return None